@@ -0,0 +1,188 @@
+"""Benchmark cases shared by the pytest-benchmark suite and the standalone runner."""
+
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass
+from typing import Any, Callable, Optional, TypeVar
+from unittest.mock import Mock
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Query, Session
+
+from py_authorization import (
+    Authorization,
+    Context,
+    Policy,
+    PolicyStrategy,
+    Strategy,
+    StrategyMapper,
+    User,
+)
+from tests.models import Base, Deal
+
+T = TypeVar("T", bound=object)
+
+ROLES = ["admin", "editor", "viewer", "guest"]
+ACTIONS = ["read", "create", "update", "delete"]
+
+
+class Row:
+    __slots__ = ("id", "owner_id", "status")
+    __authorization_resource__ = "Deal"
+
+    def __init__(self, id: int, owner_id: int, status: str) -> None:
+        self.id = id
+        self.owner_id = owner_id
+        self.status = status
+
+
+class OwnerStrategy(PolicyStrategy):
+    def apply_policies_to_entity(self, entity: T, context: Context) -> Optional[T]:
+        return entity if entity.owner_id == context.user.id else None  # type: ignore[attr-defined]
+
+    def apply_policies_to_query(self, query: Query, context: Context) -> Query:
+        return query.filter(Deal.owner_id == context.user.id)
+
+
+class PublishedStrategy(PolicyStrategy):
+    def apply_policies_to_entity(self, entity: T, context: Context) -> Optional[T]:
+        return entity if entity.status == "published" else None  # type: ignore[attr-defined]
+
+    def apply_policies_to_query(self, query: Query, context: Context) -> Query:
+        return query.filter(Deal.status == "published")
+
+
+class NotArchivedStrategy(PolicyStrategy):
+    def apply_policies_to_entity(self, entity: T, context: Context) -> Optional[T]:
+        return entity if entity.status != "archived" else None  # type: ignore[attr-defined]
+
+    def apply_policies_to_query(self, query: Query, context: Context) -> Query:
+        return query.filter(Deal.status != "archived")
+
+
+STRATEGY_MAPPER: StrategyMapper = {
+    "Owner": OwnerStrategy,
+    "Published": PublishedStrategy,
+    "NotArchived": NotArchivedStrategy,
+}
+
+
+@dataclass
+class BenchmarkCase:
+    name: str
+    params: dict[str, Any]
+    setup: Callable[[], Callable[[], Any]]
+    rounds: int = 20
+
+    @property
+    def id(self) -> str:
+        return "-".join([self.name, *(f"{k}={v}" for k, v in self.params.items())])
+
+
+def make_policies(count: int, seed: int = 0) -> list[Policy]:
+    """``count`` policies over ``count`` resources, some with wildcard roles and actions, ending in a catch-all."""
+    rng = random.Random(seed)
+    policies = [
+        Policy(
+            name=f"Policy {i}",
+            resources=[f"Resource{i}"],
+            roles=["*"] if rng.random() < 0.1 else rng.sample(ROLES, 2),
+            actions=["*"] if rng.random() < 0.1 else rng.sample(ACTIONS, 2),
+            last_rule=rng.random() < 0.05,
+        )
+        for i in range(count - 1)
+    ]
+    policies.append(Policy(name="Deal readers", resources=["Deal"], roles=ROLES, actions=["read"]))
+    return policies
+
+
+def make_authorization(policies: list[Policy]) -> Authorization:
+    return Authorization(policies=policies, strategy_mapper_callable=Mock(return_value=STRATEGY_MAPPER))
+
+
+def make_rows(count: int, seed: int = 0) -> list[Row]:
+    rng = random.Random(seed)
+    statuses = ["draft", "published", "archived"]
+    return [Row(id=i, owner_id=rng.randint(1, 10), status=rng.choice(statuses)) for i in range(count)]
+
+
+def _deal_policy(mode: str) -> Policy:
+    if mode == "and":
+        return Policy(
+            name="Deals AND",
+            resources=["Deal"],
+            roles=["viewer"],
+            actions=["read"],
+            strategies=[Strategy("NotArchived"), Strategy("Owner")],
+        )
+    return Policy(
+        name="Deals OR",
+        resources=["Deal"],
+        roles=["viewer"],
+        actions=["read"],
+        strategies=[Strategy("NotArchived")],
+        or_strategies=[Strategy("Owner"), Strategy("Published")],
+    )
+
+
+def policy_lookup_case(policy_count: int, memoized: bool) -> BenchmarkCase:
+    def setup() -> Callable[[], Any]:
+        auth = make_authorization(make_policies(policy_count))
+        users = [User(role=role, id=1) for role in ROLES]
+        lookups = [(user, f"Resource{i}", action) for i in range(policy_count) for user in users for action in ACTIONS]
+        lookups = random.Random(1).sample(lookups, min(len(lookups), 1000))
+
+        def run() -> None:
+            if not memoized:
+                auth.policy_set.index.clear()
+            for user, resource, action in lookups:
+                auth._get_policy(user=user, resource_to_access=resource, action=action, sub_action=None)
+
+        return run
+
+    params = {"policies": policy_count, "memoized": memoized}
+    return BenchmarkCase(name="policy_lookup", params=params, setup=setup)
+
+
+def apply_to_many_case(entity_count: int, mode: str) -> BenchmarkCase:
+    def setup() -> Callable[[], Any]:
+        auth = make_authorization([_deal_policy(mode)])
+        rows = make_rows(entity_count)
+        user = User(role="viewer", id=1)
+
+        def run() -> list[Row]:
+            return auth.apply_policies_to_many(user=user, entities=rows, action="read")
+
+        return run
+
+    rounds = 5 if entity_count >= 100_000 else 20
+    return BenchmarkCase(
+        name="apply_to_many", params={"entities": entity_count, "mode": mode}, setup=setup, rounds=rounds
+    )
+
+
+def apply_to_query_case(mode: str) -> BenchmarkCase:
+    def setup() -> Callable[[], Any]:
+        engine = create_engine("sqlite://")
+        Base.metadata.create_all(engine)
+        session = Session(engine)
+        auth = make_authorization([_deal_policy(mode)])
+        user = User(role="viewer", id=1)
+
+        def run() -> str:
+            query = auth.apply_policies_to_query(user=user, query=session.query(Deal), action="read")
+            return str(query.statement.compile(engine))
+
+        return run
+
+    return BenchmarkCase(name="apply_to_query_compile", params={"mode": mode}, setup=setup, rounds=200)
+
+
+def all_cases(quick: bool = False) -> list[BenchmarkCase]:
+    entity_counts = [1_000, 10_000] if quick else [1_000, 10_000, 100_000]
+    return [
+        *(policy_lookup_case(count, memoized) for count in [10, 100, 1000] for memoized in [False, True]),
+        *(apply_to_many_case(count, mode) for count in entity_counts for mode in ["and", "or"]),
+        *(apply_to_query_case(mode) for mode in ["and", "or"]),
+    ]
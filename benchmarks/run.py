@@ -0,0 +1,74 @@
+"""Standalone benchmark runner that doesn't need pytest-benchmark.
+
+    python benchmarks/run.py --json results.json [--quick] [--filter policy_lookup]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+from typing import Any, Optional
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../")))
+
+import sqlalchemy  # noqa: E402
+from cases import BenchmarkCase, all_cases  # noqa: E402
+
+import py_authorization  # noqa: E402
+
+
+def run_case(case: BenchmarkCase) -> dict[str, Any]:
+    target = case.setup()
+    target()  # warmup
+    timings = []
+    for _ in range(case.rounds):
+        start = time.perf_counter()
+        target()
+        timings.append(time.perf_counter() - start)
+    return {
+        "name": case.name,
+        "id": case.id,
+        "params": case.params,
+        "rounds": case.rounds,
+        "min": min(timings),
+        "median": statistics.median(timings),
+        "mean": statistics.mean(timings),
+        "stddev": statistics.stdev(timings) if len(timings) > 1 else 0.0,
+    }
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--json", help="write machine-readable results to this file ('-' for stdout)")
+    parser.add_argument("--quick", action="store_true", help="skip the largest entity counts")
+    parser.add_argument("--filter", default="", help="only run cases whose id contains this string")
+    options = parser.parse_args(argv)
+
+    results = []
+    for case in all_cases(quick=options.quick):
+        if options.filter not in case.id:
+            continue
+        result = run_case(case)
+        results.append(result)
+        print(f"{case.id:<45} min {result['min'] * 1000:10.3f} ms  median {result['median'] * 1000:10.3f} ms")
+
+    report = {
+        "machine_info": {"python": platform.python_version(), "platform": platform.platform()},
+        "versions": {"py_authorization": py_authorization.__version__, "sqlalchemy": sqlalchemy.__version__},
+        "benchmarks": results,
+    }
+    if options.json == "-":
+        json.dump(report, sys.stdout, indent=2)
+    elif options.json:
+        with open(options.json, "w") as output:
+            json.dump(report, output, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,17 @@
+"""pytest-benchmark entry point: ``pytest benchmarks/ --benchmark-json=results.json``."""
+
+from typing import Any
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from cases import BenchmarkCase, all_cases  # noqa: E402
+
+CASES = all_cases()
+
+
+@pytest.mark.parametrize("case", CASES, ids=[case.id for case in CASES])
+def test_benchmark(benchmark: Any, case: BenchmarkCase) -> None:
+    benchmark.extra_info.update(case.params)
+    benchmark.pedantic(case.setup(), rounds=case.rounds, warmup_rounds=1)
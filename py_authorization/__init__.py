@@ -2,21 +2,61 @@
 
 __version__ = "2.0.0"
 
+from .analysis import PolicyFinding, analyze_policies, prune_policies
+from .async_authorization import AsyncAuthorization
+from .async_policy_strategy import AsyncPolicyStrategy
 from .authorization import Authorization, CheckResponse
 from .context import Context
+from .decision import AsyncDecision, Decision
+from .decision_cache import DecisionCache, DecisionCacheBackend, SQLiteDecisionCache
+from .exceptions import PolicyValidationError
+from .frozen import (
+    FrozenPolicy,
+    FrozenStrategy,
+    FrozenUser,
+    freeze_policies,
+)
+from .instrumentation import AuthorizationObserver
+from .loader import load_policies, parse_policies
 from .policy import Policy, Strategy
+from .policy_set import PolicySet
 from .policy_strategy import PolicyStrategy
 from .policy_strategy_builder import PolicyStrategyBuilder, StrategyMapper
+from .predicate import AttributePredicateStrategy
+from .session_hook import SessionHook
 from .user import User
+from .validation import validate_policies
 
 __all__ = [
+    "AsyncAuthorization",
+    "AsyncDecision",
+    "AsyncPolicyStrategy",
+    "AttributePredicateStrategy",
     "Authorization",
+    "AuthorizationObserver",
     "CheckResponse",
     "Context",
+    "Decision",
+    "DecisionCache",
+    "DecisionCacheBackend",
+    "FrozenPolicy",
+    "FrozenStrategy",
+    "FrozenUser",
     "Policy",
+    "PolicyFinding",
+    "PolicySet",
+    "PolicyValidationError",
     "Strategy",
     "PolicyStrategy",
     "PolicyStrategyBuilder",
+    "SQLiteDecisionCache",
+    "SessionHook",
     "StrategyMapper",
     "User",
+    "analyze_policies",
+    "freeze_policies",
+    "load_policies",
+    "parse_policies",
+    "prune_policies",
+    "validate_policies",
 ]
@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Hashable, Iterable, NamedTuple, Optional, Sequence
+
+from .frozen import AnyPolicy, AnyStrategy
+from .policy_index import WILDCARD
+from .utils import freeze
+
+DUPLICATE = "duplicate"
+SHADOWED = "shadowed"
+UNREACHABLE = "unreachable"
+
+
+@dataclass(frozen=True)
+class PolicyFinding:
+    """
+    A policy that can never be returned by the policy lookup. ``cause`` is the earlier policy responsible (None when
+    the policy matches nothing on its own). ``prunable`` tells whether removing the policy keeps every lookup
+    unchanged: a ``last_rule`` policy can still stop the scan for roles it doesn't match, so it isn't always.
+    """
+
+    kind: str
+    position: int
+    policy: AnyPolicy
+    cause: Optional[AnyPolicy]
+    cause_position: Optional[int]
+    prunable: bool
+
+    def __str__(self) -> str:
+        message = f"policy #{self.position} ({self.policy.name!r}) is {self.kind}"
+        if self.cause is not None:
+            message += f" by policy #{self.cause_position} ({self.cause.name!r})"
+        return message
+
+
+class _Scope(NamedTuple):
+    resources: frozenset[str]
+    roles: frozenset[Any]
+    actions: frozenset[str]
+    sub_action: Optional[str]
+    outcome: Hashable
+
+    @classmethod
+    def of(cls, policy: AnyPolicy) -> _Scope:
+        return cls(
+            resources=frozenset(resource.lower() for resource in policy.resources),
+            roles=frozenset(policy.roles),
+            actions=frozenset(policy.actions),
+            sub_action=policy.sub_action or None,
+            outcome=(policy.deny, policy.last_rule, _strategies(policy.strategies), _strategies(policy.or_strategies)),
+        )
+
+    def matches_nothing(self, last_rule: bool) -> bool:
+        """Whether the lookup never reaches the policy; without roles, a ``last_rule`` policy still stops the scan."""
+        return not self.resources or not self.actions or (not self.roles and not last_rule)
+
+    def covers_requests(self, other: _Scope) -> bool:
+        """Whether this policy is a lookup candidate, sub_action included, for every request ``other`` is."""
+        return (
+            _covers(self.resources, other.resources)
+            and _covers(self.actions, other.actions)
+            and (not self.sub_action or self.sub_action == other.sub_action)
+        )
+
+
+def analyze_policies(policies: Sequence[AnyPolicy]) -> list[PolicyFinding]:
+    """
+    Finds the policies the first-match lookup can never return, each compared with the earlier policies that are
+    kept by ``prune_policies``:
+
+    - ``unreachable``: the policy names no resource, role or action, or an earlier ``last_rule`` policy is a
+      candidate for all of its requests, so the lookup always stops before it (a ``last_rule`` policy without
+      roles is reported but kept: it still stops the scan);
+    - ``duplicate``: an earlier policy is identical;
+    - ``shadowed``: an earlier policy matches every request it matches (roles included).
+
+    Shadowing by a combination of several earlier policies is not detected.
+    """
+    findings: list[PolicyFinding] = []
+    kept: list[tuple[int, AnyPolicy, _Scope]] = []
+    for position, policy in enumerate(policies):
+        finding = _find(position, policy, _Scope.of(policy), kept)
+        if finding is not None:
+            findings.append(finding)
+        if finding is None or not finding.prunable:
+            kept.append((position, policy, _Scope.of(policy)))
+    return findings
+
+
+def prune_policies(policies: Sequence[AnyPolicy]) -> list[AnyPolicy]:
+    """``policies`` without the prunable findings of ``analyze_policies``; every lookup returns the same policy."""
+    pruned = {finding.position for finding in analyze_policies(policies) if finding.prunable}
+    return [policy for position, policy in enumerate(policies) if position not in pruned]
+
+
+def _find(
+    position: int, policy: AnyPolicy, scope: _Scope, kept: Iterable[tuple[int, AnyPolicy, _Scope]]
+) -> Optional[PolicyFinding]:
+    if scope.matches_nothing(policy.last_rule):
+        return PolicyFinding(UNREACHABLE, position, policy, None, None, prunable=True)
+
+    for cause_position, cause, cause_scope in kept:
+        if not cause_scope.covers_requests(scope):
+            continue
+        if cause_scope == scope:
+            return PolicyFinding(DUPLICATE, position, policy, cause, cause_position, prunable=True)
+        if cause.last_rule:
+            return PolicyFinding(UNREACHABLE, position, policy, cause, cause_position, prunable=True)
+        if _covers(cause_scope.roles, scope.roles):
+            prunable = not policy.last_rule or WILDCARD in cause_scope.roles
+            return PolicyFinding(SHADOWED, position, policy, cause, cause_position, prunable=prunable)
+    if not scope.roles:
+        # a last_rule policy without roles is never returned, but denies every later policy to its requests
+        return PolicyFinding(UNREACHABLE, position, policy, None, None, prunable=False)
+    return None
+
+
+def _covers(values: frozenset[Any], others: frozenset[Any]) -> bool:
+    return WILDCARD in values or (WILDCARD not in others and others <= values)
+
+
+def _strategies(strategies: Optional[Iterable[AnyStrategy]]) -> Hashable:
+    if not strategies:
+        return ()
+    try:
+        return tuple((strategy.name, freeze(strategy.args)) for strategy in strategies)
+    except TypeError:  # unhashable args: never considered a duplicate
+        return object()
@@ -0,0 +1,420 @@
+from __future__ import annotations
+
+import asyncio
+import inspect
+import time
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Iterable,
+    Optional,
+    Sequence,
+    TypeVar,
+    Union,
+)
+
+from sqlalchemy.orm.query import Query
+
+from .authorization import _MISSING, Authorization, _EmptyEntity
+from .context import Context
+from .decision import AsyncDecision
+from .frozen import AnyPolicy, AnyStrategy, AnyUser
+from .policy_set import PolicySet
+from .policy_strategy import PolicyStrategy
+
+T = TypeVar("T", bound=object)
+R = TypeVar("R")
+
+
+async def _resolve(result: Union[R, Awaitable[R]]) -> R:
+    if inspect.isawaitable(result):
+        return await result
+    return result
+
+
+async def _chunks(entities: Union[Iterable[T], AsyncIterable[T]], size: int) -> AsyncIterator[list[T]]:
+    chunk: list[T] = []
+    if isinstance(entities, AsyncIterable):
+        async for entity in entities:
+            chunk.append(entity)
+            if len(chunk) == size:
+                yield chunk
+                chunk = []
+    else:
+        for entity in entities:
+            chunk.append(entity)
+            if len(chunk) == size:
+                yield chunk
+                chunk = []
+    if chunk:
+        yield chunk
+
+
+class AsyncAuthorization(Authorization):
+    """
+    ``Authorization`` with awaitable entity checks. Strategies may be ``AsyncPolicyStrategy`` or plain synchronous
+    ``PolicyStrategy`` subclasses; ``or_strategies`` run concurrently and the first one that passes wins.
+    Policy lookup, ``get_permissions_info`` and ``apply_policies_to_query`` are inherited unchanged.
+    """
+
+    def compile_decision(
+        self,
+        *,
+        user: AnyUser,
+        resource: str,
+        action: Optional[str] = None,
+        sub_action: Optional[str] = None,
+        args: Optional[dict[str, Any]] = None,
+    ) -> AsyncDecision:
+        """``Authorization.compile_decision``, returning an ``AsyncDecision`` whose entity checks are awaitable."""
+        decision = super().compile_decision(
+            user=user, resource=resource, action=action, sub_action=sub_action, args=args
+        )
+        return AsyncDecision(self, decision.context, decision.allowed, decision.policy_version)
+
+    async def is_allowed(  # type: ignore[override]
+        self,
+        *,
+        user: AnyUser,
+        action: str,
+        resource: str,
+        sub_action: Optional[str] = None,
+        args: Optional[dict[str, Any]] = None,
+    ) -> bool:
+        """
+        Checks permissions not entity specific , returns True/False.
+        """
+        action = action or self.default_action
+
+        cache, key = self._decision_cache_key("is_allowed", user, action, resource, sub_action, args)
+        if cache is None or key is None:
+            return await self._is_allowed_async(user, action, resource, sub_action, args)
+        allowed = cache.get(key, _MISSING)
+        if allowed is _MISSING:
+            allowed = await self._is_allowed_async(user, action, resource, sub_action, args)
+            cache.set(key, allowed)
+        return bool(allowed)
+
+    async def _is_allowed_async(
+        self,
+        user: AnyUser,
+        action: str,
+        resource: str,
+        sub_action: Optional[str],
+        args: Optional[dict[str, Any]],
+    ) -> bool:
+        start = time.perf_counter() if self.observer else 0.0
+        context = self._build_context(user, resource, action, sub_action, args)
+        allowed = False
+        if context:
+            allowed = await self._evaluate_entity_async(_EmptyEntity(), context.policy, context) is not None
+        self._report_decision("is_allowed", user, resource, action, sub_action, int(allowed), 1, start)
+        return allowed
+
+    async def is_entity_allowed(  # type: ignore[override]
+        self,
+        *,
+        user: AnyUser,
+        action: str,
+        entity: T,
+        resource: str,
+        sub_action: Optional[str] = None,
+        args: Optional[dict[str, Any]] = None,
+    ) -> bool:
+        """
+        Checks a specific entity against the policies rules and returns True/False
+        """
+        action = action or self.default_action
+
+        cache, key = self._decision_cache_key("is_entity_allowed", user, action, resource, sub_action, args, entity)
+        if cache is None or key is None:
+            return await self._is_entity_allowed_async(user, action, entity, resource, sub_action, args)
+        allowed = cache.get(key, _MISSING)
+        if allowed is _MISSING:
+            allowed = await self._is_entity_allowed_async(user, action, entity, resource, sub_action, args)
+            cache.set(key, allowed)
+        return bool(allowed)
+
+    async def _is_entity_allowed_async(
+        self,
+        user: AnyUser,
+        action: str,
+        entity: T,
+        resource: str,
+        sub_action: Optional[str],
+        args: Optional[dict[str, Any]],
+    ) -> bool:
+        resp = await self.apply_policies_to_one(
+            user=user,
+            entity=entity,
+            resource_to_check=resource,
+            action=action,
+            sub_action=sub_action,
+            args=args,
+        )
+        return True if resp else False
+
+    async def apply_policies_to_one(  # type: ignore[override]
+        self,
+        *,
+        user: AnyUser,
+        entity: Optional[T] = None,
+        action: Optional[str] = None,
+        sub_action: Optional[str] = None,
+        resource_to_check: Optional[str] = None,
+        args: Optional[dict[str, Any]] = None,
+    ) -> Optional[T]:
+        """
+        Applies policies to one entity and return the entity if its allowed
+        """
+        if not entity:
+            return None
+        action = action or self.default_action
+
+        start = time.perf_counter() if self.observer else 0.0
+        resource_to_access = resource_to_check or self._resource_name(entity)
+        context = self._build_context(user, resource_to_access, action, sub_action, args)
+        result = await self._evaluate_entity_async(entity, context.policy, context) if context else None
+        self._report_decision(
+            "apply_policies_to_one", user, resource_to_access, action, sub_action, int(result is not None), 1, start
+        )
+        return result
+
+    async def apply_policies_to_many(  # type: ignore[override]
+        self,
+        *,
+        user: AnyUser,
+        entities: Iterable[T],
+        action: Optional[str] = None,
+        sub_action: Optional[str] = None,
+        resource_to_check: Optional[str] = None,
+        args: Optional[dict[str, Any]] = None,
+        filter_in_db: Optional[bool] = False,
+    ) -> list[T]:
+        """
+        Applies policies to multiple entities and returns a list of entities allowed.
+        A ``Query`` argument is loaded with ``.all()``; pass already loaded rows when using an async session.
+        ``filter_in_db`` works as in ``Authorization.apply_policies_to_many``.
+        """
+        action = action or self.default_action
+        if not entities:
+            return []
+
+        if isinstance(entities, Query):
+            filtered = self._filtered_query(
+                entities, user, action, sub_action, resource_to_check, args or dict(), filter_in_db
+            )
+            if filtered is not None:
+                allowed: list[T] = filtered.all()
+                return allowed
+            entities = entities.all()
+
+        return await self._filter_entities_async(
+            "apply_policies_to_many",
+            list(entities),
+            user,
+            action,
+            sub_action,
+            resource_to_check,
+            args,
+            self._policy_set,
+        )
+
+    async def iter_policies_to_many(  # type: ignore[override]
+        self,
+        *,
+        user: AnyUser,
+        entities: Union[Iterable[T], AsyncIterable[T]],
+        action: Optional[str] = None,
+        sub_action: Optional[str] = None,
+        resource_to_check: Optional[str] = None,
+        args: Optional[dict[str, Any]] = None,
+        chunk_size: int = 1000,
+        filter_in_db: Optional[bool] = False,
+    ) -> AsyncIterator[T]:
+        """
+        Asynchronous generator counterpart of ``Authorization.iter_policies_to_many``. ``entities`` may also be an
+        async iterable, e.g. ``(await session.stream(select(Deal))).scalars()``.
+        """
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+        action = action or self.default_action
+        if isinstance(entities, Query):
+            filtered = self._filtered_query(
+                entities, user, action, sub_action, resource_to_check, args or dict(), filter_in_db
+            )
+            if filtered is not None:
+                for entity in filtered.yield_per(chunk_size):
+                    yield entity
+                return
+            entities = entities.yield_per(chunk_size)
+        policy_set = self._policy_set
+
+        async for chunk in _chunks(entities, chunk_size):
+            for entity in await self._filter_entities_async(
+                "iter_policies_to_many", chunk, user, action, sub_action, resource_to_check, args, policy_set
+            ):
+                yield entity
+
+    async def _filter_entities_async(
+        self,
+        method: str,
+        entities: list[T],
+        user: AnyUser,
+        action: str,
+        sub_action: Optional[str],
+        resource_to_check: Optional[str],
+        args: Optional[dict[str, Any]],
+        policy_set: PolicySet,
+    ) -> list[T]:
+        """Awaitable counterpart of ``_filter_entities``."""
+        entities = [entity for entity in entities if entity]
+        results: list[Optional[T]] = [None] * len(entities)
+        for resource_to_access, positions in self._group_by_resource(entities, resource_to_check).items():
+            start = time.perf_counter() if self.observer else 0.0
+            context = self._build_context(user, resource_to_access, action, sub_action, args, policy_set)
+            group_results: list[Optional[T]] = [None] * len(positions)
+            if context:
+                group_results = await self._evaluate_entities_async(
+                    [entities[p] for p in positions], context.policy, context
+                )
+            for position, result in zip(positions, group_results):
+                results[position] = result
+            if self.observer is not None:
+                allowed = sum(1 for result in group_results if result)
+                self._report_decision(
+                    method, user, resource_to_access, action, sub_action, allowed, len(positions), start
+                )
+
+        return [result for result in results if result]
+
+    async def _evaluate_entity_async(self, entity: T, policy: AnyPolicy, context: Context) -> Optional[T]:
+        """Awaitable counterpart of ``_evaluate_entity``."""
+        if not policy.strategies and not policy.or_strategies:
+            return entity
+
+        and_result: Optional[T] = entity
+        if policy.strategies:
+            for strategy in policy.strategies:
+                strategy_instance = self.strategy_builder.build(strategy)
+                if not strategy_instance:
+                    return None
+                and_result = await self._run_entity_strategy_async(
+                    strategy_instance, and_result, context  # type: ignore[arg-type]
+                )
+            if and_result is None:
+                self.logger.debug("AND strategies denied entity")
+                return None
+
+        if policy.or_strategies:
+            passed = await self._or_strategies_pass_async([entity], policy.or_strategies, context, batch=False)
+            if not passed[0]:
+                return None
+
+        return and_result
+
+    async def _evaluate_entities_async(
+        self, entities: list[T], policy: AnyPolicy, context: Context
+    ) -> list[Optional[T]]:
+        """Awaitable counterpart of ``_evaluate_entities``."""
+        if not policy.strategies and not policy.or_strategies:
+            return list(entities)
+
+        results: list[Optional[T]] = list(entities)
+        if policy.strategies:
+            for strategy in policy.strategies:
+                strategy_instance = self.strategy_builder.build(strategy)
+                if not strategy_instance:
+                    return [None] * len(entities)
+                pending = [position for position, entity in enumerate(results) if entity is not None]
+                if not pending:
+                    break
+                batch_results = await self._run_entities_strategy_async(
+                    strategy_instance, [results[p] for p in pending], context  # type: ignore[misc]
+                )
+                for position, result in zip(pending, batch_results):
+                    results[position] = result
+
+        if policy.or_strategies:
+            pending = [position for position, result in enumerate(results) if result is not None]
+            passed = await self._or_strategies_pass_async(
+                [entities[p] for p in pending], policy.or_strategies, context, batch=True
+            )
+            for position, allowed in zip(pending, passed):
+                if not allowed:
+                    results[position] = None
+
+        return results
+
+    async def _or_strategies_pass_async(
+        self,
+        entities: list[T],
+        or_strategies: Sequence[AnyStrategy],
+        context: Context,
+        batch: bool,
+    ) -> list[bool]:
+        """
+        Runs every OR strategy concurrently over ``entities`` and stops as soon as all of them passed at least one.
+        """
+        instances, allows_all = self._or_strategy_instances(or_strategies)
+        passed = [allows_all] * len(entities)
+        if not entities or not instances:
+            return passed
+
+        async def run(strategy_instance: PolicyStrategy) -> list[Optional[T]]:
+            if batch:
+                return await self._run_entities_strategy_async(strategy_instance, entities, context)
+            return [await self._run_entity_strategy_async(strategy_instance, entities[0], context)]
+
+        tasks = [asyncio.ensure_future(run(strategy_instance)) for strategy_instance in instances]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                for position, result in enumerate(await next_done):
+                    if result is not None:
+                        passed[position] = True
+                if all(passed):
+                    break
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        if not all(passed):
+            self.logger.debug("All OR strategies returned None — denied")
+        return passed
+
+    async def _run_entity_strategy_async(
+        self, strategy_instance: PolicyStrategy, entity: T, context: Context
+    ) -> Optional[T]:
+        if self.observer is None:
+            return await _resolve(strategy_instance.apply_policies_to_entity(entity, context))
+
+        start = time.perf_counter()
+        result = await _resolve(strategy_instance.apply_policies_to_entity(entity, context))
+        self.observer.on_strategy(
+            strategy=strategy_instance,
+            method="apply_policies_to_entity",
+            context=context,
+            duration=time.perf_counter() - start,
+            allowed=int(result is not None),
+        )
+        return result
+
+    async def _run_entities_strategy_async(
+        self, strategy_instance: PolicyStrategy, entities: list[T], context: Context
+    ) -> list[Optional[T]]:
+        if self.observer is None:
+            return await _resolve(strategy_instance.apply_policies_to_entities(entities, context))
+
+        start = time.perf_counter()
+        results = await _resolve(strategy_instance.apply_policies_to_entities(entities, context))
+        self.observer.on_strategy(
+            strategy=strategy_instance,
+            method="apply_policies_to_entities",
+            context=context,
+            duration=time.perf_counter() - start,
+            allowed=sum(result is not None for result in results),
+        )
+        return results
@@ -0,0 +1,22 @@
+import asyncio
+from typing import Optional, TypeVar
+
+from py_authorization.context import Context
+from py_authorization.policy_strategy import PolicyStrategy
+
+T = TypeVar("T", bound=object)
+
+
+class AsyncPolicyStrategy(PolicyStrategy):
+    """
+    Strategy whose entity checks can await I/O. Only ``AsyncAuthorization`` awaits them; query filtering stays
+    synchronous because building a statement doesn't touch the database.
+    """
+
+    async def apply_policies_to_entity(self, entity: T, context: Context) -> Optional[T]:  # type: ignore[override]
+        pass
+
+    async def apply_policies_to_entities(  # type: ignore[override]
+        self, entities: list[T], context: Context
+    ) -> list[Optional[T]]:
+        return list(await asyncio.gather(*(self.apply_policies_to_entity(entity, context) for entity in entities)))
@@ -1,24 +1,63 @@
 from __future__ import annotations
 
 import logging
-from dataclasses import dataclass
-from typing import Any, Callable, Iterable, Optional, TypedDict, TypeVar
+import pickle
+import threading
+import time
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, replace
+from functools import partial
+from inspect import iscoroutinefunction
+from itertools import islice
+from types import MappingProxyType
+from typing import (
+    Any,
+    Callable,
+    Hashable,
+    Iterable,
+    Iterator,
+    Mapping,
+    Optional,
+    Sequence,
+    TypedDict,
+    TypeVar,
+    Union,
+    cast,
+)
+from weakref import WeakKeyDictionary
 
-from sqlalchemy import inspect, or_
+from sqlalchemy import and_, false, inspect, or_, true, tuple_
+from sqlalchemy.orm import with_loader_criteria
 from sqlalchemy.orm.query import Query
+from sqlalchemy.sql import Select
+from sqlalchemy.sql.elements import ColumnElement
 
+from . import analysis
 from .context import Context
-from .policy import Policy, Strategy
+from .decision import Decision
+from .decision_cache import DecisionCache, DecisionCacheBackend, DecisionKey
+from .frozen import AnyPolicy, AnyStrategy, AnyUser, FrozenPolicy
+from .instrumentation import AuthorizationObserver
+from .policy_set import PolicySet
+from .policy_strategy import PolicyStrategy
 from .policy_strategy_builder import PolicyStrategyBuilder, StrategyMapper
-from .sql_parser import all_entities_in_statement
-from .user import User
+from .resource import mapped_class, resource_name_of
+from .sql_parser import all_entities_in_statement, get_column_entities
+from .validation import validate_policies
 
 T = TypeVar("T", bound=object)
+QueryT = TypeVar("QueryT", Query, Select)
+
+_MISSING = object()
+
+_async_strategy_methods: "WeakKeyDictionary[type, frozenset[str]]" = WeakKeyDictionary()
 
 
 class _ApplicableStrategies(TypedDict):
-    strategies: list[Strategy]
-    or_strategies: Optional[list[Strategy]]
+    strategies: Sequence[AnyStrategy]
+    or_strategies: Optional[Sequence[AnyStrategy]]
     context: Context
 
 
@@ -39,62 +78,293 @@ class CheckResponse:
     allowed: bool = False
 
 
+PermissionsKey = tuple[str, str, Optional[str]]
+PermissionsMatrix = Mapping[PermissionsKey, CheckResponse]
+
+
 class Authorization:
     def __init__(
         self,
-        policies: list[Policy],
+        policies: Union[Sequence[AnyPolicy], PolicySet],
         strategy_mapper_callable: Callable[[], StrategyMapper],
         default_action: str = "read",
+        cache_strategies: bool = False,
+        observer: Optional[AuthorizationObserver] = None,
+        executor: Optional[Executor] = None,
+        parallel_chunk_size: int = 1000,
+        prune_policies: bool = False,
+        decision_cache_backend: Optional[DecisionCacheBackend] = None,
     ) -> None:
         self.logger = logging.getLogger(__name__)
+        self.prune_policies = prune_policies
+        self.observer = observer
+        self.executor = executor
+        self.parallel_chunk_size = parallel_chunk_size
         self.default_action = default_action
-        self.policies = policies
+        self._swap_lock = threading.Lock()
+        self._policy_set = self._new_policy_set(policies)
         self.strategy_builder = PolicyStrategyBuilder(
-            strategy_mapper_callable=strategy_mapper_callable
+            strategy_mapper_callable=strategy_mapper_callable, cache=cache_strategies
+        )
+        self._decision_cache: ContextVar[Optional[DecisionCache]] = ContextVar(
+            f"py_authorization_decision_cache_{id(self)}", default=None
         )
+        self.decision_cache_backend = decision_cache_backend
+        if decision_cache_backend is not None:
+            decision_cache_backend.evict_stale(self._policy_set.fingerprint)
+
+    @property
+    def policies(self) -> Sequence[AnyPolicy]:
+        """
+        Policies are compiled into a lookup index when assigned; assign a new list (or call ``replace_policies``)
+        instead of mutating this one.
+        """
+        return self._policy_set.policies
+
+    @policies.setter
+    def policies(self, policies: Sequence[AnyPolicy]) -> None:
+        self.replace_policies(policies, validate=False)
+
+    @property
+    def policy_set(self) -> PolicySet:
+        return self._policy_set
+
+    @property
+    def policy_version(self) -> int:
+        return self._policy_set.version
+
+    def replace_policies(self, policies: Union[Sequence[AnyPolicy], PolicySet], *, validate: bool = True) -> int:
+        """
+        Atomically swaps in a new policy set and returns its version. The policies are validated (see
+        ``validate_policies``) and compiled before the swap; checks already running finish on the snapshot they
+        started with, and caches derived from the previous version stop being used.
+        """
+        if validate:
+            validate_policies(
+                policies.policies if isinstance(policies, PolicySet) else policies,
+                self.strategy_builder.strategy_mapper_callable(),
+            )
+        policy_set = self._new_policy_set(policies)
+        with self._swap_lock:
+            self._policy_set = policy_set.with_version(self._policy_set.version + 1)
+            version = self._policy_set.version
+        self.logger.debug("Policies replaced, version: %s", version)
+        if self.decision_cache_backend is not None:
+            self.decision_cache_backend.evict_stale(policy_set.fingerprint)
+        return version
+
+    def replace_policies_in_background(
+        self,
+        policies: Union[Sequence[AnyPolicy], PolicySet],
+        *,
+        validate: bool = True,
+        executor: Optional[Executor] = None,
+    ) -> Future[int]:
+        """
+        ``replace_policies`` on ``executor`` (or a new thread); the returned future resolves to the new version or
+        raises ``PolicyValidationError``. The current policies keep serving checks meanwhile.
+        """
+        if executor is not None:
+            return executor.submit(self.replace_policies, policies, validate=validate)
+
+        future: Future[int] = Future()
+
+        def run() -> None:
+            if not future.set_running_or_notify_cancel():
+                return
+            try:
+                future.set_result(self.replace_policies(policies, validate=validate))
+            except BaseException as error:
+                future.set_exception(error)
+
+        threading.Thread(target=run, name="py_authorization-replace-policies", daemon=True).start()
+        return future
+
+    def _new_policy_set(self, policies: Union[Sequence[AnyPolicy], PolicySet]) -> PolicySet:
+        """A ``PolicySet`` is used as given; a list is pruned first when ``prune_policies`` is set."""
+        if isinstance(policies, PolicySet):
+            return policies
+        if self.prune_policies:
+            pruned = analysis.prune_policies(policies)
+            if len(pruned) < len(policies):
+                self.logger.debug("Pruned %s unreachable policies", len(policies) - len(pruned))
+            policies = pruned
+        return PolicySet(policies)
+
+    @contextmanager
+    def decision_cache(self, maxsize: int = 1024, ttl: Optional[float] = None) -> Iterator[DecisionCache]:
+        """
+        Memoizes ``is_allowed`` and ``get_permissions_info`` decisions inside the ``with`` block (e.g. a request).
+        The cache is bound to the current context, so concurrent requests and tasks don't share it, and is used
+        instead of ``decision_cache_backend``.
+        """
+        cache = DecisionCache(maxsize=maxsize, ttl=ttl)
+        token = self._decision_cache.set(cache)
+        try:
+            yield cache
+        finally:
+            self._decision_cache.reset(token)
+
+    def invalidate_decisions(self, user: Optional[AnyUser] = None) -> None:
+        """Drops memoized decisions of the active decision caches, e.g. after ``user`` changed role."""
+        cache = self._decision_cache.get()
+        if cache is not None:
+            cache.invalidate(user)
+        if self.decision_cache_backend is not None:
+            self.decision_cache_backend.invalidate(user)
+
+    def _decision_cache_key(
+        self,
+        kind: str,
+        user: AnyUser,
+        action: str,
+        resource: str,
+        sub_action: Optional[str],
+        args: Optional[dict[str, Any]],
+        entity: Optional[object] = None,
+    ) -> tuple[Optional[DecisionCacheBackend], Optional[DecisionKey]]:
+        """
+        The active cache (the ``decision_cache()`` block, else ``decision_cache_backend``) and the decision key, if
+        the decision can be cached. Entity decisions are keyed by the entity identity.
+        """
+        cache: Optional[DecisionCacheBackend] = self._decision_cache.get()
+        if cache is None:
+            cache = self.decision_cache_backend
+        if cache is None:
+            return None, None
+        identity = None
+        if entity is not None:
+            identity = _entity_identity(entity) if cache.cache_entities else None
+            if identity is None:
+                return cache, None
+        policy_set = self._policy_set.fingerprint
+        return cache, DecisionKey.build(kind, user, action, resource, sub_action, args, policy_set, identity)
 
     def _get_policy(
         self,
-        user: User,
+        user: AnyUser,
         resource_to_access: str,
         action: str,
         sub_action: Optional[str],
-    ) -> Optional[Policy]:
-        policy: Policy
-        for policy in self.policies:
+        policy_set: Optional[PolicySet] = None,
+    ) -> Optional[AnyPolicy]:
+        index = (policy_set or self._policy_set).index
+        if self.observer is None:
+            return index.find(user.role, resource_to_access, action, sub_action)
 
-            roles = policy.roles
-            resources = [r.lower() for r in policy.resources]
-            actions = policy.actions
+        start = time.perf_counter()
+        policy = index.find(user.role, resource_to_access, action, sub_action)
+        self.observer.on_policy_lookup(
+            user=user,
+            resource=resource_to_access,
+            action=action,
+            sub_action=sub_action,
+            policy=policy,
+            duration=time.perf_counter() - start,
+        )
+        return policy
 
-            if "*" not in actions and action not in actions:
-                continue
-            if policy.sub_action and sub_action != policy.sub_action:
-                continue
-            if "*" not in resources and resource_to_access.lower() not in resources:
-                continue
-            if "*" not in roles and user.role not in roles:
-                if policy.last_rule:  # last rule for the policy resources
-                    break
-                continue
+    def _run_entity_strategy(self, strategy_instance: PolicyStrategy, entity: T, context: Context) -> Optional[T]:
+        start = time.perf_counter() if self.observer else 0.0
+        _reject_async(strategy_instance, "apply_policies_to_entity")
+        result = strategy_instance.apply_policies_to_entity(entity, context)
+        if self.observer is None:
+            return result
+        self.observer.on_strategy(
+            strategy=strategy_instance,
+            method="apply_policies_to_entity",
+            context=context,
+            duration=time.perf_counter() - start,
+            allowed=int(result is not None),
+        )
+        return result
 
-            return policy
-        return None
+    def _run_entities_strategy(
+        self, strategy_instance: PolicyStrategy, entities: list[T], context: Context
+    ) -> list[Optional[T]]:
+        start = time.perf_counter() if self.observer else 0.0
+        _reject_async(strategy_instance, "apply_policies_to_entities")
+        results = strategy_instance.apply_policies_to_entities(entities, context)
+        if self.observer is None:
+            return results
+        self.observer.on_strategy(
+            strategy=strategy_instance,
+            method="apply_policies_to_entities",
+            context=context,
+            duration=time.perf_counter() - start,
+            allowed=sum(result is not None for result in results),
+        )
+        return results
+
+    def _run_query_strategy(self, strategy_instance: PolicyStrategy, query: Query, context: Context) -> Query:
+        if self.observer is None:
+            return strategy_instance.apply_policies_to_query(query, context)
+
+        start = time.perf_counter()
+        query = strategy_instance.apply_policies_to_query(query, context)
+        self.observer.on_strategy(
+            strategy=strategy_instance,
+            method="apply_policies_to_query",
+            context=context,
+            duration=time.perf_counter() - start,
+            allowed=None,
+        )
+        return query
+
+    def _run_criteria_strategy(
+        self, strategy_instance: PolicyStrategy, entity_cls: Any, context: Context
+    ) -> Optional[ColumnElement[bool]]:
+        if self.observer is None:
+            return strategy_instance.query_criteria(entity_cls, context)
+
+        start = time.perf_counter()
+        criteria = strategy_instance.query_criteria(entity_cls, context)
+        self.observer.on_strategy(
+            strategy=strategy_instance,
+            method="query_criteria",
+            context=context,
+            duration=time.perf_counter() - start,
+            allowed=None,
+        )
+        return criteria
+
+    def _report_decision(
+        self,
+        method: str,
+        user: AnyUser,
+        resource: str,
+        action: str,
+        sub_action: Optional[str],
+        allowed: int,
+        total: int,
+        start: float,
+    ) -> None:
+        if self.observer is not None:
+            self.observer.on_decision(
+                method=method,
+                user=user,
+                resource=resource,
+                action=action,
+                sub_action=sub_action,
+                allowed=allowed,
+                total=total,
+                duration=time.perf_counter() - start,
+            )
 
     def _any_or_strategy_passes_entity(
         self,
         entity: T,
-        or_strategies: list[Strategy],
+        or_strategies: Sequence[AnyStrategy],
         context: Context,
     ) -> bool:
         """Evaluate or_strategies with OR semantics: any one passing = True."""
-        for strategy in or_strategies:
-            strategy_instance = self.strategy_builder.build(strategy)
-            if not strategy_instance:
-                continue
-            result = strategy_instance.apply_policies_to_entity(entity, context)
+        strategy_instances, allows_all = self._or_strategy_instances(or_strategies)
+        if allows_all:
+            return True
+        for strategy_instance in strategy_instances:
+            result = self._run_entity_strategy(strategy_instance, entity, context)
             if result is not None:
-                self.logger.debug(f"OR strategy passed: {strategy.name}")
+                self.logger.debug("OR strategy passed: %s", type(strategy_instance).__name__)
                 return True
         self.logger.debug("All OR strategies returned None — denied")
         return False
@@ -102,7 +372,7 @@ class Authorization:
     def _evaluate_entity(
         self,
         entity: T,
-        policy: Policy,
+        policy: AnyPolicy,
         context: Context,
     ) -> Optional[T]:
         """
@@ -131,37 +401,209 @@ class Authorization:
 
         return and_result
 
-    def _combine_or_queries(
+    def _evaluate_entities(
         self,
-        query: Query,
-        or_strategies: list[Strategy],
+        entities: list[T],
+        policy: AnyPolicy,
         context: Context,
-    ) -> Optional[Query]:
+    ) -> list[Optional[T]]:
         """
-        Run each OR strategy's query filter on the original query,
-        combine results via PK subquery OR.
-        Returns None if no OR strategy produced a valid filter.
+        Batch counterpart of ``_evaluate_entity`` with the same AND+OR semantics, one result per entity.
+        OR strategies receive the original entities that passed the AND chain.
+        """
+        if not policy.strategies and not policy.or_strategies:
+            return list(entities)
+
+        results: list[Optional[T]] = list(entities)
+        if policy.strategies:
+            results = self._apply_strategies_to_entities(entities, policy.strategies, context)
+
+        if policy.or_strategies:
+            pending = [position for position, result in enumerate(results) if result is not None]
+            passed = self._or_strategies_pass_entities([entities[p] for p in pending], policy.or_strategies, context)
+            for position, allowed in zip(pending, passed):
+                if not allowed:
+                    results[position] = None
+
+        return results
+
+    def _evaluate_entities_in_parallel(
+        self, entities: list[T], context: Context, executor: Executor
+    ) -> Optional[list[Optional[T]]]:
+        """
+        ``_evaluate_entities`` over chunks of ``parallel_chunk_size`` entities run on ``executor``, results in input
+        order. Returns None, for a serial evaluation, when a strategy of the policy sets ``parallel_safe = False``
+        or, on a ``ProcessPoolExecutor``, when the strategies or the context can't be pickled.
+
+        Worker processes get the strategy classes, a plain copy of the policy and the context, and the entities;
+        they send back which entities were allowed, and the original entities are returned.
         """
-        pk_col = query.column_descriptions[0]["entity"].id
-        conditions = []
+        strategy_classes = self._parallel_strategy_classes(context.policy)
+        if strategy_classes is None:
+            return None
+
+        size = self.parallel_chunk_size
+        chunks = [entities[start : start + size] for start in range(0, len(entities), size)]
+        if not isinstance(executor, ProcessPoolExecutor):
+            futures = [executor.submit(self._evaluate_entities, chunk, context.policy, context) for chunk in chunks]
+            return [result for future in futures for result in future.result()]
+
+        policy = context.policy.to_policy() if isinstance(context.policy, FrozenPolicy) else context.policy
+        process_context = replace(context, policy=policy)
+        try:
+            pickle.dumps((strategy_classes, process_context))
+        except (pickle.PicklingError, TypeError, AttributeError):
+            self.logger.warning("Context for '%s' can't be pickled, evaluating serially", context.resource)
+            return None
+        allowed_futures = [
+            executor.submit(_evaluate_chunk_in_process, strategy_classes, process_context, chunk) for chunk in chunks
+        ]
+        return [
+            entity if allowed else None
+            for chunk, future in zip(chunks, allowed_futures)
+            for entity, allowed in zip(chunk, future.result())
+        ]
 
+    def _parallel_strategy_classes(self, policy: AnyPolicy) -> Optional[StrategyMapper]:
+        """The strategy classes ``policy`` uses, or None if one of them opts out of parallel evaluation."""
+        strategy_mapper = self._strategy_mapper()
+        strategy_classes = {}
+        for strategy in [*(policy.strategies or []), *(policy.or_strategies or [])]:
+            strategy_class = strategy_mapper.get(strategy.name)
+            if strategy_class is None:
+                continue
+            if not strategy_class.parallel_safe:
+                return None
+            strategy_classes[strategy.name] = strategy_class
+        return strategy_classes
+
+    def _or_strategies_pass_entities(
+        self,
+        entities: list[T],
+        or_strategies: Sequence[AnyStrategy],
+        context: Context,
+    ) -> list[bool]:
+        """Batch counterpart of ``_any_or_strategy_passes_entity``: each strategy only sees entities still denied."""
+        strategy_instances, allows_all = self._or_strategy_instances(or_strategies)
+        passed = [allows_all] * len(entities)
+        for strategy_instance in strategy_instances:
+            pending = [position for position, allowed in enumerate(passed) if not allowed]
+            if not pending:
+                break
+            results = self._run_entities_strategy(strategy_instance, [entities[p] for p in pending], context)
+            for position, result in zip(pending, results):
+                if result is not None:
+                    passed[position] = True
+        return passed
+
+    def _or_strategy_instances(self, or_strategies: Sequence[AnyStrategy]) -> tuple[list[PolicyStrategy], bool]:
+        """
+        Builds the OR branches cheapest first, dropping unknown and ``denies_all`` strategies.
+        The flag is True when a branch is ``allows_all``: the OR passes without evaluating any branch.
+        """
+        strategy_instances = []
         for strategy in or_strategies:
             strategy_instance = self.strategy_builder.build(strategy)
-            if not strategy_instance:
+            if not strategy_instance or strategy_instance.denies_all:
                 continue
-            filtered = strategy_instance.apply_policies_to_query(query, context)
+            if strategy_instance.allows_all:
+                self.logger.debug("OR strategy allows all: %s", strategy.name)
+                return [], True
+            strategy_instances.append(strategy_instance)
+        strategy_instances.sort(key=lambda strategy_instance: strategy_instance.cost)
+        return strategy_instances, False
+
+    def _build_context(
+        self,
+        user: AnyUser,
+        resource_to_access: str,
+        action: str,
+        sub_action: Optional[str],
+        args: Optional[dict[str, Any]],
+        policy_set: Optional[PolicySet] = None,
+    ) -> Optional[Context]:
+        """Resolves the policy for the resource; returns the evaluation context, or None when access is denied."""
+        policy = self._get_policy(
+            user=user,
+            resource_to_access=resource_to_access,
+            action=action,
+            sub_action=sub_action,
+            policy_set=policy_set,
+        )
+        if not policy:
+            self.logger.debug("[x] Policy not found, resource: '%s'", resource_to_access)
+            return None
+
+        self.logger.debug("Policy applied: %s", policy)
+
+        if policy.deny:
+            self.logger.debug("[x] Resource denied by: %s, resource: '%s'", policy, resource_to_access)
+            return None
+
+        return Context(
+            user=user,
+            policy=policy,
+            resource=resource_to_access,
+            action=action,
+            sub_action=sub_action,
+            args=args or dict(),
+        )
+
+    def _group_by_resource(self, entities: list[T], resource_to_check: Optional[str]) -> dict[str, list[int]]:
+        """Positions of ``entities`` grouped by the resource they are checked against."""
+        if resource_to_check:
+            return {resource_to_check: list(range(len(entities)))}
+        groups: dict[str, list[int]] = {}
+        for position, entity in enumerate(entities):
+            groups.setdefault(self._resource_name(entity), []).append(position)
+        return groups
+
+    def _resource_name(self, entity: object) -> str:
+        return resource_name_of(entity)
+
+    def _or_criteria(
+        self,
+        query: Query,
+        entity_cls: Any,
+        strategy_instances: list[PolicyStrategy],
+        context: Context,
+    ) -> Optional[ColumnElement[bool]]:
+        """
+        Combines the OR strategies into a single criteria on ``entity_cls``: branches implementing ``query_criteria``
+        are merged as is, the others run their query filter on ``query`` and are combined via a primary key subquery.
+        Returns None if no OR strategy produced a valid filter.
+        """
+        conditions: list[ColumnElement[bool]] = []
+        for strategy_instance in strategy_instances:
+            criteria = self._run_criteria_strategy(strategy_instance, entity_cls, context)
+            if criteria is not None:
+                _append_unique(conditions, criteria)
+                continue
+            filtered = self._run_query_strategy(strategy_instance, query, context)
             if filtered is not None:
-                conditions.append(pk_col.in_(filtered.with_entities(pk_col).subquery()))
+                _append_unique(conditions, self._primary_key_in(entity_cls, filtered))
 
         if not conditions:
             return None
+        return conditions[0] if len(conditions) == 1 else or_(*conditions)
 
-        return query.filter(or_(*conditions))
+    def _primary_key_in(self, entity_cls: Any, query: Query) -> ColumnElement[bool]:
+        """``entity_cls`` primary key (single or composite) IN the primary keys selected by ``query``."""
+        mapper = inspect(entity_cls).mapper
+        pk_cols = [getattr(entity_cls, mapper.get_property_by_column(column).key) for column in mapper.primary_key]
+        # correlate(None): the subquery selects from the same table and must not be correlated to the outer query
+        if isinstance(query, Query):
+            selected_pks = query.with_entities(*pk_cols).statement.correlate(None)
+        else:
+            selected_pks = query.with_only_columns(*pk_cols).correlate(None)
+        if len(pk_cols) == 1:
+            return pk_cols[0].in_(selected_pks)
+        return tuple_(*pk_cols).in_(selected_pks)
 
     def get_permissions_info(
         self,
         *,
-        user: User,
+        user: AnyUser,
         action: str,
         resource: str,
         sub_action: Optional[str] = None,
@@ -169,7 +611,97 @@ class Authorization:
         """
         This method provide info to the FE, it doesnt check strategies.
         """
+        matrix: Optional[PermissionsMatrix] = self._policy_set.permissions_matrices.get(user.role)
+        if matrix is not None and (resource, action, sub_action) in matrix:
+            return replace(matrix[(resource, action, sub_action)])
+
+        cache, key = self._decision_cache_key("permissions_info", user, action, resource, sub_action, None)
+        if cache is None or key is None:
+            return self._get_permissions_info(user, action, resource, sub_action)
+        response: Optional[CheckResponse] = cache.get(key)
+        if response is None:
+            response = self._get_permissions_info(user, action, resource, sub_action)
+            cache.set(key, response)
+        return replace(response)
+
+    def get_permissions_matrix(
+        self,
+        *,
+        user: AnyUser,
+        resources: Optional[Iterable[str]] = None,
+        actions: Optional[Iterable[str]] = None,
+        sub_actions: Optional[Iterable[Optional[str]]] = None,
+    ) -> PermissionsMatrix:
+        """
+        ``get_permissions_info`` for every (resource, action, sub_action) combination, keyed by that tuple, e.g. to
+        bootstrap the FE in one call. Defaults to every resource, action and sub_action named by the policies.
+        The full matrix only depends on the user's role and is cached per role until the policies change; explicit
+        ``resources``, ``actions`` and ``sub_actions`` are read from it, and only combinations it doesn't cover (e.g.
+        resources matched by a wildcard) are evaluated per call. The caller gets its own copies of the responses.
+        """
+        policy_set = self._policy_set
+        full_matrix = self._full_permissions_matrix(user, policy_set)
+        if resources is None and actions is None and sub_actions is None:
+            return {key: replace(response) for key, response in full_matrix.items()}
+
+        if resources is None or actions is None or sub_actions is None:
+            known_resources, known_actions, known_sub_actions = self._named_in_policies(policy_set)
+            resources = known_resources if resources is None else resources
+            actions = known_actions if actions is None else actions
+            sub_actions = known_sub_actions if sub_actions is None else sub_actions
+        actions, sub_actions = list(actions), list(sub_actions)
+        matrix: dict[PermissionsKey, CheckResponse] = {}
+        for resource in resources:
+            for action in actions:
+                for sub_action in sub_actions:
+                    response = full_matrix.get((resource, action, sub_action))
+                    matrix[(resource, action, sub_action)] = (
+                        replace(response)
+                        if response is not None
+                        else self._get_permissions_info(user, action, resource, sub_action, policy_set)
+                    )
+        return matrix
+
+    def _full_permissions_matrix(self, user: AnyUser, policy_set: PolicySet) -> PermissionsMatrix:
+        """The matrix of every named resource, action and sub_action for the user's role, built once per role."""
+        matrix: Optional[PermissionsMatrix] = policy_set.permissions_matrices.get(user.role)
+        if matrix is not None:
+            return matrix
 
+        known_resources, known_actions, known_sub_actions = self._named_in_policies(policy_set)
+        matrix = MappingProxyType(
+            {
+                (resource, action, sub_action): self._get_permissions_info(
+                    user, action, resource, sub_action, policy_set
+                )
+                for resource in known_resources
+                for action in known_actions
+                for sub_action in known_sub_actions
+            }
+        )
+        policy_set.permissions_matrices[user.role] = matrix
+        return matrix
+
+    def _named_in_policies(self, policy_set: PolicySet) -> tuple[list[str], list[str], list[Optional[str]]]:
+        """Resources, actions and sub_actions (plus None) named by the policies, wildcards excluded."""
+        resources: dict[str, None] = {}
+        actions: dict[str, None] = {}
+        sub_actions: dict[Optional[str], None] = {None: None}
+        for policy in policy_set.policies:
+            resources.update((resource, None) for resource in policy.resources if resource != "*")
+            actions.update((action, None) for action in policy.actions if action != "*")
+            if policy.sub_action:
+                sub_actions[policy.sub_action] = None
+        return list(resources), list(actions), list(sub_actions)
+
+    def _get_permissions_info(
+        self,
+        user: AnyUser,
+        action: str,
+        resource: str,
+        sub_action: Optional[str],
+        policy_set: Optional[PolicySet] = None,
+    ) -> CheckResponse:
         info = "Allowed."
         allowed = True
         policy = self._get_policy(
@@ -177,6 +709,7 @@ class Authorization:
             resource_to_access=resource,
             action=action,
             sub_action=sub_action,
+            policy_set=policy_set,
         )
         if not policy:
             info = "No policy found for this resource."
@@ -199,7 +732,7 @@ class Authorization:
     def is_allowed(
         self,
         *,
-        user: User,
+        user: AnyUser,
         action: str,
         resource: str,
         sub_action: Optional[str] = None,
@@ -210,32 +743,33 @@ class Authorization:
         """
         action = action or self.default_action
 
-        policy = self._get_policy(
-            user=user,
-            action=action,
-            sub_action=sub_action,
-            resource_to_access=resource,
-        )
-        if not policy:
-            return False
-        if policy.deny:
-            return False
+        cache, key = self._decision_cache_key("is_allowed", user, action, resource, sub_action, args)
+        if cache is None or key is None:
+            return self._is_allowed(user, action, resource, sub_action, args)
+        allowed = cache.get(key, _MISSING)
+        if allowed is _MISSING:
+            allowed = self._is_allowed(user, action, resource, sub_action, args)
+            cache.set(key, allowed)
+        return bool(allowed)
 
-        context = Context(
-            user=user,
-            policy=policy,
-            resource=resource,
-            action=action,
-            sub_action=sub_action,
-            args=args or dict(),
-        )
-        result = self._evaluate_entity(_EmptyEntity(), policy, context)
-        return result is not None
+    def _is_allowed(
+        self,
+        user: AnyUser,
+        action: str,
+        resource: str,
+        sub_action: Optional[str],
+        args: Optional[dict[str, Any]],
+    ) -> bool:
+        start = time.perf_counter() if self.observer else 0.0
+        context = self._build_context(user, resource, action, sub_action, args)
+        allowed = context is not None and self._evaluate_entity(_EmptyEntity(), context.policy, context) is not None
+        self._report_decision("is_allowed", user, resource, action, sub_action, int(allowed), 1, start)
+        return allowed
 
     def is_entity_allowed(
         self,
         *,
-        user: User,
+        user: AnyUser,
         action: str,
         entity: T,
         resource: str,
@@ -245,6 +779,26 @@ class Authorization:
         """
         Checks a specific entity against the policies rules and returns True/False
         """
+        action = action or self.default_action
+
+        cache, key = self._decision_cache_key("is_entity_allowed", user, action, resource, sub_action, args, entity)
+        if cache is None or key is None:
+            return self._is_entity_allowed(user, action, entity, resource, sub_action, args)
+        allowed = cache.get(key, _MISSING)
+        if allowed is _MISSING:
+            allowed = self._is_entity_allowed(user, action, entity, resource, sub_action, args)
+            cache.set(key, allowed)
+        return bool(allowed)
+
+    def _is_entity_allowed(
+        self,
+        user: AnyUser,
+        action: str,
+        entity: T,
+        resource: str,
+        sub_action: Optional[str],
+        args: Optional[dict[str, Any]],
+    ) -> bool:
         resp = self.apply_policies_to_one(
             user=user,
             entity=entity,
@@ -258,42 +812,207 @@ class Authorization:
     def apply_policies_to_many(
         self,
         *,
-        user: User,
+        user: AnyUser,
         entities: Iterable[T],
         action: Optional[str] = None,
         sub_action: Optional[str] = None,
         resource_to_check: Optional[str] = None,
         args: Optional[dict[str, Any]] = None,
+        filter_in_db: Optional[bool] = False,
+        executor: Optional[Executor] = None,
     ) -> list[T]:
         """
-        Applies policies to multiple entities and returns a list of entities allowed
+        Applies policies to multiple entities and returns a list of entities allowed.
+        Entities are grouped by resource so the policy lookup, the context and the strategies are resolved once per
+        group, and strategies get the whole group through ``apply_policies_to_entities``.
+
+        With an ``executor`` (or the one given to ``Authorization``), groups larger than ``parallel_chunk_size`` are
+        split into chunks evaluated concurrently; see ``_evaluate_entities_in_parallel``.
+
+        When ``entities`` is a ``Query`` and ``filter_in_db`` is True, the query is filtered with
+        ``apply_policies_to_query`` and only the authorized rows are loaded. With ``filter_in_db=None`` this is done
+        only when every strategy involved implements ``apply_policies_to_query`` or ``query_criteria``.
         """
-        resp: list[T] = []
         args = args or dict()
         action = action or self.default_action
         if not entities:
-            return resp
+            return []
 
         if isinstance(entities, Query):
+            filtered = self._filtered_query(entities, user, action, sub_action, resource_to_check, args, filter_in_db)
+            if filtered is not None:
+                allowed: list[T] = filtered.all()
+                return allowed
             entities = entities.all()
 
-        for entity in entities:
-            valid_entity = self.apply_policies_to_one(
-                user=user,
-                action=action,
-                sub_action=sub_action,
-                entity=entity,
-                resource_to_check=resource_to_check,
-                args=args,
+        return self._filter_entities(
+            "apply_policies_to_many",
+            list(entities),
+            user,
+            action,
+            sub_action,
+            resource_to_check,
+            args,
+            self._policy_set,
+            executor or self.executor,
+        )
+
+    def iter_policies_to_many(
+        self,
+        *,
+        user: AnyUser,
+        entities: Iterable[T],
+        action: Optional[str] = None,
+        sub_action: Optional[str] = None,
+        resource_to_check: Optional[str] = None,
+        args: Optional[dict[str, Any]] = None,
+        chunk_size: int = 1000,
+        filter_in_db: Optional[bool] = False,
+        executor: Optional[Executor] = None,
+    ) -> Iterator[T]:
+        """
+        Streaming counterpart of ``apply_policies_to_many``: entities are evaluated ``chunk_size`` at a time (batched
+        like ``apply_policies_to_many``) and the allowed ones are yielded lazily. A ``Query`` is streamed with
+        ``yield_per(chunk_size)``, which uses server-side cursors where the driver supports them, instead of being
+        loaded with ``.all()``. ``filter_in_db`` and ``executor`` work as in ``apply_policies_to_many``.
+        """
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+        args = args or dict()
+        action = action or self.default_action
+        if isinstance(entities, Query):
+            filtered = self._filtered_query(entities, user, action, sub_action, resource_to_check, args, filter_in_db)
+            if filtered is not None:
+                return iter(filtered.yield_per(chunk_size))
+            entities = entities.yield_per(chunk_size)
+        return self._iter_filtered_entities(
+            iter(entities),
+            chunk_size,
+            user,
+            action,
+            sub_action,
+            resource_to_check,
+            args,
+            self._policy_set,
+            executor or self.executor,
+        )
+
+    def _iter_filtered_entities(
+        self,
+        entities: Iterator[T],
+        chunk_size: int,
+        user: AnyUser,
+        action: str,
+        sub_action: Optional[str],
+        resource_to_check: Optional[str],
+        args: dict[str, Any],
+        policy_set: PolicySet,
+        executor: Optional[Executor],
+    ) -> Iterator[T]:
+        while True:
+            chunk = list(islice(entities, chunk_size))
+            if not chunk:
+                return
+            yield from self._filter_entities(
+                "iter_policies_to_many", chunk, user, action, sub_action, resource_to_check, args, policy_set, executor
             )
-            if valid_entity:
-                resp.append(valid_entity)
-        return resp
+
+    def _filtered_query(
+        self,
+        query: Query,
+        user: AnyUser,
+        action: str,
+        sub_action: Optional[str],
+        resource_to_check: Optional[str],
+        args: dict[str, Any],
+        filter_in_db: Optional[bool],
+    ) -> Optional[Query]:
+        """``query`` filtered by ``apply_policies_to_query``, or None when its rows must be filtered in Python."""
+        resources_to_check = [resource_to_check] if resource_to_check else None
+        if filter_in_db is None:
+            filter_in_db = self._strategies_filter_in_db(query, user, action, sub_action, resources_to_check)
+        if not filter_in_db:
+            return None
+        return self.apply_policies_to_query(
+            user=user,
+            query=query,
+            action=action,
+            sub_action=sub_action,
+            resources_to_check=resources_to_check,
+            args=args,
+        )
+
+    def _strategies_filter_in_db(
+        self,
+        query: Query,
+        user: AnyUser,
+        action: str,
+        sub_action: Optional[str],
+        resources_to_check: Optional[list[str]],
+    ) -> bool:
+        """Whether every strategy the query's resources would run can filter in SQL."""
+        strategy_mapper = self._strategy_mapper()
+        index = self._policy_set.index
+        for resource_to_access in resources_to_check or all_entities_in_statement(query).keys():
+            policy = index.find(user.role, resource_to_access, action, sub_action)
+            if not policy or policy.deny:
+                continue
+            for strategy in [*(policy.strategies or []), *(policy.or_strategies or [])]:
+                strategy_class = strategy_mapper.get(strategy.name)
+                if strategy_class is not None and not _implements_query_filter(strategy_class):
+                    return False
+        return True
+
+    def _strategy_mapper(self) -> StrategyMapper:
+        """The builder's memoized mapper when it caches strategies; otherwise resolved again, as ``build`` does."""
+        if self.strategy_builder.cache:
+            return self.strategy_builder.strategy_mapper
+        return self.strategy_builder.strategy_mapper_callable()
+
+    def _filter_entities(
+        self,
+        method: str,
+        entities: list[T],
+        user: AnyUser,
+        action: str,
+        sub_action: Optional[str],
+        resource_to_check: Optional[str],
+        args: dict[str, Any],
+        policy_set: PolicySet,
+        executor: Optional[Executor] = None,
+    ) -> list[T]:
+        """
+        The allowed ``entities``, in order. Entities are grouped by resource so the policy lookup, the context and
+        the strategies are resolved once per group, and strategies get the whole group at once.
+        """
+        entities = [entity for entity in entities if entity]
+        results: list[Optional[T]] = [None] * len(entities)
+        for resource_to_access, positions in self._group_by_resource(entities, resource_to_check).items():
+            start = time.perf_counter() if self.observer else 0.0
+            context = self._build_context(user, resource_to_access, action, sub_action, args, policy_set)
+            if not context:
+                self._report_decision(method, user, resource_to_access, action, sub_action, 0, len(positions), start)
+                continue
+            group = [entities[p] for p in positions]
+            group_results = None
+            if executor is not None and len(group) > self.parallel_chunk_size:
+                group_results = self._evaluate_entities_in_parallel(group, context, executor)
+            if group_results is None:
+                group_results = self._evaluate_entities(group, context.policy, context)
+            for position, result in zip(positions, group_results):
+                results[position] = result
+            if self.observer is not None:
+                allowed = sum(1 for result in group_results if result)
+                self._report_decision(
+                    method, user, resource_to_access, action, sub_action, allowed, len(positions), start
+                )
+
+        return [result for result in results if result]
 
     def apply_policies_to_one(
         self,
         *,
-        user: User,
+        user: AnyUser,
         entity: Optional[T] = None,
         action: Optional[str] = None,
         sub_action: Optional[str] = None,
@@ -303,94 +1022,189 @@ class Authorization:
         """
         Applies policies to one entity and return the entity if its allowed
         """
-        self.logger.debug(f"Apply policies to ONE: {entity}")
+        self.logger.debug("Apply policies to ONE: %s", entity)
         if not entity:
             return None
         action = action or self.default_action
 
-        resource_to_access: str = resource_to_check or ""
-        if not resource_to_check:
-            model = inspect(entity).class_
-            resource_to_access = model.__name__
+        start = time.perf_counter() if self.observer else 0.0
+        resource_to_access = resource_to_check or self._resource_name(entity)
+        context = self._build_context(user, resource_to_access, action, sub_action, args)
+        result = self._evaluate_entity(entity, context.policy, context) if context else None
+        self._report_decision(
+            "apply_policies_to_one", user, resource_to_access, action, sub_action, int(result is not None), 1, start
+        )
+        return result
 
-        policy = self._get_policy(
-            user=user,
-            resource_to_access=resource_to_access,
-            action=action,
-            sub_action=sub_action,
+    def compile_decision(
+        self,
+        *,
+        user: AnyUser,
+        resource: str,
+        action: Optional[str] = None,
+        sub_action: Optional[str] = None,
+        args: Optional[dict[str, Any]] = None,
+    ) -> Decision:
+        """
+        Resolves the policy for ``resource`` once and returns a reusable ``Decision``: a definite allow or deny, or
+        the residual condition the policy's strategies put on entities, to apply to later queries and entities.
+        """
+        action = action or self.default_action
+        return self._compile_decision(
+            "compile_decision", user, resource, action, sub_action, args or dict(), self._policy_set
         )
 
-        if not policy:
-            self.logger.debug(f"[x] Policy not found, resource: '{resource_to_access}'")
-            return None
+    def _compile_decision(
+        self,
+        method: str,
+        user: AnyUser,
+        resource: str,
+        action: str,
+        sub_action: Optional[str],
+        args: dict[str, Any],
+        policy_set: PolicySet,
+    ) -> Decision:
+        start = time.perf_counter() if self.observer else 0.0
+        context = self._build_context(user, resource, action, sub_action, args, policy_set)
+        allowed = self._definite_outcome(context)
+        self._report_decision(method, user, resource, action, sub_action, int(allowed is not False), 1, start)
+        return Decision(self, context, allowed, policy_set.version)
 
-        self.logger.debug(f"Policy applied: {policy}")
+    def _definite_outcome(self, context: Optional[Context]) -> Optional[bool]:
+        """True or False when the policy's outcome doesn't depend on the entity, None when strategies decide."""
+        if context is None:
+            return False
+        policy = context.policy
+        for strategy in policy.strategies or []:
+            if self.strategy_builder.build(strategy) is None:
+                return False
+        if policy.or_strategies:
+            strategy_instances, allows_all = self._or_strategy_instances(policy.or_strategies)
+            if not allows_all:
+                return None if strategy_instances else False
+        return None if policy.strategies else True
 
-        if policy.deny:
-            self.logger.debug(
-                f"[x] Resource denied by: {policy}, resource: '{resource_to_access}'"
-            )
+    def _residual_criteria(self, decision: Decision, entity_cls: Any) -> Optional[ColumnElement[bool]]:
+        """``Decision.criteria``: the policy's strategies as one criteria, if they all implement ``query_criteria``."""
+        context = decision.context
+        if decision.allowed is not None or context is None:
+            return true() if decision.allowed else false()
+
+        criteria: list[ColumnElement[bool]] = []
+        for strategy in context.policy.strategies or []:
+            strategy_instance = self.strategy_builder.build(strategy)
+            if strategy_instance is None:
+                return false()
+            criterion = self._residual_criterion(strategy_instance, entity_cls, context)
+            if criterion is None:
+                return None
+            _append_unique(criteria, criterion)
+
+        if context.policy.or_strategies:
+            strategy_instances, allows_all = self._or_strategy_instances(context.policy.or_strategies)
+            branches: list[ColumnElement[bool]] = []
+            for strategy_instance in [] if allows_all else strategy_instances:
+                criterion = self._residual_criterion(strategy_instance, entity_cls, context)
+                if criterion is None:
+                    return None
+                _append_unique(branches, criterion)
+            if branches:
+                criteria.append(branches[0] if len(branches) == 1 else or_(*branches))
+
+        return criteria[0] if len(criteria) == 1 else and_(*criteria)
+
+    def _residual_criterion(
+        self, strategy_instance: PolicyStrategy, entity_cls: Any, context: Context
+    ) -> Optional[ColumnElement[bool]]:
+        if not _implements_query_criteria(strategy_instance):
             return None
+        return self._run_criteria_strategy(strategy_instance, entity_cls, context)
 
-        context = Context(
-            user=user,
-            policy=policy,
-            resource=resource_to_access,
-            action=action,
-            sub_action=sub_action,
-            args=args or dict(),
+    def _apply_residual_to_query(self, decision: Decision, query: Query) -> Query:
+        """``Decision.apply_to_query`` for decisions that depend on the entity."""
+        context = cast(Context, decision.context)
+        queried_entities = _QueriedEntities(query)
+        criteria = decision.criteria(queried_entities.get(context.resource))
+        if criteria is not None:
+            return query.filter(criteria)
+
+        collected: list[ColumnElement[bool]] = []
+        query, allowed = self._collect_query_filters(
+            query,
+            query,
+            queried_entities,
+            context.policy.strategies or [],
+            context.policy.or_strategies,
+            context,
+            collected,
         )
-        return self._evaluate_entity(entity, policy, context)
+        if not allowed:
+            return query.filter(False)
+        return query.filter(*collected) if collected else query
 
     def apply_policies_to_query(
         self,
         *,
-        user: User,
-        query: Query,
+        user: AnyUser,
+        query: QueryT,
         action: Optional[str] = None,
         sub_action: Optional[str] = None,
         resources_to_check: Optional[list[str]] = None,
         args: Optional[dict[str, Any]] = None,
-    ) -> Query:
+        use_loader_criteria: bool = False,
+    ) -> QueryT:
         """
         Applies policies to a query , in case of have an strategy, it applies the strategy filtering the query
         It always returns a sqlalchemy query , in case of no access it return a query that result in no data
 
+        ``query`` may be a legacy ``Query`` or a 2.0 style ``select()``, and the same type is returned. Criteria hold
+        user specific values as bound parameters, so authorized statements share SQLAlchemy's compiled cache.
+        With ``use_loader_criteria``, ``query_criteria`` are attached with ``with_loader_criteria`` instead of
+        ``where()``, so they also filter the joins and relationship loads of each checked entity.
+
+        Without ``resources_to_check``, entities only loaded through joined eager loading are filtered with loader
+        criteria instead, see ``_apply_policies_to_eager_loads``.
         """
         self.logger.debug("Apply policies to QUERY")
         args = args or dict()
         action = action or self.default_action
         strategies_to_apply: list[_ApplicableStrategies] = []
+        policy_set = self._policy_set
+        queried_entities = _QueriedEntities(query)
 
         if not resources_to_check:
-            entities = all_entities_in_statement(query)
-            resources_to_check = entities.keys() or []
+            eager_entities = queried_entities.eager_only()
+            resources_to_check = [r for r in queried_entities.all() if r not in eager_entities]
+            query = self._apply_policies_to_eager_loads(
+                query, eager_entities, user, action, sub_action, args, policy_set
+            )
 
         self.logger.debug("Resources from queries")
         self.logger.debug(resources_to_check)
 
-        self.logger.debug(f"Entities to look for policies: {resources_to_check}")
+        self.logger.debug("Entities to look for policies: %s", resources_to_check)
         for resource_to_access in resources_to_check:
-            self.logger.debug(f"Checking Resource: '{resource_to_access}'")
+            self.logger.debug("Checking Resource: '%s'", resource_to_access)
+            start = time.perf_counter() if self.observer else 0.0
             policy = self._get_policy(
                 user=user,
                 resource_to_access=resource_to_access,
                 action=action,
                 sub_action=sub_action,
+                policy_set=policy_set,
             )
-            if not policy:
-                self.logger.debug(
-                    f"[x] Policy not found, resource: '{resource_to_access}'"
+            if not policy or policy.deny:
+                if not policy:
+                    self.logger.debug("[x] Policy not found, resource: '%s'", resource_to_access)
+                else:
+                    self.logger.debug("[x] Resource denied by %s, resource: '%s'", policy, resource_to_access)
+                self._report_decision(
+                    "apply_policies_to_query", user, resource_to_access, action, sub_action, 0, 1, start
                 )
                 return query.filter(False)
 
-            self.logger.debug(f"Policy applied: {policy}")
-
-            if policy.deny:
-                self.logger.debug(
-                    f"[x] Resource denied by {policy}, resource: '{resource_to_access}'"
-                )
-                return query.filter(False)
+            self.logger.debug("Policy applied: %s", policy)
+            self._report_decision("apply_policies_to_query", user, resource_to_access, action, sub_action, 1, 1, start)
 
             if policy.strategies or policy.or_strategies:
                 context = Context(
@@ -411,26 +1225,105 @@ class Authorization:
         if not strategies_to_apply:
             return query
 
+        # Every resource contributes its criteria to one flat WHERE clause. Legacy query strategies still filter
+        # the query in turn, while OR branches without criteria select primary keys from the original query, so
+        # their subqueries never nest inside each other.
+        original_query = query
+        criteria: list[ColumnElement[bool]] = []
         for to_apply in strategies_to_apply:
-            and_strategies = to_apply["strategies"]
-            or_strats = to_apply["or_strategies"]
-            ctx = to_apply["context"]
+            collected: list[ColumnElement[bool]] = [] if use_loader_criteria else criteria
+            query, allowed = self._collect_query_filters(
+                query,
+                original_query,
+                queried_entities,
+                to_apply["strategies"],
+                to_apply["or_strategies"],
+                to_apply["context"],
+                collected,
+            )
+            if not allowed:
+                return query.filter(False)
+            if use_loader_criteria and collected:
+                entity_cls = queried_entities.get(to_apply["context"].resource)
+                query = query.options(with_loader_criteria(entity_cls, and_(*collected), include_aliases=True))
 
-            if and_strategies:
-                query = self._apply_strategies_to_query(query, and_strategies, ctx)
+        return query.filter(*criteria) if criteria else query
 
-            if or_strats:
-                or_combined = self._combine_or_queries(query, or_strats, ctx)
-                if or_combined is None:
-                    return query.filter(False)
-                query = or_combined
+    def _apply_policies_to_eager_loads(
+        self,
+        query: Query,
+        eager_entities: Mapping[str, Any],
+        user: AnyUser,
+        action: str,
+        sub_action: Optional[str],
+        args: dict[str, Any],
+        policy_set: PolicySet,
+    ) -> Query:
+        """
+        Entities only loaded through joined eager loading (e.g. ``joinedload(Deal.comments)``) don't decide which
+        rows the query returns; their policies become ``with_loader_criteria`` options, so the eager loaded
+        relationships only hold authorized rows. Relationships of denied resources, or of resources whose strategies
+        don't all implement ``query_criteria``, load empty.
+        """
+        options = []
+        for resource, entity_cls in eager_entities.items():
+            decision = self._compile_decision(
+                "apply_policies_to_query", user, resource, action, sub_action, args, policy_set
+            )
+            if decision.allowed:
+                continue
+            criteria = decision.criteria(entity_cls)
+            self.logger.debug("Eager loaded resource '%s' filtered by: %s", resource, criteria)
+            options.append(
+                with_loader_criteria(entity_cls, criteria if criteria is not None else false(), include_aliases=True)
+            )
+        return query.options(*options) if options else query
 
-        return query
+    def _collect_query_filters(
+        self,
+        query: Query,
+        original_query: Query,
+        queried_entities: _QueriedEntities,
+        strategies: Sequence[AnyStrategy],
+        or_strategies: Optional[Sequence[AnyStrategy]],
+        context: Context,
+        criteria: list[ColumnElement[bool]],
+    ) -> tuple[Query, bool]:
+        """
+        Runs one resource's strategies for ``apply_policies_to_query``: their criteria are appended to ``criteria``
+        and legacy query strategies filter ``query``. Returns the filtered query and False if the resource is denied.
+        """
+        for strategy in strategies:
+            strategy_instance = self.strategy_builder.build(strategy)
+            if not strategy_instance:
+                return query, False
+            if _implements_query_criteria(strategy_instance):
+                criterion = self._run_criteria_strategy(
+                    strategy_instance, queried_entities.get(context.resource), context
+                )
+                if criterion is not None:
+                    _append_unique(criteria, criterion)
+                    continue
+            query = self._run_query_strategy(strategy_instance, query, context)
+
+        if or_strategies:
+            strategy_instances, allows_all = self._or_strategy_instances(or_strategies)
+            if allows_all:
+                return query, True
+            or_criteria = None
+            if strategy_instances:
+                or_criteria = self._or_criteria(
+                    original_query, queried_entities.get(context.resource), strategy_instances, context
+                )
+            if or_criteria is None:
+                return query, False
+            _append_unique(criteria, or_criteria)
+        return query, True
 
     def _apply_strategies_to_entity(
         self,
         entity: T,
-        strategies: list[Strategy],
+        strategies: Sequence[AnyStrategy],
         context: Context,
     ) -> Optional[T]:
         processed_entity: Optional[T] = entity
@@ -438,17 +1331,118 @@ class Authorization:
             strategy_instance = self.strategy_builder.build(strategy)
             if not strategy_instance:
                 return None
-            processed_entity = strategy_instance.apply_policies_to_entity(
-                processed_entity, context
-            )
+            processed_entity = self._run_entity_strategy(strategy_instance, processed_entity, context)  # type: ignore
         return processed_entity
 
-    def _apply_strategies_to_query(
-        self, query: Query, strategies: list[Strategy], context: Context
-    ) -> Query:
+    def _apply_strategies_to_entities(
+        self,
+        entities: list[T],
+        strategies: Sequence[AnyStrategy],
+        context: Context,
+    ) -> list[Optional[T]]:
+        processed: list[Optional[T]] = list(entities)
         for strategy in strategies:
             strategy_instance = self.strategy_builder.build(strategy)
             if not strategy_instance:
-                return query.filter(False)
-            query = strategy_instance.apply_policies_to_query(query, context)
-        return query
+                return [None] * len(entities)
+            pending = [position for position, entity in enumerate(processed) if entity is not None]
+            if not pending:
+                break
+            results = self._run_entities_strategy(
+                strategy_instance, [processed[p] for p in pending], context  # type: ignore[misc]
+            )
+            for position, result in zip(pending, results):
+                processed[position] = result
+        return processed
+
+
+def _reject_async(strategy_instance: PolicyStrategy, method: str) -> None:
+    """
+    Rejects ``method`` of a strategy evaluated synchronously when it returns awaitables (an ``AsyncPolicyStrategy``
+    used with ``Authorization``): an unawaited coroutine is not a decision, and would count as allowed.
+    """
+    if method in _async_methods(type(strategy_instance)):
+        raise TypeError(
+            f"{type(strategy_instance).__name__}.{method} returns an awaitable; "
+            "async strategies need AsyncAuthorization"
+        )
+
+
+def _async_methods(strategy_class: type[PolicyStrategy]) -> frozenset[str]:
+    """The entity methods of ``strategy_class`` that are coroutine functions, resolved once per class."""
+    methods = _async_strategy_methods.get(strategy_class)
+    if methods is None:
+        entity_method = getattr(strategy_class, "apply_policies_to_entity", None)
+        entities_method = getattr(strategy_class, "apply_policies_to_entities", None)
+        methods = frozenset()
+        if iscoroutinefunction(entity_method):
+            methods |= {"apply_policies_to_entity"}
+            # The default batch method calls ``apply_policies_to_entity`` once per entity.
+            if entities_method is PolicyStrategy.apply_policies_to_entities:
+                methods |= {"apply_policies_to_entities"}
+        if iscoroutinefunction(entities_method):
+            methods |= {"apply_policies_to_entities"}
+        _async_strategy_methods[strategy_class] = methods
+    return methods
+
+
+def _evaluate_chunk_in_process(strategy_classes: StrategyMapper, context: Context, entities: list[Any]) -> list[bool]:
+    """Worker process side of ``Authorization._evaluate_entities_in_parallel``."""
+    authorization = Authorization(policies=[context.policy], strategy_mapper_callable=partial(dict, strategy_classes))
+    return [result is not None for result in authorization._evaluate_entities(entities, context.policy, context)]
+
+
+class _QueriedEntities:
+    """Resolves the mapped class queried for a resource, parsing the statement only once and only if needed."""
+
+    def __init__(self, query: Query) -> None:
+        self.query = query
+        self._entities: Optional[dict[str, Any]] = None
+        self._eager_only: Optional[dict[str, Any]] = None
+
+    def all(self) -> dict[str, Any]:
+        if self._entities is None:
+            self._entities = all_entities_in_statement(self.query)
+        return self._entities
+
+    def eager_only(self) -> dict[str, Any]:
+        """Entities loaded through joined eager loading but not selected by the statement."""
+        if self._eager_only is None:
+            selected = {mapped_class(entity) for entity in get_column_entities(self.query)}
+            self._eager_only = {name: cls for name, cls in self.all().items() if cls not in selected}
+        return self._eager_only
+
+    def get(self, resource: str) -> Any:
+        """Falls back to the first queried entity, e.g. when the resource names no entity of the statement."""
+        descriptions = self.query.column_descriptions
+        if len(descriptions) > 1:
+            entity_cls = self.all().get(resource)
+            if entity_cls is not None:
+                return entity_cls
+        return descriptions[0]["entity"]
+
+
+def _entity_identity(entity: object) -> Optional[tuple[str, Hashable]]:
+    """The entity class and primary key of a persistent SQLAlchemy instance, None for any other entity."""
+    state = inspect(entity, raiseerr=False)
+    identity = getattr(state, "identity", None)
+    if identity is None:
+        return None
+    return f"{type(entity).__module__}.{type(entity).__qualname__}", identity
+
+
+def _implements_query_criteria(strategy_instance: PolicyStrategy) -> bool:
+    return type(strategy_instance).query_criteria is not PolicyStrategy.query_criteria
+
+
+def _implements_query_filter(strategy_class: type[PolicyStrategy]) -> bool:
+    return (
+        strategy_class.apply_policies_to_query is not PolicyStrategy.apply_policies_to_query
+        or strategy_class.query_criteria is not PolicyStrategy.query_criteria
+    )
+
+
+def _append_unique(criteria: list[ColumnElement[bool]], criterion: ColumnElement[bool]) -> None:
+    """Skips criteria already present (same SQL and bound values), e.g. a strategy shared by several resources."""
+    if not any(criterion.compare(existing) for existing in criteria):
+        criteria.append(criterion)
@@ -1,14 +1,13 @@
 from dataclasses import dataclass
 from typing import Any, Optional
 
-from py_authorization.policy import Policy
-from py_authorization.user import User
+from py_authorization.frozen import AnyPolicy, AnyUser
 
 
 @dataclass
 class Context:
-    user: User
-    policy: Policy
+    user: AnyUser
+    policy: AnyPolicy
     resource: str
     args: dict[str, Any]
     action: Optional[str] = None
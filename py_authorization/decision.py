@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Iterable, Optional, TypeVar
+
+from sqlalchemy.orm.query import Query
+from sqlalchemy.sql.elements import ColumnElement
+
+from .context import Context
+
+if TYPE_CHECKING:
+    from .async_authorization import AsyncAuthorization
+    from .authorization import Authorization
+
+T = TypeVar("T", bound=object)
+
+
+class Decision:
+    """
+    A policy decision compiled once by ``Authorization.compile_decision`` for a user, resource, action and
+    sub_action, and reusable for any number of queries and entities without another policy lookup.
+
+    ``allowed`` is True when every entity is allowed, False when none is, and None when it depends on the entity:
+    the policy's strategies are then the residual condition, available as SQL through ``criteria`` when the
+    strategies implement ``query_criteria``.
+
+    The decision is bound to the policy set it was compiled against (``policy_version``); compile a new one after
+    ``Authorization.replace_policies``.
+    """
+
+    def __init__(
+        self,
+        authorization: Authorization,
+        context: Optional[Context],
+        allowed: Optional[bool],
+        policy_version: int,
+    ) -> None:
+        self.authorization = authorization
+        self.context = context
+        self.allowed = allowed
+        self.policy_version = policy_version
+        self._criteria: dict[Any, Optional[ColumnElement[bool]]] = {}
+
+    def __repr__(self) -> str:
+        resource = self.context.resource if self.context else None
+        return f"Decision(allowed={self.allowed}, resource={resource!r}, policy_version={self.policy_version})"
+
+    def criteria(self, entity_cls: Any) -> Optional[ColumnElement[bool]]:
+        """
+        The residual condition as SQL criteria on ``entity_cls`` (``true()``/``false()`` for definite decisions),
+        computed once per class. None when a strategy only implements ``apply_policies_to_query``.
+        """
+        if entity_cls not in self._criteria:
+            self._criteria[entity_cls] = self.authorization._residual_criteria(self, entity_cls)
+        return self._criteria[entity_cls]
+
+    def apply_to_query(self, query: Query) -> Query:
+        """Same result as ``Authorization.apply_policies_to_query`` for the decision's resource."""
+        if self.allowed is True:
+            return query
+        if self.allowed is False or self.context is None:
+            return query.filter(False)
+        return self.authorization._apply_residual_to_query(self, query)
+
+    def apply_to_entity(self, entity: T) -> Optional[T]:
+        """Same result as ``Authorization.apply_policies_to_one`` for the decision's resource."""
+        if self.allowed is False or self.context is None or not entity:
+            return None
+        if self.allowed is True:
+            return entity
+        return self.authorization._evaluate_entity(entity, self.context.policy, self.context)
+
+    def apply_to_entities(self, entities: Iterable[T]) -> list[T]:
+        """Same result as ``Authorization.apply_policies_to_many`` for entities of the decision's resource."""
+        entities = [entity for entity in entities if entity]
+        if self.allowed is False or self.context is None:
+            return []
+        if self.allowed is True:
+            return entities
+        results = self.authorization._evaluate_entities(entities, self.context.policy, self.context)
+        return [result for result in results if result]
+
+
+class AsyncDecision(Decision):
+    """
+    The ``Decision`` returned by ``AsyncAuthorization.compile_decision``: ``apply_to_entity`` and
+    ``apply_to_entities`` are awaitable, so residual ``AsyncPolicyStrategy`` checks are awaited rather than
+    counted as allowed. ``allowed``, ``criteria`` and ``apply_to_query`` are unchanged.
+    """
+
+    authorization: AsyncAuthorization
+
+    async def apply_to_entity(self, entity: T) -> Optional[T]:  # type: ignore[override]
+        """Same result as ``AsyncAuthorization.apply_policies_to_one`` for the decision's resource."""
+        if self.allowed is False or self.context is None or not entity:
+            return None
+        if self.allowed is True:
+            return entity
+        return await self.authorization._evaluate_entity_async(entity, self.context.policy, self.context)
+
+    async def apply_to_entities(self, entities: Iterable[T]) -> list[T]:  # type: ignore[override]
+        """Same result as ``AsyncAuthorization.apply_policies_to_many`` for entities of the decision's resource."""
+        entities = [entity for entity in entities if entity]
+        if self.allowed is False or self.context is None:
+            return []
+        if self.allowed is True:
+            return entities
+        results = await self.authorization._evaluate_entities_async(entities, self.context.policy, self.context)
+        return [result for result in results if result]
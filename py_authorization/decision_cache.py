@@ -0,0 +1,236 @@
+from __future__ import annotations
+
+import logging
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, NamedTuple, Optional, Union
+
+from .frozen import AnyUser
+from .utils import freeze, stable_repr
+
+logger = logging.getLogger(__name__)
+
+
+class DecisionKey(NamedTuple):
+    kind: str
+    role: Any
+    user_id: Any
+    action: str
+    resource: str
+    sub_action: Optional[str]
+    args: Hashable
+    policy_set: str = ""
+    entity: Hashable = None
+
+    @classmethod
+    def build(
+        cls,
+        kind: str,
+        user: AnyUser,
+        action: str,
+        resource: str,
+        sub_action: Optional[str],
+        args: Optional[dict[str, Any]],
+        policy_set: str = "",
+        entity: Hashable = None,
+    ) -> Optional[DecisionKey]:
+        """
+        Returns None when the decision can't be keyed (unhashable user id or args). ``policy_set`` is the policy set
+        fingerprint, so decisions made under other policies are never reused; ``entity`` identifies the checked
+        entity, if any.
+        """
+        try:
+            key = cls(
+                kind, user.role, user.id, action, resource, sub_action, freeze(args or dict()), policy_set, entity
+            )
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+
+class DecisionCacheBackend:
+    """
+    Where ``Authorization`` memoizes decisions. Every method is a no-op; subclass it to store decisions elsewhere
+    (e.g. Redis). ``get``, ``set`` and ``evict_stale`` are called implicitly and must never raise: a cache failure
+    should only cost a re-evaluation.
+
+    ``cache_entities`` enables memoizing ``is_entity_allowed`` by entity identity (persistent SQLAlchemy instances
+    only). Those decisions don't see later changes to the entity, so keep the TTL short or ``invalidate``.
+    """
+
+    cache_entities = False
+
+    def get(self, key: DecisionKey, default: Any = None) -> Any:
+        return default
+
+    def set(self, key: DecisionKey, value: Any) -> None:
+        pass
+
+    def invalidate(self, user: Optional[AnyUser] = None) -> None:
+        """Drops every decision, or only the decisions made for ``user`` (matched by id)."""
+        pass
+
+    def evict_stale(self, policy_set: str) -> None:
+        """Drops the decisions made under policy sets other than the one with the ``policy_set`` fingerprint."""
+        pass
+
+
+class DecisionCache(DecisionCacheBackend):
+    """
+    Bounded in-process LRU of authorization decisions with optional TTL eviction.
+
+    Usually scoped to a unit of work (e.g. an HTTP request) through ``Authorization.decision_cache()``.
+    Keys include the user role, so a role change never reuses old decisions; ``invalidate(user)`` also drops them.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        ttl: Optional[float] = None,
+        timer: Callable[[], float] = time.monotonic,
+        cache_entities: bool = False,
+    ) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.timer = timer
+        self.cache_entities = cache_entities
+        self._entries: OrderedDict[DecisionKey, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: DecisionKey, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+            expires_at, value = entry
+            if expires_at and expires_at <= self.timer():
+                del self._entries[key]
+                return default
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: DecisionKey, value: Any) -> None:
+        expires_at = self.timer() + self.ttl if self.ttl else 0.0
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, user: Optional[AnyUser] = None) -> None:
+        with self._lock:
+            if user is None:
+                self._entries.clear()
+                return
+            for key in [key for key in self._entries if key.user_id == user.id]:
+                del self._entries[key]
+
+    def evict_stale(self, policy_set: str) -> None:
+        with self._lock:
+            for key in [key for key in self._entries if key.policy_set != policy_set]:
+                del self._entries[key]
+
+
+class SQLiteDecisionCache(DecisionCacheBackend):
+    """
+    Decisions stored in a SQLite file, shared by every process of the host that opens the same ``path`` (e.g. the
+    workers of a gunicorn server), so each decision is evaluated once per host instead of once per worker.
+
+    Keys hold the policy set fingerprint, so workers on different policies never share decisions. Values are
+    pickled: keep the file private to the application. ``maxsize`` is approximate, oldest entries are dropped first.
+    Keys whose role, user id, args or entity have no stable repr (see ``stable_repr``) are not cached.
+    """
+
+    trim_every = 256
+
+    def __init__(
+        self,
+        path: Union[str, os.PathLike[str]],
+        maxsize: int = 100_000,
+        ttl: Optional[float] = None,
+        timer: Callable[[], float] = time.time,
+        cache_entities: bool = False,
+        timeout: float = 1.0,
+    ) -> None:
+        self.path = os.fspath(path)
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.timer = timer
+        self.cache_entities = cache_entities
+        self.timeout = timeout
+        self._local = threading.local()
+        self._writes = 0
+        self._connect()  # creates the table, and fails early on an unusable path
+
+    def get(self, key: DecisionKey, default: Any = None) -> Any:
+        try:
+            row = (
+                self._connect()
+                .execute("SELECT expires_at, value FROM decisions WHERE key = ?", (stable_repr(key),))
+                .fetchone()
+            )
+            if row is None or (row[0] and row[0] <= self.timer()):
+                return default
+            return pickle.loads(row[1])
+        except TypeError:
+            return default
+        except Exception:
+            logger.warning("Could not read decision cache %s", self.path, exc_info=True)
+            return default
+
+    def set(self, key: DecisionKey, value: Any) -> None:
+        expires_at = self.timer() + self.ttl if self.ttl else 0.0
+        try:
+            row = (stable_repr(key), key.policy_set, stable_repr(key.user_id), expires_at, pickle.dumps(value))
+            with self._connect() as connection:
+                connection.execute("INSERT OR REPLACE INTO decisions VALUES (?, ?, ?, ?, ?)", row)
+                self._writes += 1
+                if self._writes % self.trim_every == 0:
+                    self._trim(connection)
+        except TypeError:
+            pass
+        except Exception:
+            logger.warning("Could not write decision cache %s", self.path, exc_info=True)
+
+    def invalidate(self, user: Optional[AnyUser] = None) -> None:
+        with self._connect() as connection:
+            if user is None:
+                connection.execute("DELETE FROM decisions")
+            else:
+                connection.execute("DELETE FROM decisions WHERE user_id = ?", (stable_repr(user.id),))
+
+    def evict_stale(self, policy_set: str) -> None:
+        try:
+            with self._connect() as connection:
+                connection.execute("DELETE FROM decisions WHERE policy_set != ?", (policy_set,))
+        except Exception:
+            logger.warning("Could not evict stale decisions from %s", self.path, exc_info=True)
+
+    def _trim(self, connection: sqlite3.Connection) -> None:
+        connection.execute("DELETE FROM decisions WHERE expires_at != 0 AND expires_at <= ?", (self.timer(),))
+        connection.execute(
+            "DELETE FROM decisions WHERE rowid <= (SELECT max(rowid) FROM decisions) - ?", (self.maxsize,)
+        )
+
+    def _connect(self) -> sqlite3.Connection:
+        """One connection per thread and process; connections must not cross a fork."""
+        connection: Optional[sqlite3.Connection] = getattr(self._local, "connection", None)
+        if connection is not None and self._local.pid == os.getpid():
+            return connection
+        connection = sqlite3.connect(self.path, timeout=self.timeout)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS decisions "
+            "(key TEXT PRIMARY KEY, policy_set TEXT, user_id TEXT, expires_at REAL, value BLOB)"
+        )
+        self._local.connection, self._local.pid = connection, os.getpid()
+        return connection
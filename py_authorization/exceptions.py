@@ -0,0 +1,6 @@
+class PolicyValidationError(ValueError):
+    """Raised when a policy set is rejected before being loaded, e.g. because it names an unknown strategy."""
+
+    def __init__(self, errors: list[str]) -> None:
+        super().__init__("; ".join(errors))
+        self.errors = errors
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import sys
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, Iterable, Mapping, Optional, Union
+
+from .policy import Policy, Strategy
+from .user import User
+from .utils import freeze
+
+# __slots__ on dataclasses needs Python 3.10; older interpreters get the frozen, hashable classes without them.
+_SLOTS: dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+def _freeze_args(args: Optional[Mapping[str, Any]]) -> Optional[Mapping[str, Any]]:
+    return MappingProxyType(dict(args)) if args is not None else None
+
+
+@dataclass(frozen=True, **_SLOTS)
+class FrozenStrategy:
+    name: str
+    args: Optional[Mapping[str, Any]] = None
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "args", _freeze_args(self.args))
+
+    def __hash__(self) -> int:
+        return hash((self.name, freeze(self.args)))
+
+    @classmethod
+    def from_strategy(cls, strategy: Union[Strategy, FrozenStrategy]) -> FrozenStrategy:
+        if isinstance(strategy, FrozenStrategy):
+            return strategy
+        return cls(name=strategy.name, args=strategy.args)
+
+    def to_strategy(self) -> Strategy:
+        return Strategy(name=self.name, args=dict(self.args) if self.args is not None else None)
+
+
+@dataclass(frozen=True, **_SLOTS)
+class FrozenPolicy:
+    """
+    Immutable, hashable ``Policy``. ``resources``, ``roles`` and ``actions`` are frozensets so membership tests are
+    O(1), and strategy lists are tuples of ``FrozenStrategy``. ``Authorization`` accepts these wherever it accepts
+    ``Policy``; resources keep their declared names, as lookups lowercase them in the index.
+    """
+
+    name: str
+    resources: frozenset[str]
+    roles: frozenset[str]
+    actions: frozenset[str]
+    sub_action: Optional[str] = None
+    strategies: Optional[tuple[FrozenStrategy, ...]] = None
+    or_strategies: Optional[tuple[FrozenStrategy, ...]] = None
+    deny: bool = False
+    last_rule: bool = False
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "resources", frozenset(self.resources))
+        object.__setattr__(self, "roles", frozenset(self.roles))
+        object.__setattr__(self, "actions", frozenset(self.actions))
+        object.__setattr__(self, "strategies", _freeze_strategies(self.strategies))
+        object.__setattr__(self, "or_strategies", _freeze_strategies(self.or_strategies))
+
+    @classmethod
+    def from_policy(cls, policy: Union[Policy, FrozenPolicy]) -> FrozenPolicy:
+        if isinstance(policy, FrozenPolicy):
+            return policy
+        return cls(
+            name=policy.name,
+            resources=frozenset(policy.resources),
+            roles=frozenset(policy.roles),
+            actions=frozenset(policy.actions),
+            sub_action=policy.sub_action,
+            strategies=policy.strategies,  # type: ignore[arg-type]
+            or_strategies=policy.or_strategies,  # type: ignore[arg-type]
+            deny=policy.deny,
+            last_rule=policy.last_rule,
+        )
+
+    def to_policy(self) -> Policy:
+        """Mutable ``Policy`` copy, e.g. to pickle it (mapping proxies can't be pickled)."""
+        return Policy(
+            name=self.name,
+            resources=list(self.resources),
+            roles=list(self.roles),
+            actions=list(self.actions),
+            sub_action=self.sub_action,
+            strategies=[strategy.to_strategy() for strategy in self.strategies] if self.strategies else None,
+            or_strategies=[strategy.to_strategy() for strategy in self.or_strategies] if self.or_strategies else None,
+            deny=self.deny,
+            last_rule=self.last_rule,
+        )
+
+
+@dataclass(frozen=True, **_SLOTS)
+class FrozenUser:
+    role: str
+    id: Optional[Any]
+
+    @classmethod
+    def from_user(cls, user: Union[User, FrozenUser]) -> FrozenUser:
+        if isinstance(user, FrozenUser):
+            return user
+        return cls(role=user.role, id=user.id)
+
+
+AnyPolicy = Union[Policy, FrozenPolicy]
+AnyStrategy = Union[Strategy, FrozenStrategy]
+AnyUser = Union[User, FrozenUser]
+
+
+def freeze_policies(policies: Iterable[AnyPolicy]) -> list[FrozenPolicy]:
+    return [FrozenPolicy.from_policy(policy) for policy in policies]
+
+
+def _freeze_strategies(
+    strategies: Optional[Iterable[Union[Strategy, FrozenStrategy]]]
+) -> Optional[tuple[FrozenStrategy, ...]]:
+    if strategies is None:
+        return None
+    return tuple(FrozenStrategy.from_strategy(strategy) for strategy in strategies)
@@ -0,0 +1,59 @@
+from typing import Optional
+
+from .context import Context
+from .frozen import AnyPolicy, AnyUser
+from .policy_strategy import PolicyStrategy
+
+
+class AuthorizationObserver:
+    """
+    Receives timings from ``Authorization``'s hot path. Every hook is a no-op; override the ones you need, e.g. to
+    record metrics or to open OpenTelemetry spans. Durations are in seconds (``time.perf_counter``).
+
+    When no observer is configured nothing is timed or reported.
+    """
+
+    def on_policy_lookup(
+        self,
+        *,
+        user: AnyUser,
+        resource: str,
+        action: str,
+        sub_action: Optional[str],
+        policy: Optional[AnyPolicy],
+        duration: float,
+    ) -> None:
+        pass
+
+    def on_strategy(
+        self,
+        *,
+        strategy: PolicyStrategy,
+        method: str,
+        context: Context,
+        duration: float,
+        allowed: Optional[int],
+    ) -> None:
+        """
+        ``method`` is the strategy method that ran. ``allowed`` is how many entities it let through (0 or 1 for
+        ``apply_policies_to_entity``) and None for the query methods.
+        """
+        pass
+
+    def on_decision(
+        self,
+        *,
+        method: str,
+        user: AnyUser,
+        resource: str,
+        action: str,
+        sub_action: Optional[str],
+        allowed: int,
+        total: int,
+        duration: float,
+    ) -> None:
+        """
+        ``method`` is the ``Authorization`` method that decided. ``allowed`` out of ``total`` entities passed; single
+        checks report ``total=1``, and query checks report ``allowed=0`` when the resource was denied outright.
+        """
+        pass
@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import pickle
+import tempfile
+from pathlib import Path
+from typing import Any, Optional, Union
+
+from . import __version__
+from .exceptions import PolicyValidationError
+from .policy import Policy, Strategy
+from .policy_set import PolicySet
+from .policy_strategy_builder import StrategyMapper
+from .validation import validate_policies
+
+try:
+    import yaml
+except ImportError:  # pragma: no cover - optional dependency
+    yaml = None  # type: ignore[assignment]
+
+logger = logging.getLogger(__name__)
+
+# Bumped whenever the pickled PolicySet layout changes, so old cache files are ignored.
+CACHE_FORMAT = 1
+
+_YAML_SUFFIXES = {".yaml", ".yml"}
+
+
+def load_policies(
+    path: Union[str, os.PathLike[str]],
+    strategy_mapper: Optional[StrategyMapper] = None,
+    *,
+    cache_dir: Optional[Union[str, os.PathLike[str]]] = None,
+) -> PolicySet:
+    """
+    Loads policies from a JSON or YAML file (YAML requires PyYAML) into a compiled ``PolicySet``.
+
+    When ``strategy_mapper`` is given, every referenced strategy name must exist in it. When ``cache_dir`` is given,
+    the compiled set is pickled there under the SHA-256 of the file content, and later loads of the same content
+    skip parsing and index building. Only point ``cache_dir`` at a directory you trust: cache files are unpickled.
+    """
+    path = Path(path)
+    content = path.read_bytes()
+    cache_file = _cache_file(Path(cache_dir), content) if cache_dir is not None else None
+
+    policy_set = _read_cache(cache_file) if cache_file is not None else None
+    if policy_set is None:
+        policy_set = PolicySet(parse_policies(_decode(path, content)))
+        validate_policies(policy_set.policies)
+        if cache_file is not None:
+            _write_cache(cache_file, policy_set)
+
+    if strategy_mapper is not None:
+        validate_policies(policy_set.policies, strategy_mapper)
+    return policy_set
+
+
+def parse_policies(data: Any) -> list[Policy]:
+    """
+    Builds ``Policy`` objects from decoded JSON/YAML: either a list of policies or ``{"policies": [...]}``.
+    Strategies are written as ``{"name": ..., "args": {...}}`` or just their name.
+    """
+    if isinstance(data, dict):
+        data = data.get("policies")
+    if not isinstance(data, list):
+        raise PolicyValidationError(["expected a list of policies or a mapping with a 'policies' list"])
+
+    policies = []
+    errors = []
+    for position, item in enumerate(data):
+        try:
+            policies.append(_parse_policy(item))
+        except (TypeError, ValueError) as error:
+            errors.append(f"policy #{position}: {error}")
+    if errors:
+        raise PolicyValidationError(errors)
+    return policies
+
+
+def _parse_policy(item: Any) -> Policy:
+    if not isinstance(item, dict):
+        raise ValueError("expected a mapping")
+    fields = dict(item)
+    _check_type(fields, "name", str, "a string")
+    for field in ("resources", "roles", "actions"):
+        if field in fields and not _is_list_of_strings(fields[field]):
+            raise ValueError(f"{field} must be a list of strings, got {fields[field]!r}")
+    _check_type(fields, "sub_action", (str, type(None)), "a string or null")
+    _check_type(fields, "deny", bool, "a boolean")
+    _check_type(fields, "last_rule", bool, "a boolean")
+    for field in ("strategies", "or_strategies"):
+        if fields.get(field) is not None:
+            if not isinstance(fields[field], list):
+                raise ValueError(f"{field} must be a list, got {fields[field]!r}")
+            try:
+                fields[field] = [_parse_strategy(strategy) for strategy in fields[field]]
+            except (TypeError, ValueError) as error:
+                raise ValueError(f"{field}: {error}") from error
+    return Policy(**fields)
+
+
+def _parse_strategy(item: Any) -> Strategy:
+    if isinstance(item, str):
+        return Strategy(name=item)
+    if not isinstance(item, dict):
+        raise ValueError(f"invalid strategy {item!r}")
+    _check_type(item, "name", str, "a string")
+    _check_type(item, "args", (dict, type(None)), "a mapping or null")
+    return Strategy(**item)
+
+
+def _is_list_of_strings(value: Any) -> bool:
+    """A bare string would be indexed one character at a time, so it is rejected rather than wrapped."""
+    return isinstance(value, list) and all(isinstance(element, str) for element in value)
+
+
+def _check_type(fields: dict[str, Any], field: str, expected: Union[type, tuple[type, ...]], description: str) -> None:
+    if field in fields and not isinstance(fields[field], expected):
+        raise ValueError(f"{field} must be {description}, got {fields[field]!r}")
+
+
+def _decode(path: Path, content: bytes) -> Any:
+    if path.suffix.lower() not in _YAML_SUFFIXES:
+        return json.loads(content)
+    if yaml is None:
+        raise ImportError(f"PyYAML is required to load {path}; install py_authorization[yaml]")
+    return yaml.safe_load(content)
+
+
+def _cache_file(cache_dir: Path, content: bytes) -> Path:
+    digest = hashlib.sha256(f"{CACHE_FORMAT}:{__version__}:".encode() + content).hexdigest()
+    return cache_dir / f"policies-{digest}.pickle"
+
+
+def _read_cache(cache_file: Path) -> Optional[PolicySet]:
+    try:
+        with cache_file.open("rb") as file:
+            policy_set = pickle.load(file)
+    except FileNotFoundError:
+        return None
+    except Exception:
+        logger.warning("Ignoring unreadable policy cache %s", cache_file, exc_info=True)
+        return None
+    return policy_set if isinstance(policy_set, PolicySet) else None
+
+
+def _write_cache(cache_file: Path, policy_set: PolicySet) -> None:
+    """Writes through a temporary file and an atomic rename, so concurrent workers never read a partial cache."""
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        descriptor, temporary = tempfile.mkstemp(dir=cache_file.parent, suffix=".tmp")
+    except OSError:
+        logger.warning("Could not write policy cache %s", cache_file, exc_info=True)
+        return
+    try:
+        with os.fdopen(descriptor, "wb") as file:
+            pickle.dump(policy_set, file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temporary, cache_file)
+    except (OSError, pickle.PicklingError):
+        logger.warning("Could not write policy cache %s", cache_file, exc_info=True)
+        os.unlink(temporary)
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import heapq
+from typing import Any, Iterable, NamedTuple, Optional
+
+from .frozen import AnyPolicy
+
+WILDCARD = "*"
+
+_LookupKey = tuple[Any, str, str, Optional[str]]
+
+
+class _CompiledPolicy(NamedTuple):
+    policy: AnyPolicy
+    roles: frozenset[Any]
+    any_role: bool
+    sub_action: Optional[str]
+    last_rule: bool
+
+
+class PolicyIndex:
+    """Policies compiled once into buckets keyed by (action, resource), wildcards included, with roles as frozensets.
+
+    ``find`` returns exactly what a first-match linear scan over ``policies`` would return (including the
+    ``last_rule`` break) and memoizes the answer per (role, resource, action, sub_action), so repeated checks
+    are a single dict lookup.
+    """
+
+    max_cached_lookups = 65536
+
+    def __init__(self, policies: Iterable[AnyPolicy]) -> None:
+        self.policies: tuple[AnyPolicy, ...] = tuple(policies)
+        self._compiled: list[_CompiledPolicy] = []
+        self._buckets: dict[tuple[str, str], list[int]] = {}
+        self._lookups: dict[_LookupKey, Optional[AnyPolicy]] = {}
+
+        for position, policy in enumerate(self.policies):
+            roles = frozenset(policy.roles)
+            self._compiled.append(
+                _CompiledPolicy(
+                    policy=policy,
+                    roles=roles,
+                    any_role=WILDCARD in roles,
+                    sub_action=policy.sub_action,
+                    last_rule=policy.last_rule,
+                )
+            )
+            actions = _bucket_keys(policy.actions)
+            resources = _bucket_keys(r.lower() for r in policy.resources)
+            for action in actions:
+                for resource in resources:
+                    self._buckets.setdefault((action, resource), []).append(position)
+
+    def __len__(self) -> int:
+        return len(self.policies)
+
+    def find(self, role: Any, resource: str, action: str, sub_action: Optional[str]) -> Optional[AnyPolicy]:
+        resource = resource.lower()
+        key = (role, resource, action, sub_action)
+        try:
+            return self._lookups[key]
+        except KeyError:
+            pass
+
+        policy = self._scan(role, resource, action, sub_action)
+        if len(self._lookups) >= self.max_cached_lookups:
+            self._lookups.clear()
+        self._lookups[key] = policy
+        return policy
+
+    def __getstate__(self) -> dict[str, Any]:
+        state = self.__dict__.copy()
+        state["_lookups"] = {}  # memoized answers are cheap to rebuild and can be large
+        return state
+
+    def clear(self) -> None:
+        """Drops memoized lookups; the compiled buckets are kept."""
+        self._lookups.clear()
+
+    def _scan(self, role: Any, resource: str, action: str, sub_action: Optional[str]) -> Optional[AnyPolicy]:
+        buckets = [
+            bucket
+            for bucket in (
+                self._buckets.get((action, resource)),
+                self._buckets.get((action, WILDCARD)),
+                self._buckets.get((WILDCARD, resource)),
+                self._buckets.get((WILDCARD, WILDCARD)),
+            )
+            if bucket
+        ]
+        candidates: Iterable[int] = buckets[0] if len(buckets) == 1 else heapq.merge(*buckets)
+
+        for position in candidates:
+            compiled = self._compiled[position]
+            if compiled.sub_action and sub_action != compiled.sub_action:
+                continue
+            if not compiled.any_role and role not in compiled.roles:
+                if compiled.last_rule:  # last rule for the policy resources
+                    break
+                continue
+            return compiled.policy
+        return None
+
+
+def _bucket_keys(values: Iterable[str]) -> frozenset[str]:
+    keys = frozenset(values)
+    return frozenset([WILDCARD]) if WILDCARD in keys else keys
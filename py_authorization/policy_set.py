@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import hashlib
+import uuid
+from typing import Any, Iterable, Mapping, Optional
+
+from .frozen import AnyPolicy
+from .policy_index import PolicyIndex
+from .utils import stable_repr
+
+
+class PolicySet:
+    """
+    An immutable snapshot of the policies ``Authorization`` evaluates against: the policies, their compiled
+    ``PolicyIndex`` and a version number. Anything derived from the policies (e.g. permission matrices) is cached on
+    the snapshot, so swapping in a new ``PolicySet`` invalidates it all at once.
+    """
+
+    def __init__(self, policies: Iterable[AnyPolicy], version: int = 0, index: Optional[PolicyIndex] = None) -> None:
+        self.index = index if index is not None else PolicyIndex(policies)
+        self.policies = self.index.policies
+        self.version = version
+        self.permissions_matrices: dict[str, Mapping[Any, Any]] = {}
+        self._fingerprint: Optional[str] = None
+
+    def __len__(self) -> int:
+        return len(self.policies)
+
+    def __repr__(self) -> str:
+        return f"PolicySet(version={self.version}, policies={len(self.policies)})"
+
+    def __getstate__(self) -> dict[str, Any]:
+        state = self.__dict__.copy()
+        state["permissions_matrices"] = {}
+        return state
+
+    @property
+    def fingerprint(self) -> str:
+        """
+        SHA-256 of the policies' content, equal in every process loading the same policies (unlike ``version``), used
+        to key shared decision caches. Policies without a stable repr get a fingerprint unique to this snapshot.
+        """
+        if self._fingerprint is None:
+            try:
+                content = stable_repr([_policy_content(policy) for policy in self.policies])
+            except TypeError:
+                content = uuid.uuid4().hex
+            self._fingerprint = hashlib.sha256(content.encode()).hexdigest()
+        return self._fingerprint
+
+    def with_version(self, version: int) -> PolicySet:
+        """Same compiled policies under another version number, with empty derived caches."""
+        policy_set = PolicySet(self.policies, version=version, index=self.index)
+        policy_set._fingerprint = self._fingerprint
+        return policy_set
+
+
+def _policy_content(policy: AnyPolicy) -> tuple[Any, ...]:
+    return (
+        policy.name,
+        frozenset(resource.lower() for resource in policy.resources),
+        frozenset(policy.roles),
+        frozenset(policy.actions),
+        policy.sub_action or None,
+        policy.deny,
+        policy.last_rule,
+        [(strategy.name, strategy.args) for strategy in policy.strategies or ()],
+        [(strategy.name, strategy.args) for strategy in policy.or_strategies or ()],
+    )
@@ -1,6 +1,7 @@
 from typing import Any, Optional, TypeVar
 
 from sqlalchemy.orm.query import Query
+from sqlalchemy.sql.elements import ColumnElement
 
 from py_authorization.context import Context
 
@@ -8,11 +9,43 @@ T = TypeVar("T", bound=object)
 
 
 class PolicyStrategy:
+    # Set to False when instances keep per-call state and must not be shared by a caching PolicyStrategyBuilder.
+    reusable: bool = True
+    # Relative evaluation cost; or_strategies are evaluated cheapest first.
+    cost: int = 100
+    # Outcome hints for strategies that ignore the entity: allows_all passes every entity and leaves queries
+    # unfiltered, denies_all passes nothing. A policy's OR chain is then collapsed without running its branches.
+    allows_all: bool = False
+    denies_all: bool = False
+    # Set to False when entities must not be evaluated concurrently (see Authorization's executor), e.g. because the
+    # strategy lazily loads relationships through a session that isn't thread-safe.
+    parallel_safe: bool = True
+
     def __init__(self, args: dict[str, Any]) -> None:
         self.args = args
 
     def apply_policies_to_entity(self, entity: T, context: Context) -> Optional[T]:
         pass
 
+    def apply_policies_to_entities(self, entities: list[T], context: Context) -> list[Optional[T]]:
+        """
+        Batch variant of ``apply_policies_to_entity``: returns one result per entity, in the same order.
+        Override it to resolve what the strategy needs for the whole batch at once (e.g. a single query).
+        """
+        return [self.apply_policies_to_entity(entity, context) for entity in entities]
+
     def apply_policies_to_query(self, query: Query, context: Context) -> Query:
+        """
+        Filters ``query``, a legacy ``Query`` or a 2.0 style ``select()`` depending on what the caller gave to
+        ``Authorization.apply_policies_to_query``; ``filter()`` and ``join()`` work on both.
+        """
         pass
+
+    def query_criteria(self, entity_cls: Any, context: Context) -> Optional[ColumnElement[bool]]:
+        """
+        SQL criteria on ``entity_cls`` (a mapped class or alias) equivalent to ``apply_policies_to_query``.
+        When implemented, the strategy is merged into the query's single WHERE clause (deduplicated across the
+        queried resources), and OR branches avoid a PK IN (subquery) per branch.
+        Returns None when the strategy only supports ``apply_policies_to_query``.
+        """
+        return None
@@ -1,17 +1,64 @@
-from typing import Callable, Optional, Type
+from typing import Any, Callable, Hashable, Optional, Type
 
-from .policy import Strategy
+from .frozen import AnyStrategy
 from .policy_strategy import PolicyStrategy
+from .utils import freeze
 
 StrategyMapper = dict[str, Type[PolicyStrategy]]
 
 
 class PolicyStrategyBuilder:
-    def __init__(self, strategy_mapper_callable: Callable[[], StrategyMapper]):
+    """
+    Builds ``PolicyStrategy`` instances from ``Strategy`` references.
+
+    With ``cache=True`` the strategy mapper is resolved once (until ``invalidate`` is called) and instances are
+    reused per strategy name and args, unless the strategy class sets ``reusable = False``.
+    """
+
+    def __init__(self, strategy_mapper_callable: Callable[[], StrategyMapper], cache: bool = False):
         self.strategy_mapper_callable = strategy_mapper_callable
+        self.cache = cache
+        self._strategy_mapper: Optional[StrategyMapper] = None
+        self._instances: dict[tuple[str, Hashable], PolicyStrategy] = {}
+
+    def build(self, strategy: AnyStrategy) -> Optional[PolicyStrategy]:
+        if not self.cache:
+            strategy_class = self.strategy_mapper_callable().get(strategy.name)
+            if not strategy_class:
+                return None
+            return strategy_class(_strategy_args(strategy))
+
+        try:
+            key = (strategy.name, freeze(strategy.args))
+        except TypeError:
+            key = None
+        if key is not None:
+            instance = self._instances.get(key)
+            if instance is not None:
+                return instance
 
-    def build(self, strategy: Strategy) -> Optional[PolicyStrategy]:
-        strategy_class = self.strategy_mapper_callable().get(strategy.name)
+        strategy_class = self.strategy_mapper.get(strategy.name)
         if not strategy_class:
             return None
-        return strategy_class(strategy.args if strategy.args else dict())
+        instance = strategy_class(_strategy_args(strategy))
+        if key is not None and strategy_class.reusable:
+            self._instances[key] = instance
+        return instance
+
+    @property
+    def strategy_mapper(self) -> StrategyMapper:
+        if self._strategy_mapper is None:
+            self._strategy_mapper = self.strategy_mapper_callable()
+        return self._strategy_mapper
+
+    def invalidate(self) -> None:
+        """Forgets the resolved strategy mapper and every cached strategy instance."""
+        self._strategy_mapper = None
+        self._instances.clear()
+
+
+def _strategy_args(strategy: AnyStrategy) -> dict[str, Any]:
+    """Strategies get a dict; ``FrozenStrategy`` args (read-only mappings) are copied."""
+    if not strategy.args:
+        return dict()
+    return strategy.args if isinstance(strategy.args, dict) else dict(strategy.args)
@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+import operator
+from typing import Any, Callable, Mapping, NamedTuple, Optional, Sequence, TypeVar
+
+from sqlalchemy import and_
+from sqlalchemy.sql.elements import ColumnElement
+
+from .context import Context
+from .policy_strategy import PolicyStrategy
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None  # type: ignore[assignment]
+
+T = TypeVar("T", bound=object)
+
+_COMPARISONS: dict[str, Callable[[Any, Any], Any]] = {
+    "eq": operator.eq,
+    "ne": operator.ne,
+    "lt": operator.lt,
+    "le": operator.le,
+    "gt": operator.gt,
+    "ge": operator.ge,
+}
+OPERATORS = frozenset([*_COMPARISONS, "in", "not_in", "is_null"])
+
+# NumPy dtype kinds of bool, signed, unsigned and float arrays: they compare like the Python values they hold.
+_NUMERIC_KINDS = "biuf"
+
+# Stands for an attribute the entity doesn't have (e.g. ``is_allowed`` checks without an entity); matches nothing.
+_MISSING = object()
+
+
+class Condition(NamedTuple):
+    """``attribute`` compared by ``op`` with ``value``, or with the value found at the ``context`` path."""
+
+    attribute: str
+    op: str
+    value: Any = None
+    context: Optional[str] = None
+
+    @classmethod
+    def parse(cls, spec: Mapping[str, Any]) -> Condition:
+        unknown = set(spec) - set(cls._fields)
+        if unknown:
+            raise ValueError(f"Unknown predicate condition keys: {sorted(unknown)}")
+        if not isinstance(spec.get("attribute"), str) or not spec["attribute"]:
+            raise ValueError(f"Predicate condition needs an attribute: {dict(spec)}")
+        if "." in spec["attribute"]:
+            raise ValueError(f"Predicate attributes are columns of the entity, not paths: {spec['attribute']!r}")
+        if spec.get("op") not in OPERATORS:
+            raise ValueError(f"Unknown predicate operator {spec.get('op')!r}, expected one of {sorted(OPERATORS)}")
+        condition = cls(**spec)
+        if condition.op in ("in", "not_in") and condition.context is None:
+            return condition._replace(value=tuple(condition.value))
+        return condition
+
+    def target(self, context: Context) -> Any:
+        if self.context is None:
+            return self.value
+        value: Any = context
+        for name in self.context.split("."):
+            if not isinstance(value, Mapping):
+                value = getattr(value, name)
+            elif name in value:
+                value = value[name]
+            else:  # a mistyped path must not compare with None, which matches every NULL attribute
+                raise KeyError(f"Predicate context path {self.context!r} has no key {name!r}")
+        return tuple(value) if self.op in ("in", "not_in") else value
+
+    def matches(self, value: Any, target: Any) -> bool:
+        """SQL semantics: comparing a NULL attribute is false, and comparing with None tests for NULL."""
+        if value is _MISSING:
+            return False
+        if self.op == "is_null":
+            return (value is None) == bool(target)
+        if target is None and self.op in ("eq", "ne"):
+            return (value is None) == (self.op == "eq")
+        if self.op == "not_in" and not target:
+            return True
+        if value is None:
+            return False
+        if self.op == "in":
+            return value in target
+        if self.op == "not_in":
+            return value not in target
+        return bool(_COMPARISONS[self.op](value, target))
+
+    def criteria(self, entity_cls: Any, target: Any) -> ColumnElement[bool]:
+        column = getattr(entity_cls, self.attribute)
+        if self.op == "is_null":
+            return column.is_(None) if target else column.is_not(None)
+        if self.op == "in":
+            return column.in_(target)
+        if self.op == "not_in":
+            return column.not_in(target)
+        return _COMPARISONS[self.op](column, target)  # type: ignore[no-any-return]
+
+    def mask(self, values: list[Any], target: Any) -> list[bool]:
+        """``matches`` over a column of values, as one NumPy operation when possible."""
+        vectorizable = self.op != "is_null" and target is not None and (target or self.op != "not_in")
+        if np is not None and vectorizable:
+            array, target_array = np.asarray(values), np.asarray(target)
+            # Only numbers and bools: NumPy turns mixed values into strings (1 and "1" both become "1").
+            if array.dtype.kind in _NUMERIC_KINDS and target_array.dtype.kind in _NUMERIC_KINDS:
+                try:
+                    return self._numpy_mask(array, target_array)
+                except TypeError:
+                    pass
+        return [self.matches(value, target) for value in values]
+
+    def _numpy_mask(self, array: Any, target: Any) -> list[bool]:
+        if self.op == "in":
+            mask = np.isin(array, target)
+        elif self.op == "not_in":
+            mask = ~np.isin(array, target)
+        else:
+            mask = _COMPARISONS[self.op](array, target)
+        if not isinstance(mask, np.ndarray) or mask.shape != array.shape:
+            raise TypeError("not comparable elementwise")
+        return mask.tolist()  # type: ignore[no-any-return]
+
+
+class AttributePredicateStrategy(PolicyStrategy):
+    """
+    A declarative strategy for plain attribute checks, configured through ``Strategy.args`` instead of code::
+
+        Strategy("Predicate", args={"attribute": "owner_id", "op": "eq", "context": "user.id"})
+        Strategy("Predicate", args={"conditions": [
+            {"attribute": "status", "op": "in", "value": ["draft", "published"]},
+            {"attribute": "deleted_at", "op": "is_null", "value": True},
+        ]})
+
+    Register it in the strategy mapper under any name. Conditions are ANDed. ``op`` is one of ``eq``, ``ne``,
+    ``in``, ``not_in``, ``lt``, ``le``, ``gt``, ``ge`` and ``is_null``. The compared value is ``value``, or the value
+    at the ``context`` path (attributes or mapping keys of the ``Context``, e.g. ``user.id`` or ``args.deal_id``); a
+    path naming a missing key raises ``KeyError`` rather than comparing with None.
+    ``attribute`` names a column of the entity itself; dotted paths such as ``owner.id`` are rejected.
+
+    The same conditions run as SQL criteria (``query_criteria``), per entity, and per batch: a batch reads each
+    attribute once into a column and compares whole numeric columns with NumPy when it is installed. NULL attributes
+    follow SQL semantics, so the three paths agree.
+    """
+
+    cost = 10
+
+    def __init__(self, args: dict[str, Any]) -> None:
+        super().__init__(args)
+        specs: Sequence[Mapping[str, Any]] = args["conditions"] if "conditions" in args else [args]
+        self.conditions = tuple(Condition.parse(spec) for spec in specs)
+        if not self.conditions:
+            raise ValueError("AttributePredicateStrategy needs at least one condition")
+
+    def apply_policies_to_entity(self, entity: T, context: Context) -> Optional[T]:
+        for condition in self.conditions:
+            if not condition.matches(getattr(entity, condition.attribute, _MISSING), condition.target(context)):
+                return None
+        return entity
+
+    def apply_policies_to_entities(self, entities: list[T], context: Context) -> list[Optional[T]]:
+        allowed = [True] * len(entities)
+        for condition in self.conditions:
+            try:
+                values = list(map(operator.attrgetter(condition.attribute), entities))
+            except AttributeError:
+                values = [getattr(entity, condition.attribute, _MISSING) for entity in entities]
+            allowed = [a and m for a, m in zip(allowed, condition.mask(values, condition.target(context)))]
+        return [entity if a else None for entity, a in zip(entities, allowed)]
+
+    def query_criteria(self, entity_cls: Any, context: Context) -> Optional[ColumnElement[bool]]:
+        criteria = [condition.criteria(entity_cls, condition.target(context)) for condition in self.conditions]
+        return criteria[0] if len(criteria) == 1 else and_(*criteria)
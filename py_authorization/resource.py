@@ -0,0 +1,55 @@
+from typing import Any
+from weakref import WeakKeyDictionary
+
+from sqlalchemy import inspect
+
+# Models can set this class attribute to be checked against policies under a resource name other than the class name.
+RESOURCE_ATTRIBUTE = "__authorization_resource__"
+
+_resource_names: dict[type, str] = {}
+_aliased_classes: "WeakKeyDictionary[Any, type]" = WeakKeyDictionary()
+
+
+def resource_name(entity_cls: type) -> str:
+    """Resource name of a model class, resolved once per class."""
+    try:
+        return _resource_names[entity_cls]
+    except KeyError:
+        pass
+    name = str(getattr(entity_cls, RESOURCE_ATTRIBUTE, None) or entity_cls.__name__)
+    _resource_names[entity_cls] = name
+    return name
+
+
+def resource_name_of(entity: object) -> str:
+    """Resource name of a model instance; the SQLAlchemy inspection only runs the first time a class is seen."""
+    entity_type = type(entity)
+    try:
+        return _resource_names[entity_type]
+    except KeyError:
+        pass
+    entity_cls = entity_type
+    if getattr(entity_type, RESOURCE_ATTRIBUTE, None) is None:
+        entity_cls = inspect(entity).class_
+    name = resource_name(entity_cls)
+    _resource_names[entity_type] = name
+    return name
+
+
+def mapped_class(entity: Any) -> Any:
+    """Mapped class behind a class, mapper or aliased class; aliases are resolved once."""
+    if isinstance(entity, type):
+        return entity
+    try:
+        return _aliased_classes[entity]
+    except (KeyError, TypeError):
+        pass
+    insp = inspect(entity, False)
+    if insp is None:
+        return entity
+    entity_cls = insp.class_
+    try:
+        _aliased_classes[entity] = entity_cls
+    except TypeError:
+        pass
+    return entity_cls
@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Iterator, Optional
+
+from sqlalchemy import event, false
+from sqlalchemy.orm import ORMExecuteState, with_loader_criteria
+from sqlalchemy.sql import Select
+
+from .authorization import Authorization
+from .decision import Decision
+from .frozen import AnyUser
+from .resource import mapped_class
+from .sql_parser import all_entities_in_statement, get_column_entities
+
+SKIP_AUTHORIZATION = "skip_authorization"
+
+
+@dataclass
+class _Scope:
+    user: AnyUser
+    action: str
+    sub_action: Optional[str]
+    args: dict[str, Any]
+    decisions: dict[tuple[str, int], Decision] = field(default_factory=dict)
+
+
+class SessionHook:
+    """
+    Applies ``Authorization`` to every ORM SELECT run by the sessions it is installed on, for the user and action
+    bound with ``authorize``, so call sites don't have to call ``apply_policies_to_query``::
+
+        hook = SessionHook(authorization)
+        hook.install(Session)  # a Session class, sessionmaker or session
+        with hook.authorize(user, action="read"):
+            session.execute(select(Deal)).scalars().all()  # only the deals the user can read
+
+    Statements run outside ``authorize`` (e.g. background jobs), inside ``bypass``, or with the
+    ``skip_authorization`` execution option are left unchanged. Column loads (refreshing attributes of rows
+    already loaded) are never filtered; relationship loads are.
+
+    Each queried entity is filtered with ``with_loader_criteria``, so the criteria also reach joins, eager loads and
+    later lazy loads of the entity. Decisions are compiled once per resource within an ``authorize`` block (see
+    ``Authorization.compile_decision``), so after the first statement a resource costs a dict lookup.
+    Strategies that only implement ``apply_policies_to_query`` filter the selected entity through it, and
+    eager loaded relationships of such resources load empty.
+    """
+
+    def __init__(self, authorization: Authorization) -> None:
+        self.authorization = authorization
+        self._scope: ContextVar[Optional[_Scope]] = ContextVar(
+            f"py_authorization_session_hook_{id(self)}", default=None
+        )
+
+    def install(self, target: Any) -> None:
+        """Listens to ``do_orm_execute`` of ``target``: a ``Session`` (sub)class, a ``sessionmaker`` or a session."""
+        event.listen(target, "do_orm_execute", self.on_orm_execute)
+
+    def remove(self, target: Any) -> None:
+        event.remove(target, "do_orm_execute", self.on_orm_execute)
+
+    @contextmanager
+    def authorize(
+        self,
+        user: AnyUser,
+        action: Optional[str] = None,
+        sub_action: Optional[str] = None,
+        args: Optional[dict[str, Any]] = None,
+    ) -> Iterator[None]:
+        """Filters the statements run inside the block (bound to the current thread or task) for ``user``."""
+        scope = _Scope(user, action or self.authorization.default_action, sub_action, args or dict())
+        token = self._scope.set(scope)
+        try:
+            yield
+        finally:
+            self._scope.reset(token)
+
+    @contextmanager
+    def bypass(self) -> Iterator[None]:
+        """Runs the block's statements unfiltered, e.g. to load what a strategy needs to decide."""
+        token = self._scope.set(None)
+        try:
+            yield
+        finally:
+            self._scope.reset(token)
+
+    def on_orm_execute(self, orm_execute_state: ORMExecuteState) -> None:
+        scope = self._scope.get()
+        if (
+            scope is None
+            or not orm_execute_state.is_select
+            or orm_execute_state.is_column_load
+            or orm_execute_state.execution_options.get(SKIP_AUTHORIZATION, False)
+            or not isinstance(orm_execute_state.statement, Select)
+        ):
+            return
+        orm_execute_state.statement = self.apply(orm_execute_state.statement, scope)
+
+    def apply(self, statement: Select, scope: _Scope) -> Select:
+        """``statement`` filtered for ``scope``; selected resources without criteria fall back to their query filter."""
+        selected = {mapped_class(entity) for entity in get_column_entities(statement)}
+        options = []
+        for resource, entity_cls in all_entities_in_statement(statement).items():
+            decision = self._decision(scope, resource)
+            if decision.allowed:
+                continue
+            criteria = decision.criteria(entity_cls)
+            if criteria is None and entity_cls in selected:
+                statement = decision.apply_to_query(statement)
+                continue
+            if criteria is None:
+                criteria = false()
+            options.append(with_loader_criteria(entity_cls, criteria, include_aliases=True))
+        return statement.options(*options) if options else statement
+
+    def _decision(self, scope: _Scope, resource: str) -> Decision:
+        key = (resource, self.authorization.policy_version)
+        decision = scope.decisions.get(key)
+        if decision is None:
+            decision = self.authorization.compile_decision(
+                user=scope.user, resource=resource, action=scope.action, sub_action=scope.sub_action, args=scope.args
+            )
+            scope.decisions[key] = decision
+        return decision
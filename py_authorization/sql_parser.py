@@ -1,16 +1,24 @@
+from typing import Any, Iterable, Iterator
+
 import sqlalchemy
-from sqlalchemy import inspect
-from sqlalchemy.orm.util import AliasedClass
+from sqlalchemy import event
+from sqlalchemy.orm import Mapper, RelationshipProperty
+
+from .resource import mapped_class, resource_name
+
+# Mapper -> mappers loaded with it by ``lazy="joined"`` relationships, transitively; reset whenever mappers
+# (re)configure, since new relationships (e.g. backrefs) can appear then.
+_default_joined_mappers: dict[Any, frozenset[Any]] = {}
+
+
+@event.listens_for(Mapper, "after_configured")
+def _clear_default_joined_mappers() -> None:
+    _default_joined_mappers.clear()
 
 
 def to_class(entity):  # type: ignore
     """Get mapped class from SQLAlchemy entity."""
-    if isinstance(entity, AliasedClass):
-        return inspect(entity).class_
-    elif inspect(entity, False) is not None:
-        return inspect(entity).class_
-    else:
-        return entity
+    return mapped_class(entity)
 
 
 def get_column_entity_with_attribute(statement, attribute):  # type: ignore
@@ -34,12 +42,16 @@ def all_entities_in_statement(statement):  # type: ignore
 
     https://docs.sqlalchemy.org/en/14/orm/loading_relationships.html#relationship-loading-with-loader-options
     """
-    entities = get_column_entities(statement)
-    # entities |= get_joinedload_entities(statement)
-    # entities |= default_load_entities(entities)
+    entities = set(map(to_class, get_column_entities(statement)))
+    entities |= eager_load_entities(statement)
+    return {resource_name(a): a for a in entities}
+
 
-    resp = set(map(to_class, entities))
-    return {a.__name__: a for a in resp}
+def eager_load_entities(statement):  # type: ignore
+    """Mapped classes loaded in ``statement`` through joined eager loading, by option or by default."""
+    mappers = get_joinedload_entities(statement)
+    mappers |= default_load_entities(get_column_entities(statement) | mappers)
+    return set(map(to_class, mappers))
 
 
 def get_column_entities(statement):  # type: ignore
@@ -78,39 +90,38 @@ def default_load_entities(entities):  # type: ignore
     The relationship ``bs`` would be loaded eagerly whenever ``A`` is queried because
     `lazy="joined"`.
 
+    The closure is memoized per mapper, so this is a dict lookup per entity once warm.
+
     :param entities: The entities to lookup default load entities for.
     """
-    default_entities = set()
+    default_entities: set[Any] = set()
 
     for entity in entities:
-        mapper = sqlalchemy.inspect(entity)
-        # If the entity is an alias, get the mapper for the underlying entity.
-        if isinstance(mapper, sqlalchemy.orm.util.AliasedInsp):
-            mapper = mapper.mapper
-
-        relationships = mapper.relationships
-        for rel in relationships.values():
-            # We only detect `"joined"` here because `"selectin"` and `"subquery"`
-            # issue multiple queries that we capture in the `do_orm_execute` event
-            # handler.
-            if rel.lazy == "joined":
-                default_entities |= default_load_entities([rel.mapper])
-                default_entities.add(rel.mapper)
+        mapper = sqlalchemy.inspect(entity).mapper  # the mapper of a class, mapper or alias
+        try:
+            default_entities |= _default_joined_mappers[mapper]
+        except KeyError:
+            joined = _default_joined_closure(mapper)
+            _default_joined_mappers[mapper] = joined
+            default_entities |= joined
 
     return default_entities
 
 
-# Start POC code from @zzzeek (Mike Bayer)
-# TODO: Still needs to be generalized & support other options.
+def _default_joined_closure(mapper: Any) -> frozenset[Any]:
+    """Mappers reachable from ``mapper`` through ``lazy="joined"`` relationships, cycles included only once."""
+    joined: set[Any] = set()
+    pending = [mapper]
+    while pending:
+        for rel in pending.pop().relationships.values():
+            # We only detect `"joined"` here because `"selectin"` and `"subquery"`
+            # issue separate queries, which `SessionHook` filters in `do_orm_execute`.
+            if rel.lazy == "joined" and rel.mapper not in joined:
+                joined.add(rel.mapper)
+                pending.append(rel.mapper)
+    return frozenset(joined)
 
-# the structure we're dealing with is essentially:
 
-# (path, strategy, options)
-# where "path" indicates what it is we are loading,
-# like (A, A.bs, B, B.cs, C)
-# "strategy" is a tuple that keys to one of the loader strategies,
-# some of them apply to relationships and others to column attributes
-# then "options" is extra stuff like "innerjoin=True"
 def get_joinedload_entities(stmt):  # type: ignore
     """Get extra entities that are loaded from a ``stmt`` due to joinedload
     options specified in the statement options.
@@ -120,37 +131,42 @@ def get_joinedload_entities(stmt):  # type: ignore
 
     For example::
 
-        get_joinedload_entities(query(A).options(joinedload(A.bs))) == {A, B}
-    """
-    # there are two kinds of options that both represent the same information,
-    # just in different ways.  This is largely a product of legacy options
-    # that have things like strings, i.e. joinedload("addresses").  note we
-    # aren't covering that here, which is legacy form.  you can if you want
-    # raise an exception if you detect that form here.
+        get_joinedload_entities(query(A).options(joinedload(A.bs))) == {B}
 
+    Handles the option structures of SQLAlchemy 1.4 (``_UnboundLoad`` and ``Load``) and 2.0 (``Load`` holding
+    load elements). Legacy string paths (``joinedload("bs")``) and wildcards are not followed.
+    """
     entities = set()
 
-    for opt in stmt._with_options:
-        if hasattr(opt, "_to_bind"):
-            # these options are called _UnboundLoad
-            for b in opt._to_bind:
-                if ("lazy", "joined") in b.strategy:
-                    # the "path" is a tuple showing the entity/relationships
-                    # being targeted
-
-                    # TODO check for wild card.
-                    # TODO: Check whether entity is a string.
-                    entities.add(b.path[-1].entity)
-        elif hasattr(opt, "context"):
-            # these options are called Load
-            for key, loadopt in opt.context.items():
-                if key[0] == "loader" and ("lazy", "joined") in loadopt.strategy:
-                    # the "path" is a tuple showing the entity/relationships
-                    # being targeted
-
-                    # TODO: Check for of_type.
-                    # TODO: Check whether entity is a string, unsupported.
-                    # TODO check for wild card.
-                    entities.add(key[1][-1].entity)
+    for strategy, path in _loader_paths(getattr(stmt, "_with_options", ())):
+        if strategy and ("lazy", "joined") in strategy:
+            relationship = _last_relationship(path)
+            if relationship is not None:
+                entities.add(relationship.mapper)
 
     return entities
+
+
+def _loader_paths(options: Iterable[Any]) -> Iterator[tuple[Any, tuple[Any, ...]]]:
+    """(strategy, path) of every loader option; a path is a tuple of mappers and relationship attributes."""
+    for opt in options:
+        if hasattr(opt, "_to_bind"):  # 1.4 _UnboundLoad, e.g. joinedload(A.bs)
+            for bound in opt._to_bind:
+                yield bound.strategy, tuple(bound.path)
+            continue
+        context = getattr(opt, "context", None)
+        if isinstance(context, dict):  # 1.4 Load, e.g. Load(A).joinedload(A.bs)
+            for key, loadopt in context.items():
+                if key[0] == "loader":
+                    yield loadopt.strategy, tuple(key[1])
+        elif context is not None:  # 2.0 Load
+            for element in context:
+                yield element.strategy, tuple(element.path.path)
+
+
+def _last_relationship(path: tuple[Any, ...]) -> Any:
+    for element in reversed(path):
+        prop = getattr(element, "property", element)  # attributes (A.bs) wrap their property
+        if isinstance(prop, RelationshipProperty):
+            return prop
+    return None
@@ -0,0 +1,33 @@
+from typing import Any, Hashable, Mapping
+
+
+def freeze(value: Any) -> Hashable:
+    """Turns nested mappings, lists and sets into an equivalent hashable value, used to build cache keys.
+
+    Raises ``TypeError`` when a leaf value is not hashable.
+    """
+    if isinstance(value, Mapping):
+        return tuple(sorted(((k, freeze(v)) for k, v in value.items()), key=lambda item: repr(item[0])))
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(v) for v in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(freeze(v) for v in value)
+    hashable: Hashable = value
+    hash(hashable)
+    return hashable
+
+
+def stable_repr(value: Any) -> str:
+    """A repr equal in every process for equal values (set and mapping items sorted), used to key shared caches.
+
+    Raises ``TypeError`` for values with the default, address based, repr.
+    """
+    if isinstance(value, Mapping):
+        return "{" + ", ".join(sorted(f"{stable_repr(k)}: {stable_repr(v)}" for k, v in value.items())) + "}"
+    if isinstance(value, (list, tuple)):
+        return "(" + ", ".join(stable_repr(v) for v in value) + ")"
+    if isinstance(value, (set, frozenset)):
+        return "set(" + ", ".join(sorted(stable_repr(v) for v in value)) + ")"
+    if type(value).__repr__ is object.__repr__:  # type: ignore[comparison-overlap]
+        raise TypeError(f"{type(value).__name__} has no stable repr")
+    return repr(value)
@@ -0,0 +1,25 @@
+from typing import Iterable, Optional
+
+from .exceptions import PolicyValidationError
+from .frozen import AnyPolicy
+from .policy_strategy_builder import StrategyMapper
+
+
+def validate_policies(policies: Iterable[AnyPolicy], strategy_mapper: Optional[StrategyMapper] = None) -> None:
+    """
+    Checks that every policy names at least one resource, role and action, and, when ``strategy_mapper`` is given,
+    that every strategy it references exists. Raises ``PolicyValidationError`` listing every problem found.
+    """
+    errors = []
+    for position, policy in enumerate(policies):
+        label = f"policy #{position} ({policy.name!r})"
+        for field in ("resources", "roles", "actions"):
+            if not getattr(policy, field):
+                errors.append(f"{label} has no {field}")
+        if strategy_mapper is None:
+            continue
+        for strategy in [*(policy.strategies or []), *(policy.or_strategies or [])]:
+            if strategy.name not in strategy_mapper:
+                errors.append(f"{label} references unknown strategy {strategy.name!r}")
+    if errors:
+        raise PolicyValidationError(errors)
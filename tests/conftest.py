@@ -1,4 +1,29 @@
 import os
 import sys
 
+import pytest
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../")))
+
+from tests.models import Comment, Deal, make_session  # noqa: E402
+
+
+@pytest.fixture
+def session() -> Session:
+    """Deals 1 and 4 belong to user 1, deals 2 and 3 to user 2; users 1 and 2 commented on deal 1, user 2 on deal 2."""
+    return make_session(
+        Deal(id=1, owner_id=1, status="draft", comments=[Comment(id=1, author_id=1), Comment(id=2, author_id=2)]),
+        Deal(id=2, owner_id=2, status="published", comments=[Comment(id=3, author_id=2)]),
+        Deal(id=3, owner_id=2, status="draft"),
+        Deal(id=4, owner_id=1, status="closed"),
+    )
+
+
+@pytest.fixture
+def statements(session: Session) -> list[str]:
+    """The SQL ``session`` runs during the test."""
+    statements: list[str] = []
+    event.listen(session.get_bind(), "before_cursor_execute", lambda *args: statements.append(args[2]))
+    return statements
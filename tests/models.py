@@ -0,0 +1,60 @@
+from typing import Any, Optional, TypeVar
+
+from sqlalchemy import Column, ForeignKey, Integer, String, create_engine
+from sqlalchemy.orm import Session, declarative_base, relationship
+from sqlalchemy.sql.elements import ColumnElement
+
+from py_authorization import Context, PolicyStrategy
+
+T = TypeVar("T", bound=object)
+
+Base = declarative_base()
+
+
+class Deal(Base):  # type: ignore
+    __tablename__ = "deals"
+    id = Column(Integer, primary_key=True)
+    owner_id = Column(Integer, index=True)
+    status = Column(String)
+    score = Column(Integer)
+    comments = relationship("Comment", back_populates="deal")
+
+
+class Comment(Base):  # type: ignore
+    __tablename__ = "comments"
+    id = Column(Integer, primary_key=True)
+    deal_id = Column(ForeignKey("deals.id"))
+    author_id = Column(Integer)
+    deal = relationship(Deal, back_populates="comments")
+    reactions = relationship("Reaction", lazy="joined", back_populates="comment")
+
+
+class Reaction(Base):  # type: ignore
+    """Joined both ways with ``Comment``, so loading either one eager loads the other by default."""
+
+    __tablename__ = "reactions"
+    id = Column(Integer, primary_key=True)
+    comment_id = Column(ForeignKey("comments.id"))
+    comment = relationship(Comment, lazy="joined", back_populates="reactions")
+
+
+class OwnerStrategy(PolicyStrategy):
+    criteria_calls = 0
+
+    def apply_policies_to_entity(self, entity: T, context: Context) -> Optional[T]:
+        return entity if entity.owner_id == context.user.id else None  # type: ignore[attr-defined]
+
+    def query_criteria(self, entity_cls: Any, context: Context) -> Optional[ColumnElement[bool]]:
+        OwnerStrategy.criteria_calls += 1
+        return entity_cls.owner_id == context.user.id  # type: ignore
+
+
+def make_session(*rows: Any) -> Session:
+    """A session on a new in-memory database holding ``rows``, expunged so every test starts from the database."""
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    session = Session(engine)
+    session.add_all(rows)
+    session.commit()
+    session.expunge_all()
+    return session
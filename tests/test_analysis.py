@@ -0,0 +1,128 @@
+import itertools
+import random
+from unittest.mock import Mock
+
+from assertpy import assert_that
+
+from py_authorization import (
+    Authorization,
+    Policy,
+    Strategy,
+    analyze_policies,
+    prune_policies,
+)
+from py_authorization.analysis import DUPLICATE, SHADOWED, UNREACHABLE
+from py_authorization.policy_index import PolicyIndex
+from py_authorization.user import User
+
+read_deals = Policy(name="Read deals", resources=["Deal"], roles=["viewer"], actions=["read"])
+
+
+def test_duplicate_policy_is_reported_and_pruned() -> None:
+    duplicate = Policy(name="Read deals again", resources=["deal"], roles=["viewer"], actions=["read"])
+
+    findings = analyze_policies([read_deals, duplicate])
+
+    assert_that(findings).is_length(1)
+    assert_that(findings[0].kind).is_equal_to(DUPLICATE)
+    assert_that(findings[0].cause).is_same_as(read_deals)
+    assert_that(str(findings[0])).is_equal_to("policy #1 ('Read deals again') is duplicate by policy #0 ('Read deals')")
+    assert_that(prune_policies([read_deals, duplicate])).is_equal_to([read_deals])
+
+
+def test_policy_covered_by_wildcards_is_shadowed() -> None:
+    everything = Policy(name="Admin", resources=["*"], roles=["admin", "viewer"], actions=["*"])
+    owned = Policy(
+        name="Owned deals", resources=["Deal"], roles=["viewer"], actions=["read"], strategies=[Strategy("Owner")]
+    )
+
+    findings = analyze_policies([everything, owned])
+
+    assert_that([finding.kind for finding in findings]).is_equal_to([SHADOWED])
+    assert_that(findings[0].prunable).is_true()
+
+
+def test_policy_narrower_than_a_later_one_is_kept() -> None:
+    assert_that(
+        analyze_policies([read_deals, Policy(name="All", resources=["*"], roles=["*"], actions=["*"])])
+    ).is_empty()
+
+
+def test_last_rule_makes_later_policies_unreachable_whatever_their_roles() -> None:
+    last = Policy(name="Only viewers", resources=["Deal"], roles=["viewer"], actions=["read"], last_rule=True)
+    admins = Policy(name="Admins", resources=["Deal"], roles=["admin"], actions=["read"])
+    empty = Policy(name="Empty", resources=[], roles=["admin"], actions=["read"])
+
+    findings = analyze_policies([last, admins, empty])
+
+    assert_that([(finding.kind, finding.cause) for finding in findings]).is_equal_to(
+        [(UNREACHABLE, last), (UNREACHABLE, None)]
+    )
+
+
+def test_shadowed_last_rule_policy_is_kept_when_it_still_stops_the_scan() -> None:
+    stopper = Policy(name="Stop", resources=["Deal"], roles=["viewer"], actions=["read"], last_rule=True)
+
+    findings = analyze_policies([read_deals, stopper])
+
+    assert_that(findings[0].kind).is_equal_to(SHADOWED)
+    assert_that(findings[0].prunable).is_false()
+    assert_that(prune_policies([read_deals, stopper])).is_length(2)
+
+
+def test_last_rule_policy_without_roles_is_kept_as_a_barrier() -> None:
+    barrier = Policy(name="Barrier", resources=["Deal"], roles=[], actions=["read"], last_rule=True)
+    everything = Policy(name="All", resources=["*"], roles=["*"], actions=["*"])
+    user = User(role="viewer", id=1)
+
+    findings = analyze_policies([barrier, everything])
+    auth = Authorization(policies=[barrier, everything], strategy_mapper_callable=Mock(), prune_policies=True)
+
+    assert_that([(finding.kind, finding.prunable) for finding in findings]).is_equal_to([(UNREACHABLE, False)])
+    assert_that(prune_policies([barrier, everything])).is_equal_to([barrier, everything])
+    assert_that(auth.is_allowed(user=user, action="read", resource="Deal")).is_false()
+
+
+def test_sub_action_policy_does_not_cover_a_policy_without_one() -> None:
+    with_sub_action = Policy(name="Comments", resources=["Deal"], roles=["viewer"], actions=["read"], sub_action="c")
+
+    assert_that(analyze_policies([with_sub_action, read_deals])).is_empty()
+    assert_that(analyze_policies([read_deals, with_sub_action])[0].kind).is_equal_to(SHADOWED)
+
+
+def test_pruned_policies_answer_every_lookup_the_same() -> None:
+    rng = random.Random(7)
+    roles, resources, actions, sub_actions = ["a", "b", "*"], ["Deal", "Form", "*"], ["read", "edit", "*"], [None, "x"]
+
+    for _ in range(200):
+        policies = [
+            Policy(
+                name=str(position),
+                resources=rng.sample(resources, rng.randint(0, 2)),
+                roles=rng.sample(roles, rng.randint(0, 2)),
+                actions=rng.sample(actions, rng.randint(1, 2)),
+                sub_action=rng.choice(sub_actions),
+                last_rule=rng.random() < 0.3,
+            )
+            for position in range(rng.randint(1, 8))
+        ]
+        original, pruned = PolicyIndex(policies), PolicyIndex(prune_policies(policies))
+
+        for role, resource, action, sub_action in itertools.product(
+            ["a", "b"], ["Deal", "Form"], ["read", "edit"], sub_actions
+        ):
+            assert_that(pruned.find(role, resource, action, sub_action)).is_same_as(
+                original.find(role, resource, action, sub_action)
+            )
+
+
+def test_authorization_prunes_policies_when_asked() -> None:
+    mapper = Mock(return_value={})
+    auth = Authorization(policies=[read_deals, read_deals], strategy_mapper_callable=mapper, prune_policies=True)
+
+    assert_that(auth.policies).is_equal_to((read_deals,))
+    assert_that(auth.is_allowed(user=User(role="viewer", id=1), action="read", resource="Deal")).is_true()
+
+    auth.replace_policies([read_deals, read_deals])
+
+    assert_that(auth.policies).is_length(1)
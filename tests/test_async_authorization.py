@@ -0,0 +1,212 @@
+import asyncio
+import warnings
+from typing import AsyncIterator, Optional, TypeVar, cast
+from unittest.mock import Mock
+
+import pytest
+from assertpy import assert_that
+
+from py_authorization import (
+    AsyncAuthorization,
+    AsyncDecision,
+    AsyncPolicyStrategy,
+    Authorization,
+    Context,
+    Policy,
+    PolicyStrategy,
+    Strategy,
+    StrategyMapper,
+)
+from py_authorization.user import User
+
+T = TypeVar("T", bound=object)
+
+
+class SlowDenyStrategy(AsyncPolicyStrategy):
+    cancelled = False
+
+    async def apply_policies_to_entity(self, entity: T, context: Context) -> Optional[T]:  # type: ignore[override]
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            SlowDenyStrategy.cancelled = True
+            raise
+        return None
+
+
+class AsyncEvenIdStrategy(AsyncPolicyStrategy):
+    async def apply_policies_to_entity(self, entity: T, context: Context) -> Optional[T]:  # type: ignore[override]
+        await asyncio.sleep(0)
+        return entity if cast(Mock, entity).id % 2 == 0 else None
+
+
+class SyncPassStrategy(PolicyStrategy):
+    def apply_policies_to_entity(self, entity: T, context: Context) -> Optional[T]:
+        return entity
+
+
+class AsyncFailStrategy(AsyncPolicyStrategy):
+    async def apply_policies_to_entity(self, entity: T, context: Context) -> Optional[T]:  # type: ignore[override]
+        return None
+
+
+STRATEGY_MAPPER: StrategyMapper = {
+    "SlowDeny": SlowDenyStrategy,
+    "AsyncEvenId": AsyncEvenIdStrategy,
+    "SyncPass": SyncPassStrategy,
+    "AsyncFail": AsyncFailStrategy,
+}
+
+
+def _make_auth(strategies: Optional[list[str]] = None, or_strategies: Optional[list[str]] = None) -> AsyncAuthorization:
+    policy = Policy(
+        name="Async",
+        resources=["Form"],
+        roles=["viewer"],
+        actions=["read"],
+        strategies=[Strategy(name) for name in strategies] if strategies else None,
+        or_strategies=[Strategy(name) for name in or_strategies] if or_strategies else None,
+    )
+    return AsyncAuthorization(policies=[policy], strategy_mapper_callable=Mock(return_value=STRATEGY_MAPPER))
+
+
+def _user() -> User:
+    return User(role="viewer", id=1)
+
+
+def test_async_is_allowed_awaits_strategies() -> None:
+    auth = _make_auth(strategies=["SyncPass"], or_strategies=["AsyncFail", "SyncPass"])
+
+    assert_that(asyncio.run(auth.is_allowed(user=_user(), action="read", resource="Form"))).is_true()
+    assert_that(asyncio.run(auth.is_allowed(user=_user(), action="read", resource="Deal"))).is_false()
+
+
+def test_async_or_strategies_stop_at_first_success() -> None:
+    SlowDenyStrategy.cancelled = False
+    auth = _make_auth(or_strategies=["SlowDeny", "AsyncEvenId"])
+    entity = Mock(id=2)
+
+    result = asyncio.run(
+        asyncio.wait_for(
+            auth.apply_policies_to_one(user=_user(), entity=entity, resource_to_check="Form", action="read"), 1
+        )
+    )
+
+    assert_that(result).is_equal_to(entity)
+    assert_that(SlowDenyStrategy.cancelled).is_true()
+
+
+def test_async_and_strategy_denies_entity() -> None:
+    auth = _make_auth(strategies=["AsyncEvenId"])
+
+    allowed = asyncio.run(auth.is_entity_allowed(user=_user(), entity=Mock(id=2), resource="Form", action="read"))
+    denied = asyncio.run(auth.is_entity_allowed(user=_user(), entity=Mock(id=1), resource="Form", action="read"))
+
+    assert_that(allowed).is_true()
+    assert_that(denied).is_false()
+
+
+def test_async_apply_to_many_mixes_sync_and_async_strategies() -> None:
+    auth = _make_auth(strategies=["SyncPass"], or_strategies=["AsyncFail", "AsyncEvenId"])
+    entities = [Mock(id=i) for i in range(5)]
+
+    result = asyncio.run(
+        auth.apply_policies_to_many(user=_user(), entities=entities, resource_to_check="Form", action="read")
+    )
+
+    assert_that(result).is_equal_to([entities[0], entities[2], entities[4]])
+
+
+def test_async_iter_policies_to_many_accepts_async_iterables() -> None:
+    auth = _make_auth(strategies=["AsyncEvenId"])
+    entities = [Mock(id=i) for i in range(5)]
+
+    async def stream() -> AsyncIterator[Mock]:
+        for entity in entities:
+            yield entity
+
+    async def collect() -> list[Mock]:
+        iterator = auth.iter_policies_to_many(
+            user=_user(), entities=stream(), resource_to_check="Form", action="read", chunk_size=2
+        )
+        return [entity async for entity in iterator]
+
+    assert_that(asyncio.run(collect())).is_equal_to([entities[0], entities[2], entities[4]])
+
+
+def test_async_decision_awaits_entity_strategies() -> None:
+    auth = _make_auth(strategies=["AsyncEvenId"])
+    decision = auth.compile_decision(user=_user(), resource="Form", action="read")
+    allowed, denied = Mock(id=2), Mock(id=1)
+
+    assert_that(decision).is_instance_of(AsyncDecision)
+    assert_that(decision.allowed).is_none()
+    assert_that(asyncio.run(decision.apply_to_entity(allowed))).is_same_as(allowed)
+    assert_that(asyncio.run(decision.apply_to_entity(denied))).is_none()
+
+
+def test_async_decision_awaits_or_strategies_for_many_entities() -> None:
+    auth = _make_auth(strategies=["SyncPass"], or_strategies=["AsyncFail", "AsyncEvenId"])
+    decision = auth.compile_decision(user=_user(), resource="Form", action="read")
+    entities = [Mock(id=i) for i in range(5)]
+
+    assert_that(asyncio.run(decision.apply_to_entities(entities))).is_equal_to([entities[0], entities[2], entities[4]])
+    assert_that(asyncio.run(decision.apply_to_entities([]))).is_empty()
+
+
+def test_async_decision_for_denied_resource() -> None:
+    decision = _make_auth(strategies=["AsyncEvenId"]).compile_decision(user=_user(), resource="Deal", action="read")
+
+    assert_that(decision.allowed).is_false()
+    assert_that(asyncio.run(decision.apply_to_entity(Mock(id=2)))).is_none()
+    assert_that(asyncio.run(decision.apply_to_entities([Mock(id=2)]))).is_empty()
+
+
+def test_sync_authorization_rejects_async_strategies() -> None:
+    policy = Policy(
+        name="Async",
+        resources=["Form"],
+        roles=["viewer"],
+        actions=["read"],
+        strategies=[Strategy("AsyncFail")],
+        or_strategies=[Strategy("AsyncFail")],
+    )
+    auth = Authorization(policies=[policy], strategy_mapper_callable=Mock(return_value=STRATEGY_MAPPER))
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")  # rejected before any coroutine is created
+        with pytest.raises(TypeError, match="AsyncFailStrategy.apply_policies_to_entity"):
+            auth.is_allowed(user=_user(), action="read", resource="Form")
+        with pytest.raises(TypeError, match="AsyncFailStrategy.apply_policies_to_entity"):
+            auth.apply_policies_to_one(user=_user(), entity=Mock(id=2), resource_to_check="Form", action="read")
+        with pytest.raises(TypeError, match="AsyncFailStrategy.apply_policies_to_entities"):
+            auth.apply_policies_to_many(user=_user(), entities=[Mock(id=2)], resource_to_check="Form", action="read")
+
+
+class CoroutineEntityStrategy(PolicyStrategy):
+    async def apply_policies_to_entity(self, entity: T, context: Context) -> Optional[T]:  # type: ignore[override]
+        return entity
+
+
+class CoroutineEntityBatchStrategy(CoroutineEntityStrategy):
+    def apply_policies_to_entities(self, entities: list[T], context: Context) -> list[Optional[T]]:
+        return list(entities)
+
+
+def test_sync_authorization_checks_each_entity_method_of_a_strategy_class() -> None:
+    policy = Policy(name="Sync", resources=["Form"], roles=["viewer"], actions=["read"], strategies=[Strategy("S")])
+    entities = [Mock(id=1), Mock(id=2)]
+
+    def auth(strategy_class: type[PolicyStrategy]) -> Authorization:
+        return Authorization(policies=[policy], strategy_mapper_callable=Mock(return_value={"S": strategy_class}))
+
+    with pytest.raises(TypeError, match="CoroutineEntityStrategy.apply_policies_to_entities"):
+        auth(CoroutineEntityStrategy).apply_policies_to_many(
+            user=_user(), entities=entities, resource_to_check="Form", action="read"
+        )
+    batch_auth = auth(CoroutineEntityBatchStrategy)
+    assert_that(
+        batch_auth.apply_policies_to_many(user=_user(), entities=entities, resource_to_check="Form", action="read")
+    ).is_equal_to(entities)
+    with pytest.raises(TypeError, match="CoroutineEntityBatchStrategy.apply_policies_to_entity"):
+        batch_auth.apply_policies_to_one(user=_user(), entity=entities[0], resource_to_check="Form", action="read")
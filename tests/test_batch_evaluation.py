@@ -0,0 +1,127 @@
+from typing import Optional, TypeVar, cast
+from unittest.mock import Mock
+
+from assertpy import assert_that
+from sqlalchemy import Column, Integer
+from sqlalchemy.orm import declarative_base
+
+from py_authorization import (
+    Authorization,
+    Context,
+    Policy,
+    PolicyStrategy,
+    Strategy,
+    StrategyMapper,
+)
+from py_authorization.user import User
+
+T = TypeVar("T", bound=object)
+
+Base = declarative_base()
+
+
+class Form(Base):  # type: ignore
+    __tablename__ = "forms"
+    id = Column(Integer, primary_key=True)
+
+
+class Deal(Base):  # type: ignore
+    __tablename__ = "deals"
+    id = Column(Integer, primary_key=True)
+
+
+class BatchEvenIdStrategy(PolicyStrategy):
+    batches: list[list[object]] = []
+
+    def apply_policies_to_entity(self, entity: T, context: Context) -> Optional[T]:
+        raise AssertionError("batch hook should be used")
+
+    def apply_policies_to_entities(self, entities: list[T], context: Context) -> list[Optional[T]]:
+        BatchEvenIdStrategy.batches.append(list(entities))
+        return [e if cast(Mock, e).id % 2 == 0 else None for e in entities]
+
+
+class OddIdStrategy(PolicyStrategy):
+    def apply_policies_to_entity(self, entity: T, context: Context) -> Optional[T]:
+        return entity if cast(Mock, entity).id % 2 == 1 else None
+
+
+class AlwaysFailStrategy(PolicyStrategy):
+    def apply_policies_to_entity(self, entity: T, context: Context) -> Optional[T]:
+        return None
+
+
+STRATEGY_MAPPER: StrategyMapper = {
+    "BatchEvenId": BatchEvenIdStrategy,
+    "OddId": OddIdStrategy,
+    "AlwaysFail": AlwaysFailStrategy,
+}
+
+
+def _make_auth(policies: list[Policy]) -> Authorization:
+    return Authorization(policies=policies, strategy_mapper_callable=Mock(return_value=STRATEGY_MAPPER))
+
+
+def _user() -> User:
+    return User(role="viewer", id=1)
+
+
+def test_apply_to_many_calls_batch_hook_once_per_group() -> None:
+    BatchEvenIdStrategy.batches = []
+    policy = Policy(
+        name="Batch",
+        resources=["Form"],
+        roles=["viewer"],
+        actions=["read"],
+        strategies=[Strategy("BatchEvenId")],
+    )
+    entities = [Mock(id=i) for i in range(6)]
+
+    result = _make_auth([policy]).apply_policies_to_many(
+        user=_user(), entities=entities, resource_to_check="Form", action="read"
+    )
+
+    assert_that(result).is_equal_to([entities[0], entities[2], entities[4]])
+    assert_that(BatchEvenIdStrategy.batches).is_length(1)
+
+
+def test_apply_to_many_falls_back_to_per_entity_strategies() -> None:
+    policy = Policy(name="Odd", resources=["Form"], roles=["viewer"], actions=["read"], strategies=[Strategy("OddId")])
+    entities = [Mock(id=i) for i in range(4)]
+
+    result = _make_auth([policy]).apply_policies_to_many(
+        user=_user(), entities=entities, resource_to_check="Form", action="read"
+    )
+
+    assert_that(result).is_equal_to([entities[1], entities[3]])
+
+
+def test_apply_to_many_or_strategies_only_see_entities_still_denied() -> None:
+    BatchEvenIdStrategy.batches = []
+    policy = Policy(
+        name="OR",
+        resources=["Form"],
+        roles=["viewer"],
+        actions=["read"],
+        or_strategies=[Strategy("AlwaysFail"), Strategy("OddId"), Strategy("BatchEvenId")],
+    )
+    entities = [Mock(id=i) for i in range(4)]
+
+    result = _make_auth([policy]).apply_policies_to_many(
+        user=_user(), entities=entities, resource_to_check="Form", action="read"
+    )
+
+    assert_that(result).is_equal_to(entities)
+    assert_that(BatchEvenIdStrategy.batches).is_equal_to([[entities[0], entities[2]]])
+
+
+def test_apply_to_many_groups_entities_by_resource_and_keeps_order() -> None:
+    policies = [
+        Policy(name="Forms", resources=["Form"], roles=["viewer"], actions=["read"], strategies=[Strategy("OddId")]),
+        Policy(name="Deals", resources=["Deal"], roles=["viewer"], actions=["read"]),
+    ]
+    entities = [Form(id=1), Deal(id=2), Form(id=2), Deal(id=3), Form(id=3)]
+
+    result = _make_auth(policies).apply_policies_to_many(user=_user(), entities=entities, action="read")
+
+    assert_that(result).is_equal_to([entities[0], entities[1], entities[3], entities[4]])
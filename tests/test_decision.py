@@ -0,0 +1,137 @@
+from typing import Any, Optional, TypeVar
+from unittest.mock import Mock
+
+from assertpy import assert_that
+from sqlalchemy.orm import Query, Session
+from sqlalchemy.sql.elements import ColumnElement
+
+from py_authorization import (
+    Authorization,
+    AuthorizationObserver,
+    Context,
+    Policy,
+    PolicyStrategy,
+    Strategy,
+    StrategyMapper,
+)
+from py_authorization.user import User
+from tests.models import Deal, OwnerStrategy
+
+T = TypeVar("T", bound=object)
+
+
+class PublishedStrategy(PolicyStrategy):
+    def apply_policies_to_entity(self, entity: T, context: Context) -> Optional[T]:
+        return entity if entity.status == "published" else None  # type: ignore[attr-defined]
+
+    def query_criteria(self, entity_cls: Any, context: Context) -> Optional[ColumnElement[bool]]:
+        return entity_cls.status == "published"  # type: ignore
+
+
+class LegacyDraftStrategy(PolicyStrategy):
+    def apply_policies_to_entity(self, entity: T, context: Context) -> Optional[T]:
+        return entity if entity.status == "draft" else None  # type: ignore[attr-defined]
+
+    def apply_policies_to_query(self, query: Query, context: Context) -> Query:
+        return query.filter(Deal.status == "draft")
+
+
+STRATEGY_MAPPER: StrategyMapper = {
+    "Owner": OwnerStrategy,
+    "Published": PublishedStrategy,
+    "LegacyDraft": LegacyDraftStrategy,
+}
+
+policies = [
+    Policy(name="Admin", resources=["Deal"], roles=["admin"], actions=["*"]),
+    Policy(name="Deny", resources=["Deal"], roles=["viewer"], actions=["delete"], deny=True),
+    Policy(
+        name="Read",
+        resources=["Deal"],
+        roles=["viewer"],
+        actions=["read"],
+        or_strategies=[Strategy("Owner"), Strategy("Published")],
+    ),
+    Policy(
+        name="Update",
+        resources=["Deal"],
+        roles=["viewer"],
+        actions=["update"],
+        strategies=[Strategy("Owner"), Strategy("LegacyDraft")],
+    ),
+]
+
+
+class LookupCounter(AuthorizationObserver):
+    def __init__(self) -> None:
+        self.lookups = 0
+
+    def on_policy_lookup(self, **kwargs: Any) -> None:
+        self.lookups += 1
+
+
+def _make_auth(observer: Optional[AuthorizationObserver] = None) -> Authorization:
+    return Authorization(
+        policies=policies, strategy_mapper_callable=Mock(return_value=STRATEGY_MAPPER), observer=observer
+    )
+
+
+def _ids(deals: Any) -> list[int]:
+    return sorted(deal.id for deal in deals)
+
+
+def test_definite_decisions() -> None:
+    auth = _make_auth()
+    query = Mock()
+
+    allowed = auth.compile_decision(user=User(role="admin", id=1), resource="Deal", action="delete")
+    denied = auth.compile_decision(user=User(role="viewer", id=1), resource="Deal", action="delete")
+
+    assert_that(allowed.allowed).is_true()
+    assert_that(allowed.apply_to_query(query)).is_same_as(query)
+    assert_that(denied.allowed).is_false()
+    assert_that(denied.apply_to_entity(Deal(id=1))).is_none()
+    denied.apply_to_query(query)
+    query.filter.assert_called_once_with(False)
+
+
+def test_residual_criteria_is_compiled_once_and_matches_apply_policies_to_query(session: Session) -> None:
+    observer = LookupCounter()
+    auth = _make_auth(observer)
+    user = User(role="viewer", id=1)
+    OwnerStrategy.criteria_calls = 0
+
+    decision = auth.compile_decision(user=user, resource="Deal", action="read")
+    first = decision.apply_to_query(session.query(Deal))
+    second = decision.apply_to_query(session.query(Deal).filter(Deal.id > 1))
+
+    assert_that(decision.allowed).is_none()
+    assert_that(str(decision.criteria(Deal))).is_equal_to("deals.owner_id = :owner_id_1 OR deals.status = :status_1")
+    assert_that(_ids(first)).is_equal_to(_ids(auth.apply_policies_to_query(user=user, query=session.query(Deal))))
+    assert_that(_ids(second)).is_equal_to([2, 4])
+    assert_that(OwnerStrategy.criteria_calls).is_equal_to(1 + 1)  # the decision, then apply_policies_to_query
+    assert_that(observer.lookups).is_equal_to(1 + 1)
+
+
+def test_residual_without_criteria_falls_back_to_query_strategies(session: Session) -> None:
+    auth = _make_auth()
+    user = User(role="viewer", id=1)
+
+    decision = auth.compile_decision(user=user, resource="Deal", action="update")
+
+    assert_that(decision.criteria(Deal)).is_none()
+    assert_that(_ids(decision.apply_to_query(session.query(Deal)))).is_equal_to([1])
+
+
+def test_residual_applies_to_entities(session: Session) -> None:
+    auth = _make_auth()
+    user = User(role="viewer", id=1)
+    deals = session.query(Deal).all()
+
+    decision = auth.compile_decision(user=user, resource="Deal", action="read")
+
+    assert_that(decision.apply_to_entities(deals)).is_equal_to(
+        auth.apply_policies_to_many(user=user, entities=deals, action="read")
+    )
+    assert_that(decision.apply_to_entity(deals[2])).is_none()
+    assert_that(decision.apply_to_entity(deals[0])).is_same_as(deals[0])
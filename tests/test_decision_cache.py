@@ -0,0 +1,186 @@
+from pathlib import Path
+from typing import Optional, TypeVar
+from unittest.mock import Mock
+
+from assertpy import assert_that
+from sqlalchemy import Column, Integer, create_engine
+from sqlalchemy.orm import Session, declarative_base
+
+from py_authorization import (
+    Authorization,
+    Context,
+    Policy,
+    PolicyStrategy,
+    Strategy,
+    StrategyMapper,
+)
+from py_authorization.decision_cache import (
+    DecisionCache,
+    DecisionCacheBackend,
+    DecisionKey,
+    SQLiteDecisionCache,
+)
+from py_authorization.user import User
+
+T = TypeVar("T", bound=object)
+
+
+class CountingStrategy(PolicyStrategy):
+    calls = 0
+
+    def apply_policies_to_entity(self, entity: T, context: Context) -> Optional[T]:
+        CountingStrategy.calls += 1
+        return entity
+
+
+STRATEGY_MAPPER: StrategyMapper = {"Counting": CountingStrategy}
+
+policies = [
+    Policy(name="Viewer", resources=["Form"], roles=["viewer"], actions=["read"], strategies=[Strategy("Counting")]),
+]
+
+
+Base = declarative_base()
+
+
+class Form(Base):  # type: ignore
+    __tablename__ = "forms"
+    id = Column(Integer, primary_key=True)
+
+
+def _make_auth(backend: Optional[DecisionCacheBackend] = None) -> Authorization:
+    CountingStrategy.calls = 0
+    return Authorization(
+        policies=policies,
+        strategy_mapper_callable=Mock(return_value=STRATEGY_MAPPER),
+        decision_cache_backend=backend,
+    )
+
+
+def _key(user_id: int) -> DecisionKey:
+    key = DecisionKey.build("is_allowed", User(role="viewer", id=user_id), "read", "Form", None, None)
+    assert key is not None
+    return key
+
+
+def test_is_allowed_is_memoized_inside_decision_cache() -> None:
+    auth = _make_auth()
+    user = User(role="viewer", id=1)
+
+    with auth.decision_cache():
+        for _ in range(3):
+            assert_that(auth.is_allowed(user=user, action="read", resource="Form")).is_true()
+        assert_that(auth.is_allowed(user=user, action="read", resource="Form", args={"deal": 1})).is_true()
+
+    assert_that(CountingStrategy.calls).is_equal_to(2)
+
+
+def test_is_allowed_is_not_memoized_outside_decision_cache() -> None:
+    auth = _make_auth()
+    user = User(role="viewer", id=1)
+
+    auth.is_allowed(user=user, action="read", resource="Form")
+    auth.is_allowed(user=user, action="read", resource="Form")
+
+    assert_that(CountingStrategy.calls).is_equal_to(2)
+
+
+def test_role_change_does_not_reuse_decisions() -> None:
+    auth = _make_auth()
+    user = User(role="viewer", id=1)
+
+    with auth.decision_cache():
+        assert_that(auth.is_allowed(user=user, action="read", resource="Form")).is_true()
+        user.role = "guest"
+        assert_that(auth.is_allowed(user=user, action="read", resource="Form")).is_false()
+        assert_that(auth.get_permissions_info(user=user, action="read", resource="Form").allowed).is_false()
+
+
+def test_invalidate_decisions_for_user() -> None:
+    auth = _make_auth()
+    user = User(role="viewer", id=1)
+    other = User(role="viewer", id=2)
+
+    with auth.decision_cache() as cache:
+        auth.is_allowed(user=user, action="read", resource="Form")
+        auth.is_allowed(user=other, action="read", resource="Form")
+        auth.invalidate_decisions(user)
+
+        assert_that(cache).is_length(1)
+
+
+def test_decision_cache_evicts_least_recently_used() -> None:
+    cache = DecisionCache(maxsize=2)
+    cache.set(_key(1), True)
+    cache.set(_key(2), True)
+    cache.get(_key(1))
+    cache.set(_key(3), True)
+
+    assert_that(cache.get(_key(1))).is_true()
+    assert_that(cache.get(_key(2))).is_none()
+    assert_that(cache.get(_key(3))).is_true()
+
+
+def test_decision_cache_expires_entries_after_ttl() -> None:
+    now = [100.0]
+    cache = DecisionCache(ttl=10, timer=lambda: now[0])
+    cache.set(_key(1), False)
+
+    now[0] = 109.0
+    assert_that(cache.get(_key(1))).is_false()
+    now[0] = 110.0
+    assert_that(cache.get(_key(1), "missing")).is_equal_to("missing")
+
+
+def test_sqlite_decision_cache_is_shared_between_authorizations(tmp_path: Path) -> None:
+    user = User(role="viewer", id=1)
+    worker = _make_auth(SQLiteDecisionCache(tmp_path / "decisions.db"))
+    assert_that(worker.is_allowed(user=user, action="read", resource="Form")).is_true()
+
+    other_worker = _make_auth(SQLiteDecisionCache(tmp_path / "decisions.db"))
+    assert_that(other_worker.is_allowed(user=user, action="read", resource="Form")).is_true()
+    assert_that(other_worker.get_permissions_info(user=user, action="read", resource="Form").allowed).is_false()
+    assert_that(other_worker.get_permissions_info(user=user, action="read", resource="Form").allowed).is_false()
+
+    assert_that(CountingStrategy.calls).is_equal_to(0)
+
+
+def test_replaced_policies_evict_shared_decisions(tmp_path: Path) -> None:
+    backend = SQLiteDecisionCache(tmp_path / "decisions.db")
+    auth = _make_auth(backend)
+    user = User(role="viewer", id=1)
+    auth.is_allowed(user=user, action="read", resource="Form")
+    key = DecisionKey.build("is_allowed", user, "read", "Form", None, None, auth.policy_set.fingerprint)
+    assert key is not None
+
+    auth.replace_policies([Policy(name="Deny", resources=["Form"], roles=["viewer"], actions=["read"], deny=True)])
+
+    assert_that(backend.get(key, "missing")).is_equal_to("missing")
+    assert_that(auth.is_allowed(user=user, action="read", resource="Form")).is_false()
+
+
+def test_entity_decisions_are_cached_by_identity_when_enabled() -> None:
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    session = Session(engine)
+    session.add_all([Form(id=1), Form(id=2)])
+    session.commit()
+    auth = _make_auth(DecisionCache(cache_entities=True))
+    user = User(role="viewer", id=1)
+
+    for form_id in (1, 2, 1):
+        entity = session.get(Form, form_id)
+        assert_that(auth.is_entity_allowed(user=user, action="read", entity=entity, resource="Form")).is_true()
+    assert_that(auth.is_entity_allowed(user=user, action="read", entity=Form(id=3), resource="Form")).is_true()
+
+    assert_that(CountingStrategy.calls).is_equal_to(3)
+
+
+def test_entity_decisions_are_not_cached_by_default() -> None:
+    auth = _make_auth(DecisionCache())
+    user = User(role="viewer", id=1)
+
+    auth.is_entity_allowed(user=user, action="read", entity=Form(id=1), resource="Form")
+    auth.is_entity_allowed(user=user, action="read", entity=Form(id=1), resource="Form")
+
+    assert_that(CountingStrategy.calls).is_equal_to(2)
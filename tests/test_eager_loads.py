@@ -0,0 +1,84 @@
+from typing import Any, Optional, TypeVar
+from unittest.mock import Mock
+
+from assertpy import assert_that
+from sqlalchemy.orm import Session, joinedload, selectinload
+from sqlalchemy.sql.elements import ColumnElement
+
+from py_authorization import (
+    Authorization,
+    Context,
+    Policy,
+    PolicyStrategy,
+    Strategy,
+    StrategyMapper,
+)
+from py_authorization.sql_parser import (
+    all_entities_in_statement,
+    default_load_entities,
+    eager_load_entities,
+)
+from py_authorization.user import User
+from tests.models import Comment, Deal, Reaction
+
+T = TypeVar("T", bound=object)
+
+
+class AuthorStrategy(PolicyStrategy):
+    def apply_policies_to_entity(self, entity: T, context: Context) -> Optional[T]:
+        return entity if entity.author_id == context.user.id else None  # type: ignore[attr-defined]
+
+    def query_criteria(self, entity_cls: Any, context: Context) -> Optional[ColumnElement[bool]]:
+        return entity_cls.author_id == context.user.id  # type: ignore
+
+
+STRATEGY_MAPPER: StrategyMapper = {"Author": AuthorStrategy}
+
+
+def _policies(comment_policy: Policy) -> list[Policy]:
+    return [
+        Policy(name="Deals", resources=["Deal", "Reaction"], roles=["viewer"], actions=["read"]),
+        comment_policy,
+    ]
+
+
+def _auth(comment_policy: Policy) -> Authorization:
+    return Authorization(
+        policies=_policies(comment_policy), strategy_mapper_callable=Mock(return_value=STRATEGY_MAPPER)
+    )
+
+
+def test_joinedload_and_default_joined_relationships_are_discovered() -> None:
+    session = Session()
+
+    assert_that(all_entities_in_statement(session.query(Deal))).is_equal_to({"Deal": Deal})
+    assert_that(eager_load_entities(session.query(Deal).options(joinedload(Deal.comments)))).is_equal_to(
+        {Comment, Reaction}
+    )
+    assert_that(eager_load_entities(session.query(Deal).options(selectinload(Deal.comments)))).is_empty()
+    # Comment.reactions and Reaction.comment are both joined: the closure stops at the cycle
+    assert_that(default_load_entities([Comment])).is_equal_to({Comment.__mapper__, Reaction.__mapper__})
+
+
+def test_eager_loaded_relationship_only_holds_authorized_rows(session: Session) -> None:
+    auth = _auth(
+        Policy(
+            name="Comments", resources=["Comment"], roles=["viewer"], actions=["read"], strategies=[Strategy("Author")]
+        )
+    )
+    query = session.query(Deal).options(joinedload(Deal.comments)).order_by(Deal.id)
+
+    deals = auth.apply_policies_to_query(user=User(role="viewer", id=1), query=query).all()
+
+    assert_that([deal.id for deal in deals]).is_equal_to([1, 2, 3, 4])
+    assert_that([[comment.id for comment in deal.comments] for deal in deals]).is_equal_to([[1], [], [], []])
+
+
+def test_denied_eager_loaded_relationship_loads_empty(session: Session) -> None:
+    auth = _auth(Policy(name="Comments", resources=["Comment"], roles=["admin"], actions=["read"]))
+    query = session.query(Deal).options(joinedload(Deal.comments))
+
+    deals = auth.apply_policies_to_query(user=User(role="viewer", id=1), query=query).all()
+
+    assert_that(deals).is_length(4)
+    assert_that([deal.comments for deal in deals]).is_equal_to([[], [], [], []])
@@ -0,0 +1,118 @@
+from typing import Optional, TypeVar
+from unittest.mock import Mock
+
+import pytest
+from assertpy import assert_that
+from sqlalchemy.orm import Query, Session
+
+from py_authorization import (
+    Authorization,
+    Context,
+    Policy,
+    PolicyStrategy,
+    Strategy,
+    StrategyMapper,
+)
+from py_authorization.user import User
+from tests.models import Deal, OwnerStrategy, make_session
+
+T = TypeVar("T", bound=object)
+
+
+class ActiveStrategy(PolicyStrategy):
+    def apply_policies_to_entity(self, entity: T, context: Context) -> Optional[T]:
+        return entity if entity.status == "active" else None  # type: ignore[attr-defined]
+
+    def apply_policies_to_query(self, query: Query, context: Context) -> Query:
+        return query.filter(Deal.status == "active")
+
+
+class PythonOnlyStrategy(PolicyStrategy):
+    def apply_policies_to_entity(self, entity: T, context: Context) -> Optional[T]:
+        return entity if entity.id != 2 else None  # type: ignore[attr-defined]
+
+
+STRATEGY_MAPPER: StrategyMapper = {"Owner": OwnerStrategy, "Active": ActiveStrategy, "PythonOnly": PythonOnlyStrategy}
+
+
+@pytest.fixture
+def session() -> Session:
+    return make_session(
+        Deal(id=1, owner_id=1, status="active"),
+        Deal(id=2, owner_id=1, status="draft"),
+        Deal(id=3, owner_id=2, status="active"),
+        Deal(id=4, owner_id=1, status="active"),
+    )
+
+
+def _make_auth(strategies: list[str]) -> Authorization:
+    policy = Policy(
+        name="Deals",
+        resources=["Deal"],
+        roles=["viewer"],
+        actions=["read"],
+        strategies=[Strategy(name) for name in strategies],
+    )
+    return Authorization(policies=[policy], strategy_mapper_callable=Mock(return_value=STRATEGY_MAPPER))
+
+
+def _ids(deals: list[Deal]) -> list[int]:
+    return sorted(deal.id for deal in deals)
+
+
+def test_filter_in_db_loads_only_authorized_rows(session: Session, statements: list[str]) -> None:
+    auth = _make_auth(["Owner", "Active"])
+
+    deals = auth.apply_policies_to_many(
+        user=User(role="viewer", id=1), entities=session.query(Deal), action="read", filter_in_db=True
+    )
+
+    assert_that(_ids(deals)).is_equal_to([1, 4])
+    assert_that(statements).is_length(1)
+    assert_that(statements[0]).contains("deals.owner_id = ?", "deals.status = ?")
+
+
+def test_filter_in_db_auto_detects_query_capable_strategies(session: Session, statements: list[str]) -> None:
+    deals = _make_auth(["Owner", "Active"]).apply_policies_to_many(
+        user=User(role="viewer", id=1), entities=session.query(Deal), action="read", filter_in_db=None
+    )
+
+    assert_that(_ids(deals)).is_equal_to([1, 4])
+    assert_that(statements[0]).contains("WHERE")
+
+
+def test_filter_in_db_auto_falls_back_to_python(session: Session, statements: list[str]) -> None:
+    deals = _make_auth(["Owner", "PythonOnly"]).apply_policies_to_many(
+        user=User(role="viewer", id=1), entities=session.query(Deal), action="read", filter_in_db=None
+    )
+
+    assert_that(_ids(deals)).is_equal_to([1, 4])
+    assert_that(statements[0]).does_not_contain("WHERE")
+
+
+def test_iter_filter_in_db(session: Session, statements: list[str]) -> None:
+    deals = _make_auth(["Owner"]).iter_policies_to_many(
+        user=User(role="viewer", id=1), entities=session.query(Deal), action="read", filter_in_db=True
+    )
+
+    assert_that(_ids(list(deals))).is_equal_to([1, 2, 4])
+    assert_that(statements[0]).contains("deals.owner_id = ?")
+
+
+def test_filter_in_db_auto_resolves_the_mapper_on_each_call_without_strategy_cache(
+    session: Session, statements: list[str]
+) -> None:
+    mapper: StrategyMapper = {"Swappable": PythonOnlyStrategy}
+    policy = Policy(
+        name="Deals", resources=["Deal"], roles=["viewer"], actions=["read"], strategies=[Strategy("Swappable")]
+    )
+    auth = Authorization(policies=[policy], strategy_mapper_callable=lambda: dict(mapper))
+    user = User(role="viewer", id=1)
+
+    auth.apply_policies_to_many(user=user, entities=session.query(Deal), action="read", filter_in_db=None)
+    mapper["Swappable"] = OwnerStrategy
+    statements.clear()
+    deals = auth.apply_policies_to_many(user=user, entities=session.query(Deal), action="read", filter_in_db=None)
+
+    assert_that(_ids(deals)).is_equal_to([1, 2, 4])
+    assert_that(statements[0]).contains("deals.owner_id = ?")
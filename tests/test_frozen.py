@@ -0,0 +1,81 @@
+import dataclasses
+from typing import Optional, TypeVar
+from unittest.mock import Mock
+
+import pytest
+from assertpy import assert_that
+
+from py_authorization import (
+    Authorization,
+    Context,
+    Policy,
+    PolicyStrategy,
+    Strategy,
+    StrategyMapper,
+)
+from py_authorization.frozen import (
+    FrozenPolicy,
+    FrozenStrategy,
+    FrozenUser,
+    freeze_policies,
+)
+from py_authorization.user import User
+
+T = TypeVar("T", bound=object)
+
+
+class PassStrategy(PolicyStrategy):
+    def apply_policies_to_entity(self, entity: T, context: Context) -> Optional[T]:
+        return entity if self.args["allowed"] else None
+
+
+STRATEGY_MAPPER: StrategyMapper = {"Pass": PassStrategy}
+
+policy = Policy(
+    name="Forms",
+    resources=["Form"],
+    roles=["viewer"],
+    actions=["read"],
+    strategies=[Strategy("Pass", args={"allowed": True})],
+)
+
+
+def test_frozen_policy_precomputes_sets() -> None:
+    frozen = FrozenPolicy.from_policy(policy)
+
+    assert_that(frozen.resources).is_equal_to(frozenset({"Form"}))
+    assert_that(frozen.roles).is_equal_to(frozenset({"viewer"}))
+    assert_that(frozen.strategies).is_equal_to((FrozenStrategy("Pass", args={"allowed": True}),))
+
+
+def test_frozen_policy_is_immutable_and_hashable() -> None:
+    frozen = FrozenPolicy.from_policy(policy)
+
+    assert_that(hash(frozen)).is_equal_to(hash(FrozenPolicy.from_policy(policy)))
+    assert_that({frozen: 1}).contains_key(FrozenPolicy.from_policy(policy))
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        frozen.deny = True  # type: ignore[misc]
+    with pytest.raises(TypeError):
+        frozen.strategies[0].args["allowed"] = False  # type: ignore[index]
+
+
+def test_frozen_user_is_hashable() -> None:
+    user = FrozenUser.from_user(User(role="viewer", id=1))
+
+    assert_that(hash(user)).is_equal_to(hash(FrozenUser(role="viewer", id=1)))
+    assert_that(FrozenUser.from_user(user)).is_same_as(user)
+
+
+def test_authorization_accepts_frozen_policies() -> None:
+    auth = Authorization(
+        policies=freeze_policies([policy]),
+        strategy_mapper_callable=Mock(return_value=STRATEGY_MAPPER),
+        cache_strategies=True,
+    )
+    user = FrozenUser(role="viewer", id=1)
+    entity = Mock()
+
+    result = auth.apply_policies_to_one(user=user, entity=entity, resource_to_check="FORM", action="read")
+
+    assert_that(result).is_same_as(entity)
+    assert_that(auth.is_allowed(user=user, action="update", resource="Form")).is_false()
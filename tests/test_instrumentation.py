@@ -0,0 +1,103 @@
+from typing import Any, Optional, TypeVar, cast
+from unittest.mock import Mock
+
+from assertpy import assert_that
+from sqlalchemy.orm import Query
+
+from py_authorization import (
+    Authorization,
+    AuthorizationObserver,
+    Context,
+    Policy,
+    PolicyStrategy,
+    Strategy,
+    StrategyMapper,
+)
+from py_authorization.user import User
+
+T = TypeVar("T", bound=object)
+
+
+class EvenIdStrategy(PolicyStrategy):
+    def apply_policies_to_entity(self, entity: T, context: Context) -> Optional[T]:
+        return entity if cast(Mock, entity).id % 2 == 0 else None
+
+    def apply_policies_to_query(self, query: Query, context: Context) -> Query:
+        return query
+
+
+STRATEGY_MAPPER: StrategyMapper = {"EvenId": EvenIdStrategy}
+
+
+class RecordingObserver(AuthorizationObserver):
+    def __init__(self) -> None:
+        self.events: list[tuple[str, dict[str, Any]]] = []
+
+    def on_policy_lookup(self, **kwargs: Any) -> None:
+        self.events.append(("lookup", kwargs))
+
+    def on_strategy(self, **kwargs: Any) -> None:
+        self.events.append(("strategy", kwargs))
+
+    def on_decision(self, **kwargs: Any) -> None:
+        self.events.append(("decision", kwargs))
+
+    def of(self, kind: str) -> list[dict[str, Any]]:
+        return [event for event_kind, event in self.events if event_kind == kind]
+
+
+policy = Policy(name="Forms", resources=["Form"], roles=["viewer"], actions=["read"], strategies=[Strategy("EvenId")])
+
+
+def _make_auth(observer: Optional[AuthorizationObserver]) -> Authorization:
+    return Authorization(
+        policies=[policy], strategy_mapper_callable=Mock(return_value=STRATEGY_MAPPER), observer=observer
+    )
+
+
+def _user() -> User:
+    return User(role="viewer", id=1)
+
+
+def test_observer_reports_lookup_strategy_and_decision_for_one_entity() -> None:
+    observer = RecordingObserver()
+
+    _make_auth(observer).apply_policies_to_one(user=_user(), entity=Mock(id=1), resource_to_check="Form", action="read")
+
+    assert_that([kind for kind, _ in observer.events]).is_equal_to(["lookup", "strategy", "decision"])
+    assert_that(observer.of("lookup")[0]).contains_entry({"policy": policy}, {"resource": "Form"})
+    assert_that(observer.of("strategy")[0]).contains_entry({"method": "apply_policies_to_entity"}, {"allowed": 0})
+    assert_that(observer.of("decision")[0]).contains_entry({"method": "apply_policies_to_one"}, {"allowed": 0})
+    assert_that(observer.of("decision")[0]["duration"]).is_greater_than_or_equal_to(0)
+
+
+def test_observer_reports_batch_counts_for_many_entities() -> None:
+    observer = RecordingObserver()
+
+    _make_auth(observer).apply_policies_to_many(
+        user=_user(), entities=[Mock(id=i) for i in range(4)], resource_to_check="Form", action="read"
+    )
+
+    assert_that(observer.of("strategy")[0]).contains_entry({"method": "apply_policies_to_entities"}, {"allowed": 2})
+    assert_that(observer.of("decision")[0]).contains_entry({"allowed": 2}, {"total": 4})
+
+
+def test_observer_reports_denied_query_resource() -> None:
+    observer = RecordingObserver()
+    query = Mock()
+
+    _make_auth(observer).apply_policies_to_query(
+        user=_user(), query=query, action="read", resources_to_check=["Form", "Deal"]
+    )
+
+    decisions = observer.of("decision")
+    assert_that([(d["resource"], d["allowed"]) for d in decisions]).is_equal_to([("Form", 1), ("Deal", 0)])
+
+
+def test_authorization_without_observer() -> None:
+    entity = Mock(id=2)
+    auth = _make_auth(None)
+
+    result = auth.apply_policies_to_one(user=_user(), entity=entity, resource_to_check="Form", action="read")
+
+    assert_that(result).is_same_as(entity)
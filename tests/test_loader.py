@@ -0,0 +1,145 @@
+import json
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import pytest
+from assertpy import assert_that
+
+from py_authorization import (
+    Authorization,
+    Policy,
+    PolicySet,
+    PolicyValidationError,
+    Strategy,
+    load_policies,
+)
+from py_authorization.user import User
+
+POLICIES = [
+    {"name": "Admin", "resources": ["*"], "roles": ["admin"], "actions": ["*"]},
+    {
+        "name": "Own deals",
+        "resources": ["Deal"],
+        "roles": ["viewer"],
+        "actions": ["read"],
+        "strategies": [{"name": "Owner", "args": {"field": "owner_id"}}],
+        "or_strategies": ["Shared"],
+    },
+]
+
+
+def _write(tmp_path: Path, name: str, content: str) -> Path:
+    path = tmp_path / name
+    path.write_text(content)
+    return path
+
+
+def test_load_json_and_yaml_give_the_same_policies(tmp_path: Path) -> None:
+    json_path = _write(tmp_path, "policies.json", json.dumps({"policies": POLICIES}))
+    yaml_path = _write(
+        tmp_path,
+        "policies.yaml",
+        """
+- {name: Admin, resources: ["*"], roles: [admin], actions: ["*"]}
+- name: Own deals
+  resources: [Deal]
+  roles: [viewer]
+  actions: [read]
+  strategies:
+    - {name: Owner, args: {field: owner_id}}
+  or_strategies: [Shared]
+""",
+    )
+
+    from_json = load_policies(json_path)
+    from_yaml = load_policies(yaml_path)
+
+    assert_that(from_json).is_instance_of(PolicySet)
+    assert_that(from_json.policies).is_equal_to(from_yaml.policies)
+    assert_that(from_json.policies[1]).is_equal_to(
+        Policy(
+            name="Own deals",
+            resources=["Deal"],
+            roles=["viewer"],
+            actions=["read"],
+            strategies=[Strategy("Owner", {"field": "owner_id"})],
+            or_strategies=[Strategy("Shared")],
+        )
+    )
+
+
+def test_unknown_strategy_is_rejected(tmp_path: Path) -> None:
+    path = _write(tmp_path, "policies.json", json.dumps(POLICIES))
+
+    with pytest.raises(PolicyValidationError) as error:
+        load_policies(path, strategy_mapper={"Owner": Mock()})
+
+    assert_that(error.value.errors).is_length(1)
+    assert_that(error.value.errors[0]).contains("'Shared'")
+
+
+def test_malformed_policies_are_rejected(tmp_path: Path) -> None:
+    path = _write(tmp_path, "policies.json", json.dumps([{"name": "Typo", "resource": ["Deal"]}, "nope"]))
+
+    with pytest.raises(PolicyValidationError) as error:
+        load_policies(path)
+
+    assert_that(error.value.errors).is_length(2)
+
+
+@pytest.mark.parametrize(
+    "field, value",
+    [
+        ("resources", "Deal"),
+        ("roles", "viewer"),
+        ("actions", "read"),
+        ("actions", ["read", 1]),
+        ("sub_action", ["export"]),
+        ("deny", "false"),
+        ("last_rule", 1),
+        ("strategies", "Owner"),
+        ("strategies", [{"name": "Owner", "args": ["owner_id"]}]),
+    ],
+)
+def test_mistyped_policy_fields_are_rejected(tmp_path: Path, field: str, value: object) -> None:
+    policy = {"name": "Viewers", "resources": ["Deal"], "roles": ["viewer"], "actions": ["read"], field: value}
+    path = _write(tmp_path, "policies.json", json.dumps([policy]))
+
+    with pytest.raises(PolicyValidationError) as error:
+        load_policies(path)
+
+    assert_that(error.value.errors).is_length(1)
+    assert_that(error.value.errors[0]).starts_with("policy #0:").contains(field)
+
+
+def test_cache_skips_parsing_on_the_next_load(tmp_path: Path) -> None:
+    path = _write(tmp_path, "policies.json", json.dumps(POLICIES))
+    cache_dir = tmp_path / "cache"
+
+    first = load_policies(path, cache_dir=cache_dir)
+    with patch("py_authorization.loader.parse_policies") as parse:
+        second = load_policies(path, cache_dir=cache_dir)
+
+    parse.assert_not_called()
+    assert_that(list(cache_dir.iterdir())).is_length(1)
+    assert_that(second.policies).is_equal_to(first.policies)
+
+    path.write_text(json.dumps(POLICIES[:1]))
+    assert_that(load_policies(path, cache_dir=cache_dir).policies).is_length(1)
+    assert_that(list(cache_dir.iterdir())).is_length(2)
+
+
+def test_corrupt_cache_is_ignored(tmp_path: Path) -> None:
+    path = _write(tmp_path, "policies.json", json.dumps(POLICIES))
+    cache_dir = tmp_path / "cache"
+    load_policies(path, cache_dir=cache_dir)
+    next(cache_dir.iterdir()).write_bytes(b"not a pickle")
+
+    assert_that(load_policies(path, cache_dir=cache_dir).policies).is_length(2)
+
+
+def test_authorization_accepts_loaded_policy_set(tmp_path: Path) -> None:
+    path = _write(tmp_path, "policies.json", json.dumps(POLICIES))
+    auth = Authorization(policies=load_policies(path), strategy_mapper_callable=Mock(return_value={}))
+
+    assert_that(auth.is_allowed(user=User(role="admin", id=1), action="delete", resource="Deal")).is_true()
@@ -417,3 +417,100 @@ def test_get_permissions_info_with_or_strategies() -> None:
     resp = auth.get_permissions_info(user=_user(), action=Action.READ, resource="Form")
     assert_that(resp.info).is_equal_to("Allowed but filtered.")
     assert_that(resp.allowed).is_false()
+
+
+# ═══════════════════════════════════════════════════════════════════
+#  Cost ordering and outcome hints
+# ═══════════════════════════════════════════════════════════════════
+
+
+class _RecordingStrategy(PolicyStrategy):
+    calls: list[str] = []
+
+    def apply_policies_to_entity(self, entity: T, context: Context) -> Optional[T]:
+        _RecordingStrategy.calls.append(type(self).__name__)
+        return None
+
+
+class ExpensiveStrategy(_RecordingStrategy):
+    cost = 1000
+
+
+class CheapStrategy(_RecordingStrategy):
+    cost = 1
+
+
+class HintedAllowStrategy(AlwaysPassStrategy):
+    allows_all = True
+
+    def apply_policies_to_query(self, query: Query, context: Context) -> Query:
+        raise AssertionError("allows_all branches are not evaluated")
+
+
+class HintedDenyStrategy(AlwaysFailStrategy):
+    denies_all = True
+
+    def apply_policies_to_query(self, query: Query, context: Context) -> Query:
+        raise AssertionError("denies_all branches are not evaluated")
+
+
+HINTED_MAPPER: StrategyMapper = {
+    **STRATEGY_MAPPER,
+    "Expensive": ExpensiveStrategy,
+    "Cheap": CheapStrategy,
+    "HintedAllow": HintedAllowStrategy,
+    "HintedDeny": HintedDenyStrategy,
+}
+
+
+def _hinted_auth(or_strategies: list[str]) -> Authorization:
+    policy = Policy(
+        name="Hinted OR",
+        resources=["Form"],
+        roles=[Role.BORROWER],
+        actions=[Action.READ],
+        or_strategies=[Strategy(name) for name in or_strategies],
+    )
+    return Authorization(policies=[policy], strategy_mapper_callable=Mock(return_value=HINTED_MAPPER))
+
+
+def test_or_strategies_are_evaluated_cheapest_first() -> None:
+    _RecordingStrategy.calls = []
+    auth = _hinted_auth(["Expensive", "Cheap"])
+
+    auth.apply_policies_to_one(user=_user(), entity=Mock(id=1), resource_to_check="Form", action=Action.READ)
+
+    assert_that(_RecordingStrategy.calls).is_equal_to(["CheapStrategy", "ExpensiveStrategy"])
+
+
+def test_or_strategy_allowing_all_short_circuits_entities() -> None:
+    _RecordingStrategy.calls = []
+    auth = _hinted_auth(["Cheap", "HintedAllow"])
+    entities = [Mock(id=1), Mock(id=2)]
+
+    result = auth.apply_policies_to_many(
+        user=_user(), entities=entities, resource_to_check="Form", action=Action.READ
+    )
+
+    assert_that(result).is_equal_to(entities)
+    assert_that(_RecordingStrategy.calls).is_empty()
+
+
+def test_or_strategy_allowing_all_collapses_query() -> None:
+    auth = _hinted_auth(["IdFilter", "HintedAllow"])
+    query = Mock()
+
+    result = auth.apply_policies_to_query(user=_user(), query=query, action=Action.READ, resources_to_check=["Form"])
+
+    assert_that(result).is_same_as(query)
+    query.filter.assert_not_called()
+
+
+def test_or_strategies_denying_all_are_dropped() -> None:
+    auth = _hinted_auth(["HintedDeny"])
+    query = Mock()
+
+    auth.apply_policies_to_query(user=_user(), query=query, action=Action.READ, resources_to_check=["Form"])
+
+    query.filter.assert_called_once_with(False)
+    assert_that(auth.is_allowed(user=_user(), action=Action.READ, resource="Form")).is_false()
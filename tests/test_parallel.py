@@ -0,0 +1,154 @@
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Optional, TypeVar
+from unittest.mock import Mock
+
+from assertpy import assert_that
+
+from py_authorization import (
+    Authorization,
+    Context,
+    FrozenPolicy,
+    Policy,
+    PolicyStrategy,
+    Strategy,
+    StrategyMapper,
+)
+from py_authorization.user import User
+
+T = TypeVar("T", bound=object)
+
+
+@dataclass
+class Document:
+    id: int
+    payload: dict[str, int]
+
+
+class EvenIdStrategy(PolicyStrategy):
+    threads: set[str] = set()
+
+    def apply_policies_to_entity(self, entity: T, context: Context) -> Optional[T]:
+        EvenIdStrategy.threads.add(threading.current_thread().name)
+        return entity if entity.id % 2 == 0 else None  # type: ignore[attr-defined]
+
+
+class MaxSizeStrategy(PolicyStrategy):
+    def apply_policies_to_entity(self, entity: T, context: Context) -> Optional[T]:
+        return entity if len(entity.payload) <= self.args["max_size"] else None  # type: ignore[attr-defined]
+
+
+class SerialEvenIdStrategy(EvenIdStrategy):
+    parallel_safe = False
+
+
+STRATEGY_MAPPER: StrategyMapper = {
+    "EvenId": EvenIdStrategy,
+    "MaxSize": MaxSizeStrategy,
+    "SerialEvenId": SerialEvenIdStrategy,
+}
+
+
+def _strategy_mapper() -> StrategyMapper:
+    return STRATEGY_MAPPER
+
+
+def _make_auth(strategies: list[Strategy], frozen: bool = False) -> Authorization:
+    policy = Policy(name="Documents", resources=["Document"], roles=["viewer"], actions=["read"], strategies=strategies)
+    return Authorization(
+        policies=[FrozenPolicy.from_policy(policy) if frozen else policy],
+        strategy_mapper_callable=_strategy_mapper,
+        parallel_chunk_size=10,
+    )
+
+
+def _documents() -> list[Document]:
+    return [Document(id=i, payload={str(k): k for k in range(i % 7)}) for i in range(100)]
+
+
+def _read(
+    auth: Authorization,
+    documents: list[Document],
+    executor: Optional[Executor] = None,
+    args: Optional[dict[str, Any]] = None,
+) -> list[Document]:
+    return auth.apply_policies_to_many(
+        user=User(role="viewer", id=1),
+        entities=documents,
+        resource_to_check="Document",
+        action="read",
+        args=args,
+        executor=executor,
+    )
+
+
+def test_thread_pool_preserves_order() -> None:
+    EvenIdStrategy.threads = set()
+    documents = _documents()
+    auth = _make_auth([Strategy("EvenId")])
+
+    with ThreadPoolExecutor(max_workers=4, thread_name_prefix="authz") as executor:
+        result = _read(auth, documents, executor=executor)
+
+    assert_that(result).is_equal_to(_read(auth, documents))
+    assert_that([document.id for document in result]).is_equal_to(list(range(0, 100, 2)))
+    assert_that([name for name in EvenIdStrategy.threads if name.startswith("authz")]).is_not_empty()
+
+
+def test_strategies_opting_out_run_serially() -> None:
+    SerialEvenIdStrategy.threads = set()
+    executor = Mock()
+
+    result = _read(_make_auth([Strategy("SerialEvenId")]), _documents(), executor=executor)
+
+    assert_that(result).is_length(50)
+    executor.submit.assert_not_called()
+
+
+def test_small_groups_are_not_split() -> None:
+    executor = Mock()
+
+    _read(_make_auth([Strategy("EvenId")]), _documents()[:10], executor=executor)
+
+    executor.submit.assert_not_called()
+
+
+def test_process_pool_returns_original_entities_in_order() -> None:
+    documents = _documents()
+    auth = _make_auth([Strategy("EvenId"), Strategy("MaxSize", {"max_size": 3})], frozen=True)
+
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        result = _read(auth, documents, executor=executor)
+
+    assert_that(result).is_equal_to(_read(auth, documents))
+    assert_that(result[0]).is_same_as(documents[0])
+
+
+def test_process_pool_falls_back_when_context_is_not_picklable() -> None:
+    documents = _documents()
+    auth = _make_auth([Strategy("EvenId")])
+    executor = Mock(spec=ProcessPoolExecutor)
+
+    result = _read(auth, documents, executor=executor, args={"lock": threading.Lock()})
+
+    assert_that(result).is_length(50)
+    executor.submit.assert_not_called()
+
+
+def test_parallel_strategies_are_resolved_on_each_call_without_strategy_cache() -> None:
+    EvenIdStrategy.threads = set()
+    mapper: StrategyMapper = {"Swappable": SerialEvenIdStrategy}
+    policy = Policy(
+        name="Documents", resources=["Document"], roles=["viewer"], actions=["read"], strategies=[Strategy("Swappable")]
+    )
+    auth = Authorization(policies=[policy], strategy_mapper_callable=lambda: dict(mapper), parallel_chunk_size=10)
+
+    with ThreadPoolExecutor(max_workers=4, thread_name_prefix="swapped") as executor:
+        _read(auth, _documents(), executor=executor)
+        assert_that([name for name in EvenIdStrategy.threads if name.startswith("swapped")]).is_empty()
+        mapper["Swappable"] = EvenIdStrategy
+        result = _read(auth, _documents(), executor=executor)
+
+    assert_that(result).is_length(50)
+    assert_that([name for name in EvenIdStrategy.threads if name.startswith("swapped")]).is_not_empty()
@@ -0,0 +1,107 @@
+from unittest.mock import Mock
+
+from assertpy import assert_that
+
+from py_authorization import Authorization, Policy, Strategy, freeze_policies
+from py_authorization.user import User
+
+policies = [
+    Policy(name="Admin", resources=["*"], roles=["admin"], actions=["*"]),
+    Policy(
+        name="Export forms",
+        resources=["Form"],
+        roles=["viewer"],
+        actions=["read"],
+        sub_action="export",
+        strategies=[Strategy("Owner")],
+    ),
+    Policy(name="Read forms", resources=["Form"], roles=["viewer"], actions=["read"]),
+    Policy(name="Deny deals", resources=["Deal"], roles=["viewer"], actions=["read", "update"], deny=True),
+]
+
+
+def _make_auth() -> Authorization:
+    return Authorization(policies=policies, strategy_mapper_callable=Mock(return_value={}))
+
+
+def test_matrix_covers_every_named_resource_action_and_sub_action() -> None:
+    matrix = _make_auth().get_permissions_matrix(user=User(role="viewer", id=1))
+
+    assert_that(matrix).is_length(2 * 2 * 2)
+    assert_that(matrix[("Form", "read", None)].info).is_equal_to("Allowed.")
+    assert_that(matrix[("Form", "read", "export")].info).is_equal_to("Allowed but filtered.")
+    assert_that(matrix[("Deal", "update", None)].allowed).is_false()
+
+
+def test_matrix_of_frozen_policies_keeps_the_declared_resource_names() -> None:
+    user = User(role="viewer", id=1)
+    auth = Authorization(policies=freeze_policies(policies), strategy_mapper_callable=Mock(return_value={}))
+
+    matrix = auth.get_permissions_matrix(user=user)
+
+    assert_that(matrix).is_equal_to(_make_auth().get_permissions_matrix(user=user))
+    assert_that(matrix[("Form", "read", None)].resource).is_equal_to("Form")
+    assert_that(auth.get_permissions_info(user=user, action="read", resource="Form")).is_equal_to(
+        matrix[("Form", "read", None)]
+    )
+
+
+def test_matrix_matches_get_permissions_info() -> None:
+    auth = _make_auth()
+    user = User(role="viewer", id=1)
+
+    matrix = auth.get_permissions_matrix(user=user)
+
+    for (resource, action, sub_action), response in matrix.items():
+        expected = auth.get_permissions_info(user=user, action=action, resource=resource, sub_action=sub_action)
+        assert_that(response).is_equal_to(expected)
+
+
+def test_matrix_is_cached_per_role_until_policies_change() -> None:
+    auth = _make_auth()
+    auth.get_permissions_matrix(user=User(role="viewer", id=1))
+    viewer = auth.policy_set.permissions_matrices["viewer"]
+
+    auth.get_permissions_matrix(user=User(role="viewer", id=2))
+    auth.get_permissions_matrix(user=User(role="admin", id=3))
+
+    assert_that(auth.policy_set.permissions_matrices["viewer"]).is_same_as(viewer)
+    assert_that(auth.policy_set.permissions_matrices).contains_key("admin")
+
+    auth.policies = policies[:1]
+    auth.get_permissions_matrix(user=User(role="viewer", id=1))
+
+    assert_that(auth.policy_set.permissions_matrices["viewer"]).is_not_same_as(viewer)
+
+
+def test_matrix_subsets_are_sliced_from_the_role_matrix() -> None:
+    auth = _make_auth()
+    user = User(role="viewer", id=1)
+
+    for resources in (["Form"], ["Deal"], ["Form", "Deal"], ["Vault"]):
+        subset = auth.get_permissions_matrix(user=user, resources=resources, actions=["read"])
+        for (resource, action, sub_action), response in subset.items():
+            expected = auth.get_permissions_info(user=user, action=action, resource=resource, sub_action=sub_action)
+            assert_that(response).is_equal_to(expected)
+
+    assert_that(list(auth.policy_set.permissions_matrices)).is_equal_to(["viewer"])
+
+
+def test_matrix_responses_are_copies() -> None:
+    auth = _make_auth()
+    user = User(role="viewer", id=1)
+
+    auth.get_permissions_matrix(user=user)[("Deal", "read", None)].allowed = True
+    auth.get_permissions_matrix(user=user, resources=["Deal"])[("Deal", "read", None)].allowed = True
+
+    assert_that(auth.get_permissions_matrix(user=user)[("Deal", "read", None)].allowed).is_false()
+    assert_that(auth.get_permissions_info(user=user, action="read", resource="Deal").allowed).is_false()
+
+
+def test_matrix_for_explicit_resources_and_actions() -> None:
+    matrix = _make_auth().get_permissions_matrix(
+        user=User(role="admin", id=1), resources=["Vault"], actions=["delete"], sub_actions=[None]
+    )
+
+    assert_that(list(matrix)).is_equal_to([("Vault", "delete", None)])
+    assert_that(matrix[("Vault", "delete", None)].allowed).is_true()
@@ -0,0 +1,89 @@
+import random
+from typing import Optional
+
+from assertpy import assert_that
+
+from py_authorization import Policy
+from py_authorization.policy_index import PolicyIndex
+
+
+def _linear_scan(
+    policies: list[Policy], role: str, resource: str, action: str, sub_action: Optional[str]
+) -> Optional[Policy]:
+    for policy in policies:
+        resources = [r.lower() for r in policy.resources]
+        if "*" not in policy.actions and action not in policy.actions:
+            continue
+        if policy.sub_action and sub_action != policy.sub_action:
+            continue
+        if "*" not in resources and resource.lower() not in resources:
+            continue
+        if "*" not in policy.roles and role not in policy.roles:
+            if policy.last_rule:
+                break
+            continue
+        return policy
+    return None
+
+
+def test_index_matches_resource_case_insensitively() -> None:
+    policy = Policy(name="Form", resources=["Form"], roles=["admin"], actions=["read"])
+    index = PolicyIndex([policy])
+
+    assert_that(index.find("admin", "FORM", "read", None)).is_equal_to(policy)
+    assert_that(index.find("admin", "form", "read", None)).is_equal_to(policy)
+
+
+def test_index_keeps_declaration_order_between_wildcard_and_specific_actions() -> None:
+    wildcard = Policy(name="Wildcard", resources=["*"], roles=["*"], actions=["*"])
+    specific = Policy(name="Specific", resources=["Form"], roles=["admin"], actions=["read"])
+
+    assert_that(PolicyIndex([wildcard, specific]).find("admin", "Form", "read", None)).is_equal_to(wildcard)
+    assert_that(PolicyIndex([specific, wildcard]).find("admin", "Form", "read", None)).is_equal_to(specific)
+
+
+def test_index_stops_at_last_rule_when_role_does_not_match() -> None:
+    last_rule = Policy(name="Last", resources=["Form"], roles=["admin"], actions=["read"], last_rule=True)
+    wildcard = Policy(name="Wildcard", resources=["*"], roles=["*"], actions=["*"])
+    index = PolicyIndex([last_rule, wildcard])
+
+    assert_that(index.find("viewer", "Form", "read", None)).is_none()
+    assert_that(index.find("viewer", "Deal", "read", None)).is_equal_to(wildcard)
+
+
+def test_index_matches_sub_action() -> None:
+    export = Policy(name="Export", resources=["Form"], roles=["*"], actions=["read"], sub_action="export")
+    read = Policy(name="Read", resources=["Form"], roles=["*"], actions=["read"])
+    index = PolicyIndex([export, read])
+
+    assert_that(index.find("viewer", "Form", "read", "export")).is_equal_to(export)
+    assert_that(index.find("viewer", "Form", "read", None)).is_equal_to(read)
+
+
+def test_index_is_equivalent_to_linear_scan() -> None:
+    rng = random.Random(7)
+    roles = ["admin", "editor", "viewer", "*"]
+    resources = ["Form", "Deal", "Vault", "*"]
+    actions = ["read", "create", "update", "*"]
+    sub_actions = [None, None, "export"]
+    policies = [
+        Policy(
+            name=f"Policy {i}",
+            resources=rng.sample(resources, rng.randint(1, 2)),
+            roles=rng.sample(roles, rng.randint(1, 2)),
+            actions=rng.sample(actions, rng.randint(1, 2)),
+            sub_action=rng.choice(sub_actions),
+            last_rule=rng.random() < 0.2,
+        )
+        for i in range(200)
+    ]
+    index = PolicyIndex(policies)
+
+    for _ in range(2):
+        for role in roles[:-1]:
+            for resource in ["form", "Deal", "Vault", "Other"]:
+                for action in actions[:-1]:
+                    for sub_action in set(sub_actions):
+                        expected = _linear_scan(policies, role, resource, action, sub_action)
+                        found = index.find(role, resource, action, sub_action)
+                        assert_that(found).is_same_as(expected)
@@ -0,0 +1,108 @@
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock
+
+import pytest
+from assertpy import assert_that
+
+from py_authorization import (
+    Authorization,
+    Policy,
+    PolicySet,
+    PolicyValidationError,
+    Strategy,
+    freeze_policies,
+    validate_policies,
+)
+from py_authorization.user import User
+
+read_forms = Policy(name="Read forms", resources=["Form"], roles=["viewer"], actions=["read"])
+read_deals = Policy(name="Read deals", resources=["Deal"], roles=["viewer"], actions=["read"])
+user = User(role="viewer", id=1)
+
+
+def _make_auth(policies: list[Policy]) -> Authorization:
+    return Authorization(policies=policies, strategy_mapper_callable=Mock(return_value={"Owner": Mock()}))
+
+
+def test_replace_policies_swaps_and_bumps_version() -> None:
+    auth = _make_auth([read_forms])
+
+    version = auth.replace_policies([read_deals])
+
+    assert_that(version).is_equal_to(1)
+    assert_that(auth.policy_version).is_equal_to(1)
+    assert_that(auth.is_allowed(user=user, action="read", resource="Deal")).is_true()
+    assert_that(auth.is_allowed(user=user, action="read", resource="Form")).is_false()
+
+
+def test_replace_policies_rejects_invalid_set_and_keeps_current() -> None:
+    auth = _make_auth([read_forms])
+    invalid = [
+        Policy(name="Broken", resources=[], roles=["viewer"], actions=["read"]),
+        Policy(name="Unknown", resources=["Deal"], roles=["viewer"], actions=["read"], strategies=[Strategy("Nope")]),
+    ]
+
+    with pytest.raises(PolicyValidationError) as error:
+        auth.replace_policies(invalid)
+
+    assert_that(error.value.errors).is_length(2)
+    assert_that(auth.policy_version).is_equal_to(0)
+    assert_that(auth.is_allowed(user=user, action="read", resource="Form")).is_true()
+
+
+def test_validate_policies_checks_strategy_names_only_with_a_mapper() -> None:
+    policies = [Policy(name="Owned", resources=["Deal"], roles=["*"], actions=["*"], or_strategies=[Strategy("X")])]
+
+    validate_policies(policies)
+    with pytest.raises(PolicyValidationError):
+        validate_policies(policies, {"Owner": Mock()})
+
+
+def test_replace_policies_accepts_a_policy_set() -> None:
+    auth = _make_auth([read_forms])
+    policy_set = PolicySet([read_deals], version=41)
+
+    assert_that(auth.replace_policies(policy_set)).is_equal_to(1)
+    assert_that(auth.policy_set.index).is_same_as(policy_set.index)
+
+
+def test_replace_policies_in_background() -> None:
+    auth = _make_auth([read_forms])
+
+    assert_that(auth.replace_policies_in_background([read_deals]).result(timeout=5)).is_equal_to(1)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        future = auth.replace_policies_in_background([], executor=executor)
+        assert_that(future.result(timeout=5)).is_equal_to(2)
+
+    assert_that(auth.policies).is_empty()
+
+
+def test_in_flight_check_uses_its_snapshot(monkeypatch: pytest.MonkeyPatch) -> None:
+    auth = _make_auth([read_forms])
+
+    def resource_name_swapping_policies(entity: object) -> str:
+        auth.replace_policies([], validate=False)  # lands while apply_policies_to_many is running
+        return "Form"
+
+    monkeypatch.setattr("py_authorization.authorization.resource_name_of", resource_name_swapping_policies)
+    result = auth.apply_policies_to_many(user=user, entities=[Mock(), Mock()], action="read")
+
+    assert_that(result).is_length(2)
+    assert_that(auth.policies).is_empty()
+
+
+def test_replacing_policies_invalidates_scoped_decisions() -> None:
+    auth = _make_auth([read_forms])
+
+    with auth.decision_cache():
+        assert_that(auth.is_allowed(user=user, action="read", resource="Form")).is_true()
+        auth.replace_policies([read_deals])
+        assert_that(auth.is_allowed(user=user, action="read", resource="Form")).is_false()
+
+
+def test_fingerprint_depends_on_policy_content_only() -> None:
+    reordered = Policy(name="Read forms", resources=["form"], roles=["viewer"], actions=["read"])
+
+    assert_that(PolicySet([read_forms]).fingerprint).is_equal_to(PolicySet([reordered], version=3).fingerprint)
+    assert_that(PolicySet([read_forms]).fingerprint).is_equal_to(PolicySet(freeze_policies([read_forms])).fingerprint)
+    assert_that(PolicySet([read_forms]).fingerprint).is_not_equal_to(PolicySet([read_deals]).fingerprint)
@@ -0,0 +1,69 @@
+from typing import Any
+from unittest.mock import Mock
+
+from assertpy import assert_that
+
+from py_authorization import PolicyStrategy, PolicyStrategyBuilder, Strategy
+
+
+class CountingStrategy(PolicyStrategy):
+    pass
+
+
+class StatefulStrategy(PolicyStrategy):
+    reusable = False
+
+
+def _mapper() -> Mock:
+    return Mock(return_value={"Counting": CountingStrategy, "Stateful": StatefulStrategy})
+
+
+def test_builder_without_cache_builds_new_instances() -> None:
+    mapper = _mapper()
+    builder = PolicyStrategyBuilder(strategy_mapper_callable=mapper)
+
+    first = builder.build(Strategy("Counting"))
+    second = builder.build(Strategy("Counting"))
+
+    assert_that(first).is_not_same_as(second)
+    assert_that(mapper.call_count).is_equal_to(2)
+
+
+def test_builder_with_cache_reuses_instances_per_name_and_args() -> None:
+    mapper = _mapper()
+    builder = PolicyStrategyBuilder(strategy_mapper_callable=mapper, cache=True)
+
+    first = builder.build(Strategy("Counting", args={"ids": [1, 2]}))
+    second = builder.build(Strategy("Counting", args={"ids": [1, 2]}))
+    other_args = builder.build(Strategy("Counting", args={"ids": [3]}))
+
+    assert_that(first).is_same_as(second)
+    assert_that(first).is_not_same_as(other_args)
+    assert_that(mapper.call_count).is_equal_to(1)
+
+
+def test_builder_with_cache_builds_non_reusable_strategies_every_time() -> None:
+    builder = PolicyStrategyBuilder(strategy_mapper_callable=_mapper(), cache=True)
+
+    assert_that(builder.build(Strategy("Stateful"))).is_not_same_as(builder.build(Strategy("Stateful")))
+
+
+def test_builder_with_cache_skips_unhashable_args() -> None:
+    builder = PolicyStrategyBuilder(strategy_mapper_callable=_mapper(), cache=True)
+    args: dict[str, Any] = {"filter": bytearray(b"draft")}
+
+    first = builder.build(Strategy("Counting", args=args))
+
+    assert_that(first).is_instance_of(CountingStrategy)
+    assert_that(first).is_not_same_as(builder.build(Strategy("Counting", args=args)))
+
+
+def test_builder_invalidate_resolves_mapper_again() -> None:
+    mapper = _mapper()
+    builder = PolicyStrategyBuilder(strategy_mapper_callable=mapper, cache=True)
+    first = builder.build(Strategy("Counting"))
+
+    builder.invalidate()
+
+    assert_that(builder.build(Strategy("Counting"))).is_not_same_as(first)
+    assert_that(mapper.call_count).is_equal_to(2)
@@ -0,0 +1,153 @@
+from typing import Any
+from unittest.mock import Mock
+
+import pytest
+from assertpy import assert_that
+from sqlalchemy.orm import Session
+
+from py_authorization import (
+    AttributePredicateStrategy,
+    Authorization,
+    Context,
+    Policy,
+    Strategy,
+    predicate,
+)
+from py_authorization.user import User
+from tests.models import Deal, make_session
+
+DEALS: list[dict[str, Any]] = [
+    dict(id=1, owner_id=1, status="draft", score=5),
+    dict(id=2, owner_id=2, status="published", score=None),
+    dict(id=3, owner_id=None, status="draft", score=10),
+    dict(id=4, owner_id=1, status=None, score=0),
+]
+
+CONDITIONS = [
+    {"attribute": "owner_id", "op": "eq", "context": "user.id"},
+    {"attribute": "owner_id", "op": "ne", "value": 1},
+    {"attribute": "owner_id", "op": "eq", "value": None},
+    {"attribute": "status", "op": "in", "value": ["draft", "closed"]},
+    {"attribute": "status", "op": "not_in", "context": "args.hidden"},
+    {"attribute": "status", "op": "not_in", "value": []},
+    {"attribute": "score", "op": "lt", "value": 10},
+    {"attribute": "score", "op": "ge", "value": 0},
+    {"attribute": "score", "op": "is_null", "value": True},
+    {"attribute": "score", "op": "is_null", "value": False},
+    {"attribute": "id", "op": "in", "value": [1, 3]},
+    {"attribute": "id", "op": "not_in", "value": [1, 3]},
+    {"attribute": "id", "op": "gt", "context": "user.id"},
+    {"attribute": "id", "op": "ne", "value": 2},
+]
+
+
+@pytest.fixture
+def session() -> Session:
+    return make_session(*[Deal(**deal) for deal in DEALS])
+
+
+def _context() -> Context:
+    policy = Policy(name="Read", resources=["Deal"], roles=["viewer"], actions=["read"])
+    return Context(
+        user=User(role="viewer", id=1),
+        policy=policy,
+        resource="Deal",
+        action="read",
+        args={"hidden": ["published"]},
+    )
+
+
+def _allowed_ids(results: list[Any]) -> list[int]:
+    return [result.id for result in results if result is not None]
+
+
+@pytest.fixture(params=["numpy", "python"])
+def batch_mode(request: Any, monkeypatch: pytest.MonkeyPatch) -> str:
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(predicate, "np", None)
+    return str(request.param)
+
+
+@pytest.mark.parametrize("condition", CONDITIONS, ids=lambda condition: f"{condition['attribute']}-{condition['op']}")
+def test_sql_entity_and_batch_paths_agree(session: Session, condition: dict[str, Any], batch_mode: str) -> None:
+    strategy = AttributePredicateStrategy(dict(condition))
+    context = _context()
+    deals = session.query(Deal).order_by(Deal.id).all()
+
+    in_sql = [deal.id for deal in session.query(Deal).filter(strategy.query_criteria(Deal, context)).order_by(Deal.id)]
+
+    assert_that(_allowed_ids([strategy.apply_policies_to_entity(deal, context) for deal in deals])).is_equal_to(in_sql)
+    assert_that(_allowed_ids(strategy.apply_policies_to_entities(deals, context))).is_equal_to(in_sql)
+
+
+@pytest.mark.parametrize(
+    "condition, values",
+    [
+        ({"attribute": "id", "op": "in", "value": ["1", 2]}, [1, 2, "1"]),
+        ({"attribute": "id", "op": "in", "value": [1, "x"]}, [1, 2]),
+        ({"attribute": "id", "op": "not_in", "value": [1, "x"]}, [1, 2]),
+        ({"attribute": "id", "op": "eq", "value": "1"}, [1, 2]),
+        ({"attribute": "id", "op": "eq", "value": 1}, [1, "1", True]),
+        ({"attribute": "id", "op": "lt", "value": 2.5}, [1, 2, 3]),
+    ],
+)
+def test_batch_of_mixed_types_agrees_with_entity_path(
+    condition: dict[str, Any], values: list[Any], batch_mode: str
+) -> None:
+    strategy = AttributePredicateStrategy(dict(condition))
+    context = _context()
+    entities = [Mock(id=value) for value in values]
+
+    assert_that(strategy.apply_policies_to_entities(entities, context)).is_equal_to(
+        [strategy.apply_policies_to_entity(entity, context) for entity in entities]
+    )
+
+
+def test_conditions_are_anded_through_authorization(session: Session) -> None:
+    strategy = Strategy(
+        "Predicate",
+        args={"conditions": [CONDITIONS[0], {"attribute": "status", "op": "eq", "value": "draft"}]},
+    )
+    auth = Authorization(
+        policies=[Policy(name="Read", resources=["Deal"], roles=["viewer"], actions=["read"], strategies=[strategy])],
+        strategy_mapper_callable=Mock(return_value={"Predicate": AttributePredicateStrategy}),
+    )
+    user = User(role="viewer", id=1)
+
+    many = auth.apply_policies_to_many(user=user, entities=session.query(Deal).all(), action="read")
+    query = auth.apply_policies_to_query(user=user, query=session.query(Deal), action="read")
+
+    assert_that([deal.id for deal in many]).is_equal_to([1])
+    assert_that([deal.id for deal in query]).is_equal_to([1])
+    assert_that(auth.is_allowed(user=user, action="read", resource="Deal")).is_false()
+
+
+def test_missing_context_key_fails_closed(session: Session) -> None:
+    strategy = AttributePredicateStrategy({"attribute": "owner_id", "op": "eq", "context": "args.owner"})
+    context = _context()
+    deals = session.query(Deal).all()
+
+    with pytest.raises(KeyError, match="args.owner"):
+        strategy.apply_policies_to_entity(deals[0], context)
+    with pytest.raises(KeyError, match="args.owner"):
+        strategy.apply_policies_to_entities(deals, context)
+    with pytest.raises(KeyError, match="args.owner"):
+        strategy.query_criteria(Deal, context)
+
+
+@pytest.mark.parametrize(
+    "args",
+    [
+        {},
+        {"conditions": []},
+        {"attribute": "status"},
+        {"attribute": "status", "op": "like"},
+        {"attribute": "status", "op": "eq", "values": 1},
+        {"attribute": "owner.id", "op": "eq", "value": 1},
+    ],
+)
+def test_invalid_conditions_are_rejected(args: dict[str, Any]) -> None:
+    with pytest.raises(ValueError):
+        AttributePredicateStrategy(args)
@@ -0,0 +1,151 @@
+from typing import Any, Optional
+from unittest.mock import Mock
+
+import pytest
+from assertpy import assert_that
+from sqlalchemy import Column, Integer, String
+from sqlalchemy.orm import Query, Session
+from sqlalchemy.sql.elements import ColumnElement
+
+from py_authorization import (
+    Authorization,
+    Context,
+    Policy,
+    PolicyStrategy,
+    Strategy,
+    StrategyMapper,
+)
+from py_authorization.user import User
+from tests.models import Base, Deal, OwnerStrategy, make_session
+
+
+class Membership(Base):  # type: ignore
+    __tablename__ = "memberships"
+    team_id = Column(Integer, primary_key=True)
+    user_id = Column(Integer, primary_key=True)
+    status = Column(String)
+
+
+class PublishedStrategy(PolicyStrategy):
+    def query_criteria(self, entity_cls: Any, context: Context) -> Optional[ColumnElement[bool]]:
+        return entity_cls.status == "published"  # type: ignore
+
+
+class LegacyActiveStrategy(PolicyStrategy):
+    def apply_policies_to_query(self, query: Query, context: Context) -> Query:
+        entity_cls = query.column_descriptions[0]["entity"]
+        return query.filter(entity_cls.status == "active")
+
+
+class OwnDealStrategy(PolicyStrategy):
+    """Deals and everything reached through them are restricted to the deals the user owns."""
+
+    def query_criteria(self, entity_cls: Any, context: Context) -> Optional[ColumnElement[bool]]:
+        return Deal.owner_id == context.user.id  # type: ignore
+
+
+STRATEGY_MAPPER: StrategyMapper = {
+    "Owner": OwnerStrategy,
+    "OwnDeal": OwnDealStrategy,
+    "Published": PublishedStrategy,
+    "LegacyActive": LegacyActiveStrategy,
+}
+
+
+MEMBERSHIPS = [
+    dict(team_id=1, user_id=1, status="active"),
+    dict(team_id=1, user_id=2, status="draft"),
+    dict(team_id=2, user_id=1, status="published"),
+]
+
+
+@pytest.fixture
+def session() -> Session:
+    return make_session(
+        Deal(id=1, owner_id=1, status="draft"),
+        Deal(id=2, owner_id=2, status="published"),
+        Deal(id=3, owner_id=2, status="active"),
+        Deal(id=4, owner_id=2, status="draft"),
+        *[Membership(**membership) for membership in MEMBERSHIPS],
+    )
+
+
+def _make_auth(resource: str, or_strategies: list[str]) -> Authorization:
+    policy = Policy(
+        name="OR",
+        resources=[resource],
+        roles=["viewer"],
+        actions=["read"],
+        or_strategies=[Strategy(name) for name in or_strategies],
+    )
+    return Authorization(policies=[policy], strategy_mapper_callable=Mock(return_value=STRATEGY_MAPPER))
+
+
+def test_or_criteria_are_merged_without_subqueries(session: Session) -> None:
+    auth = _make_auth("Deal", ["Owner", "Published"])
+
+    query = auth.apply_policies_to_query(user=User(role="viewer", id=1), query=session.query(Deal), action="read")
+
+    assert_that(str(query.statement)).does_not_contain(" IN (")
+    assert_that(sorted(d.id for d in query)).is_equal_to([1, 2])
+
+
+def test_or_criteria_mixed_with_legacy_query_strategy(session: Session) -> None:
+    auth = _make_auth("Deal", ["Owner", "LegacyActive"])
+
+    query = auth.apply_policies_to_query(user=User(role="viewer", id=1), query=session.query(Deal), action="read")
+
+    assert_that(sorted(d.id for d in query)).is_equal_to([1, 3])
+
+
+def test_or_legacy_query_strategies_with_composite_primary_key(session: Session) -> None:
+    auth = _make_auth("Membership", ["LegacyActive", "Published"])
+
+    query = auth.apply_policies_to_query(user=User(role="viewer", id=1), query=session.query(Membership), action="read")
+
+    assert_that(sorted((m.team_id, m.user_id) for m in query)).is_equal_to([(1, 1), (2, 1)])
+
+
+def _make_multi_resource_auth(strategies: list[str], or_strategies: list[str]) -> Authorization:
+    policy = Policy(
+        name="Deals and memberships",
+        resources=["Deal", "Membership"],
+        roles=["viewer"],
+        actions=["read"],
+        strategies=[Strategy(name) for name in strategies] or None,
+        or_strategies=[Strategy(name) for name in or_strategies] or None,
+    )
+    return Authorization(policies=[policy], strategy_mapper_callable=Mock(return_value=STRATEGY_MAPPER))
+
+
+def test_multi_resource_criteria_are_applied_per_entity_in_one_where_clause(session: Session) -> None:
+    auth = _make_multi_resource_auth(["Published"], [])
+    query = session.query(Deal, Membership).filter(Deal.owner_id == Membership.team_id)
+
+    query = auth.apply_policies_to_query(user=User(role="viewer", id=1), query=query, action="read")
+
+    statement = str(query.statement)
+    assert_that(statement).contains("deals.status =", "memberships.status =").does_not_contain("SELECT anon")
+    assert_that([(d.id, m.user_id) for d, m in query]).is_equal_to([(2, 1)])
+
+
+def test_multi_resource_shared_criteria_are_deduplicated(session: Session) -> None:
+    auth = _make_multi_resource_auth(["OwnDeal"], [])
+    query = session.query(Deal, Membership).filter(Deal.owner_id == Membership.team_id)
+
+    query = auth.apply_policies_to_query(user=User(role="viewer", id=2), query=query, action="read")
+
+    assert_that(str(query.statement).count(":owner_id_")).is_equal_to(1)
+    assert_that(sorted((d.id, m.user_id) for d, m in query)).is_equal_to([(2, 1), (3, 1), (4, 1)])
+
+
+def test_multi_resource_or_subqueries_are_not_nested(session: Session) -> None:
+    auth = _make_multi_resource_auth([], ["LegacyActive"])
+    query = session.query(Deal, Membership).filter(Deal.owner_id == Membership.team_id)
+
+    query = auth.apply_policies_to_query(user=User(role="viewer", id=1), query=query, action="read")
+
+    statement = str(query.statement)
+    assert_that(statement.count(" IN (")).is_equal_to(2)
+    assert_that(statement.count("SELECT")).is_equal_to(3)
+    assert_that(sorted((d.id, m.user_id) for d, m in query)).is_equal_to([(3, 1)])
@@ -0,0 +1,57 @@
+from unittest.mock import Mock
+
+from assertpy import assert_that
+from sqlalchemy import Column, Integer
+from sqlalchemy.orm import Session, aliased, declarative_base
+
+from py_authorization import Authorization, Policy
+from py_authorization.resource import resource_name, resource_name_of
+from py_authorization.sql_parser import all_entities_in_statement
+from py_authorization.user import User
+
+Base = declarative_base()
+
+
+class Form(Base):  # type: ignore
+    __tablename__ = "forms"
+    id = Column(Integer, primary_key=True)
+
+
+class DealRecord(Base):  # type: ignore
+    __tablename__ = "deal_records"
+    __authorization_resource__ = "Deal"
+    id = Column(Integer, primary_key=True)
+
+
+class Report:
+    __authorization_resource__ = "Report"
+
+
+def test_resource_name_defaults_to_class_name() -> None:
+    assert_that(resource_name(Form)).is_equal_to("Form")
+    assert_that(resource_name_of(Form(id=1))).is_equal_to("Form")
+
+
+def test_resource_name_uses_model_override() -> None:
+    assert_that(resource_name(DealRecord)).is_equal_to("Deal")
+    assert_that(resource_name_of(DealRecord(id=1))).is_equal_to("Deal")
+
+
+def test_resource_name_override_skips_inspection_for_unmapped_classes() -> None:
+    assert_that(resource_name_of(Report())).is_equal_to("Report")
+
+
+def test_statement_entities_resolve_aliases_and_overrides() -> None:
+    query = Session().query(aliased(Form), DealRecord)
+
+    assert_that(all_entities_in_statement(query)).is_equal_to({"Form": Form, "Deal": DealRecord})
+
+
+def test_authorization_checks_entities_against_overridden_resource() -> None:
+    policy = Policy(name="Deals", resources=["Deal"], roles=["viewer"], actions=["read"])
+    auth = Authorization(policies=[policy], strategy_mapper_callable=Mock(return_value={}))
+    user = User(role="viewer", id=1)
+    deal = DealRecord(id=1)
+
+    assert_that(auth.apply_policies_to_one(user=user, entity=deal, action="read")).is_same_as(deal)
+    assert_that(auth.apply_policies_to_one(user=user, entity=Form(id=1), action="read")).is_none()
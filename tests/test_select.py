@@ -0,0 +1,82 @@
+from unittest.mock import Mock
+
+import pytest
+from assertpy import assert_that
+from sqlalchemy import select
+from sqlalchemy.orm import Query, Session
+
+from py_authorization import (
+    Authorization,
+    Context,
+    Policy,
+    PolicyStrategy,
+    Strategy,
+    StrategyMapper,
+)
+from py_authorization.user import User
+from tests.models import Deal, OwnerStrategy
+
+
+class LegacyDraftStrategy(PolicyStrategy):
+    def apply_policies_to_query(self, query: Query, context: Context) -> Query:
+        return query.filter(Deal.status == "draft")
+
+
+STRATEGY_MAPPER: StrategyMapper = {"Owner": OwnerStrategy, "LegacyDraft": LegacyDraftStrategy}
+
+policies = [
+    Policy(name="Read", resources=["Deal"], roles=["viewer"], actions=["read"], or_strategies=[Strategy("Owner")]),
+    Policy(
+        name="Update",
+        resources=["Deal"],
+        roles=["viewer"],
+        actions=["update"],
+        strategies=[Strategy("Owner"), Strategy("LegacyDraft")],
+    ),
+    Policy(
+        name="Comment",
+        resources=["Deal"],
+        roles=["viewer"],
+        actions=["comment"],
+        or_strategies=[Strategy("Owner"), Strategy("LegacyDraft")],
+    ),
+]
+
+
+def _auth() -> Authorization:
+    return Authorization(policies=policies, strategy_mapper_callable=Mock(return_value=STRATEGY_MAPPER))
+
+
+@pytest.mark.parametrize("action", ["read", "update", "comment", "delete"])
+@pytest.mark.parametrize("use_loader_criteria", [False, True])
+def test_select_is_filtered_like_a_query(session: Session, action: str, use_loader_criteria: bool) -> None:
+    auth = _auth()
+    user = User(role="viewer", id=1)
+
+    statement = auth.apply_policies_to_query(
+        user=user, query=select(Deal), action=action, use_loader_criteria=use_loader_criteria
+    )
+    query = auth.apply_policies_to_query(user=user, query=session.query(Deal), action=action)
+
+    assert_that(statement).is_instance_of(type(select(Deal)))
+    assert_that(sorted(deal.id for deal in session.execute(statement).scalars())).is_equal_to(
+        sorted(deal.id for deal in query)
+    )
+
+
+@pytest.mark.parametrize("use_loader_criteria", [False, True])
+def test_authorized_statements_share_the_compiled_cache(use_loader_criteria: bool) -> None:
+    auth = _auth()
+
+    cache_keys = [
+        auth.apply_policies_to_query(
+            user=User(role="viewer", id=user_id),
+            query=select(Deal),
+            action="comment",
+            use_loader_criteria=use_loader_criteria,
+        )._generate_cache_key()
+        for user_id in (1, 2)
+    ]
+
+    assert cache_keys[0] is not None and cache_keys[1] is not None
+    assert_that(cache_keys[0].key).is_equal_to(cache_keys[1].key)  # only the bound user ids differ
@@ -0,0 +1,97 @@
+from typing import Any, Optional
+from unittest.mock import Mock
+
+from assertpy import assert_that
+from sqlalchemy import select
+from sqlalchemy.orm import Query, Session, joinedload
+from sqlalchemy.sql.elements import ColumnElement
+
+from py_authorization import (
+    Authorization,
+    Context,
+    Policy,
+    PolicyStrategy,
+    SessionHook,
+    Strategy,
+    StrategyMapper,
+)
+from py_authorization.user import User
+from tests.models import Deal, OwnerStrategy
+
+
+class AuthorStrategy(PolicyStrategy):
+    def query_criteria(self, entity_cls: Any, context: Context) -> Optional[ColumnElement[bool]]:
+        return entity_cls.author_id == context.user.id  # type: ignore
+
+
+class LegacyDraftStrategy(PolicyStrategy):
+    def apply_policies_to_query(self, query: Query, context: Context) -> Query:
+        return query.filter(Deal.status == "draft")
+
+
+STRATEGY_MAPPER: StrategyMapper = {"Owner": OwnerStrategy, "Author": AuthorStrategy, "LegacyDraft": LegacyDraftStrategy}
+
+policies = [
+    Policy(name="Deals", resources=["Deal"], roles=["viewer"], actions=["read"], strategies=[Strategy("Owner")]),
+    Policy(name="Drafts", resources=["Deal"], roles=["viewer"], actions=["edit"], strategies=[Strategy("LegacyDraft")]),
+    Policy(name="Comments", resources=["Comment"], roles=["viewer"], actions=["read"], strategies=[Strategy("Author")]),
+]
+
+
+def _hook(session: Session) -> SessionHook:
+    hook = SessionHook(Authorization(policies=policies, strategy_mapper_callable=Mock(return_value=STRATEGY_MAPPER)))
+    hook.install(session)
+    return hook
+
+
+def _ids(entities: Any) -> list[int]:
+    return sorted(entity.id for entity in entities)
+
+
+def test_statements_are_filtered_for_the_authorized_user_only(session: Session) -> None:
+    hook = _hook(session)
+
+    assert_that(_ids(session.execute(select(Deal)).scalars())).is_equal_to([1, 2, 3, 4])
+    with hook.authorize(User(role="viewer", id=1), action="read"):
+        assert_that(_ids(session.execute(select(Deal)).scalars())).is_equal_to([1, 4])
+        assert_that(_ids(session.query(Deal))).is_equal_to([1, 4])
+        assert_that(session.execute(select(Deal.id).where(Deal.id == 2)).all()).is_empty()
+        assert_that(_ids(session.execute(select(Deal).execution_options(skip_authorization=True)).scalars())).is_length(
+            4
+        )
+        with hook.bypass():
+            assert_that(_ids(session.query(Deal))).is_length(4)
+    with hook.authorize(User(role="guest", id=1)):
+        assert_that(session.query(Deal).all()).is_empty()
+
+
+def test_relationship_loads_are_filtered(session: Session) -> None:
+    hook = _hook(session)
+
+    with hook.authorize(User(role="viewer", id=1), action="read"):
+        lazy_loaded = session.get(Deal, 1)
+        assert lazy_loaded is not None
+        assert_that(_ids(lazy_loaded.comments)).is_equal_to([1])
+        session.expunge_all()
+        eager_loaded = session.execute(select(Deal).options(joinedload(Deal.comments))).unique().scalars().all()
+        assert_that([_ids(deal.comments) for deal in eager_loaded]).is_equal_to([[1], []])
+
+
+def test_legacy_query_strategies_filter_the_selected_entity(session: Session) -> None:
+    hook = _hook(session)
+
+    with hook.authorize(User(role="viewer", id=1), action="edit"):
+        assert_that(_ids(session.execute(select(Deal)).scalars())).is_equal_to([1, 3])
+
+
+def test_decisions_are_compiled_once_per_authorize_block(session: Session) -> None:
+    hook = _hook(session)
+    OwnerStrategy.criteria_calls = 0
+
+    with hook.authorize(User(role="viewer", id=1), action="read"):
+        for _ in range(3):
+            session.execute(select(Deal)).scalars().all()
+    with hook.authorize(User(role="viewer", id=2), action="read"):
+        assert_that(_ids(session.execute(select(Deal)).scalars())).is_equal_to([2, 3])
+
+    assert_that(OwnerStrategy.criteria_calls).is_equal_to(2)
@@ -0,0 +1,93 @@
+from typing import Iterator, Optional, TypeVar
+from unittest.mock import Mock
+
+import pytest
+from assertpy import assert_that
+from sqlalchemy import Column, Integer, create_engine
+from sqlalchemy.orm import Session, declarative_base
+
+from py_authorization import (
+    Authorization,
+    Context,
+    Policy,
+    PolicyStrategy,
+    Strategy,
+    StrategyMapper,
+)
+from py_authorization.user import User
+
+T = TypeVar("T", bound=object)
+
+Base = declarative_base()
+
+
+class Form(Base):  # type: ignore
+    __tablename__ = "forms"
+    id = Column(Integer, primary_key=True)
+
+
+class BatchEvenIdStrategy(PolicyStrategy):
+    batch_sizes: list[int] = []
+
+    def apply_policies_to_entities(self, entities: list[T], context: Context) -> list[Optional[T]]:
+        BatchEvenIdStrategy.batch_sizes.append(len(entities))
+        return [entity if entity.id % 2 == 0 else None for entity in entities]  # type: ignore[attr-defined]
+
+
+STRATEGY_MAPPER: StrategyMapper = {"BatchEvenId": BatchEvenIdStrategy}
+
+policy = Policy(
+    name="Forms", resources=["Form"], roles=["viewer"], actions=["read"], strategies=[Strategy("BatchEvenId")]
+)
+
+
+def _make_auth() -> Authorization:
+    return Authorization(policies=[policy], strategy_mapper_callable=Mock(return_value=STRATEGY_MAPPER))
+
+
+def _user() -> User:
+    return User(role="viewer", id=1)
+
+
+def test_iter_streams_query_in_chunks() -> None:
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    session = Session(engine)
+    session.add_all([Form(id=i) for i in range(1, 11)])
+    session.commit()
+    BatchEvenIdStrategy.batch_sizes = []
+
+    allowed = _make_auth().iter_policies_to_many(
+        user=_user(), entities=session.query(Form).order_by(Form.id), action="read", chunk_size=4
+    )
+
+    assert_that([form.id for form in allowed]).is_equal_to([2, 4, 6, 8, 10])
+    assert_that(BatchEvenIdStrategy.batch_sizes).is_equal_to([4, 4, 2])
+
+
+def test_iter_is_lazy() -> None:
+    consumed: list[int] = []
+
+    def forms() -> Iterator[Form]:
+        for i in range(1, 1_000_000):
+            consumed.append(i)
+            yield Form(id=i)
+
+    allowed = _make_auth().iter_policies_to_many(user=_user(), entities=forms(), action="read", chunk_size=3)
+
+    assert_that([next(allowed).id, next(allowed).id]).is_equal_to([2, 4])
+    assert_that(consumed).is_length(6)
+
+
+def test_iter_matches_apply_to_many() -> None:
+    auth = _make_auth()
+    entities = [Form(id=i) for i in range(20)]
+
+    streamed = list(auth.iter_policies_to_many(user=_user(), entities=entities, action="read", chunk_size=7))
+
+    assert_that(streamed).is_equal_to(auth.apply_policies_to_many(user=_user(), entities=entities, action="read"))
+
+
+def test_iter_rejects_non_positive_chunk_size() -> None:
+    with pytest.raises(ValueError):
+        _make_auth().iter_policies_to_many(user=_user(), entities=[], action="read", chunk_size=0)